@@ -1,42 +1,147 @@
+import argparse
 import json
+import os
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.support import expected_conditions as EC
-
-# Import RateMyProfessor API
-try:
-    import ratemyprofessor
-    RMP_AVAILABLE = True
-except ImportError:
-    print("RateMyProfessor API not available. Install with: pip install RateMyProfessorAPI")
-    RMP_AVAILABLE = False
-
-
-URL = "https://act.ucsd.edu/scheduleOfClasses/scheduleOfClassesStudentResult.htm"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pipeline"))
+from run_metrics import RunMetrics
+from driver_pool import DriverPool
+
+# Selenium and the RateMyProfessor API are imported when a scrape starts, so
+# importing this module for the data classes stays fast
+_ratemyprofessor = None
+_rmpChecked = False
+
+
+def loadRateMyProfessor():
+    # The ratemyprofessor module, or None when it is not installed (checked once)
+    global _ratemyprofessor, _rmpChecked
+    if not _rmpChecked:
+        _rmpChecked = True
+        try:
+            import ratemyprofessor
+            _ratemyprofessor = ratemyprofessor
+        except ImportError:
+            print("RateMyProfessor API not available. Install with: pip install RateMyProfessorAPI")
+    return _ratemyprofessor
+
+
+# SOC_BASE_URL points the scraper at a recorded copy of the site (pipeline/replay_server.py)
+SOC_BASE_URL = os.environ.get("SOC_BASE_URL", "https://act.ucsd.edu").rstrip("/")
+URL = SOC_BASE_URL + "/scheduleOfClasses/scheduleOfClassesStudentResult.htm"
 # URL = "https://act.ucsd.edu/scheduleOfClasses/scheduleOfClassesStudentResult.htm?selectedTerm=WI23&xsoc_term=&loggedIn=false&tabNum=&selectedSubjects=AIP+&selectedSubjects=AAS+&selectedSubjects=AWP+&selectedSubjects=ANES&selectedSubjects=ANBI&selectedSubjects=ANAR&selectedSubjects=ANTH&selectedSubjects=ANSC&selectedSubjects=AESE&selectedSubjects=AAPI&selectedSubjects=AUD+&selectedSubjects=BENG&selectedSubjects=BNFO&selectedSubjects=BIEB&selectedSubjects=BICD&selectedSubjects=BIPN&selectedSubjects=BIBC&selectedSubjects=BGGN&selectedSubjects=BGJC&selectedSubjects=BGRD&selectedSubjects=BGSE&selectedSubjects=BILD&selectedSubjects=BIMM&selectedSubjects=BISP&selectedSubjects=BIOM&selectedSubjects=CMM+&selectedSubjects=CENG&selectedSubjects=CHEM&selectedSubjects=CHIN&selectedSubjects=CLAS&selectedSubjects=CCS+&selectedSubjects=CLIN&selectedSubjects=CLRE&selectedSubjects=COGS&selectedSubjects=COMM&selectedSubjects=COGR&selectedSubjects=CSS+&selectedSubjects=CSE+&selectedSubjects=CGS+&selectedSubjects=CAT+&selectedSubjects=TDDM&selectedSubjects=TDHD&selectedSubjects=TDMV&selectedSubjects=TDPF&selectedSubjects=TDTR&selectedSubjects=DSC+&selectedSubjects=DSE+&selectedSubjects=DERM&selectedSubjects=DSGN&selectedSubjects=DOC+&selectedSubjects=DDPM&selectedSubjects=ECON&selectedSubjects=EDS+&selectedSubjects=ERC+&selectedSubjects=ECE+&selectedSubjects=EMED&selectedSubjects=ENG+&selectedSubjects=ENVR&selectedSubjects=ESYS&selectedSubjects=ETIM&selectedSubjects=ETHN&selectedSubjects=EXPR&selectedSubjects=FMPH&selectedSubjects=FPM+&selectedSubjects=FILM&selectedSubjects=GPCO&selectedSubjects=GPEC&selectedSubjects=GPGN&selectedSubjects=GPIM&selectedSubjects=GPLA&selectedSubjects=GPPA&selectedSubjects=GPPS&selectedSubjects=GLBH&selectedSubjects=GSS+&selectedSubjects=HITO&selectedSubjects=HIAF&selectedSubjects=HIEA&selectedSubjects=HIEU&selectedSubjects=HILA&selectedSubjects=HISC&selectedSubjects=HINE&selectedSubjects=HIUS&selectedSubjects=HIGR&selectedSubjects=HILD&selectedSubjects=HDS+&selectedSubjects=HMNR&selectedSubjects=HUM+&selectedSubjects=INTL&selectedSubjects=JAPN&selectedSubjects=JWSP&selectedSubjects=LATI&selectedSubjects=LHCO&selectedSubjects=LISL&selectedSubjects=LIAB&selectedSubjects=LIDS&selectedSubjects=LIFR&selectedSubjects=LIGN&selectedSubjects=LIGM&selectedSubjects=LIHL&selectedSubjects=LIIT&selectedSubjects=LIPO&selectedSubjects=LISP&selectedSubjects=LTAF&selectedSubjects=LTCH&selectedSubjects=LTCO&selectedSubjects=LTCS&selectedSubjects=LTEU&selectedSubjects=LTFR&selectedSubjects=LTGM&selectedSubjects=LTGK&selectedSubjects=LTIT&selectedSubjects=LTKO&selectedSubjects=LTLA&selectedSubjects=LTRU&selectedSubjects=LTSP&selectedSubjects=LTTH&selectedSubjects=LTWR&selectedSubjects=LTEN&selectedSubjects=LTWL&selectedSubjects=LTEA&selectedSubjects=MMW+&selectedSubjects=MBC+&selectedSubjects=MATS&selectedSubjects=MATH&selectedSubjects=MSED&selectedSubjects=MAE+&selectedSubjects=MED+&selectedSubjects=MCWP&selectedSubjects=MUS+&selectedSubjects=NANO&selectedSubjects=NEU+&selectedSubjects=NEUG&selectedSubjects=OBG+&selectedSubjects=OPTH&selectedSubjects=ORTH&selectedSubjects=PATH&selectedSubjects=PEDS&selectedSubjects=PHAR&selectedSubjects=SPPS&selectedSubjects=PHIL&selectedSubjects=PHYS&selectedSubjects=PHYA&selectedSubjects=POLI&selectedSubjects=PSY+&selectedSubjects=PSYC&selectedSubjects=RMAS&selectedSubjects=RAD+&selectedSubjects=MGTF&selectedSubjects=MGT+&selectedSubjects=MGTA&selectedSubjects=MGTP&selectedSubjects=RELI&selectedSubjects=RMED&selectedSubjects=REV+&selectedSubjects=SPPH&selectedSubjects=SOMI&selectedSubjects=SOMC&selectedSubjects=SIOC&selectedSubjects=SIOG&selectedSubjects=SIOB&selectedSubjects=SIO+&selectedSubjects=SEV+&selectedSubjects=SOCG&selectedSubjects=SOCE&selectedSubjects=SOCI&selectedSubjects=SE++&selectedSubjects=SURG&selectedSubjects=SYN+&selectedSubjects=TDAC&selectedSubjects=TDDE&selectedSubjects=TDDR&selectedSubjects=TDGE&selectedSubjects=TDGR&selectedSubjects=TDHT&selectedSubjects=TDPW&selectedSubjects=TDPR&selectedSubjects=TMC+&selectedSubjects=USP+&selectedSubjects=UROL&selectedSubjects=VIS+&selectedSubjects=WARR&selectedSubjects=WCWP&selectedSubjects=WES+&_selectedSubjects=1&schedOption1=true&_schedOption1=on&_schedOption11=on&_schedOption12=on&schedOption2=true&_schedOption2=on&_schedOption4=on&_schedOption5=on&_schedOption3=on&_schedOption7=on&_schedOption8=on&_schedOption13=on&_schedOption10=on&_schedOption9=on&schDay=M&_schDay=on&schDay=T&_schDay=on&schDay=W&_schDay=on&schDay=R&_schDay=on&schDay=F&_schDay=on&schDay=S&_schDay=on&schStartTime=12%3A00&schStartAmPm=0&schEndTime=12%3A00&schEndAmPm=0&_selectedDepartments=1&schedOption1Dept=true&_schedOption1Dept=on&_schedOption11Dept=on&_schedOption12Dept=on&schedOption2Dept=true&_schedOption2Dept=on&_schedOption4Dept=on&_schedOption5Dept=on&_schedOption3Dept=on&_schedOption7Dept=on&_schedOption8Dept=on&_schedOption13Dept=on&_schedOption10Dept=on&_schedOption9Dept=on&schDayDept=M&_schDayDept=on&schDayDept=T&_schDayDept=on&schDayDept=W&_schDayDept=on&schDayDept=R&_schDayDept=on&schDayDept=F&_schDayDept=on&schDayDept=S&_schDayDept=on&schStartTimeDept=12%3A00&schStartAmPmDept=0&schEndTimeDept=12%3A00&schEndAmPmDept=0&courses=&sections=&instructorType=begin&instructor=&titleType=contain&title=&_hideFullSec=on&_showPopup=on"
 # URL = "https://act.ucsd.edu/scheduleOfClasses/scheduleOfClassesStudentResult.htm?selectedTerm=SP23&xsoc_term=&loggedIn=false&tabNum=&selectedSubjects=CSE&schedOption1=true&_schedOption1=on&_schedOption11=on&_schedOption12=on&schedOption2=true&_schedOption2=on&_schedOption4=on&_schedOption5=on&_schedOption3=on&_schedOption7=on&_schedOption8=on&_schedOption13=on&_schedOption10=on&_schedOption9=on&schDay=M&_schDay=on&schDay=T&_schDay=on&schDay=W&_schDay=on&schDay=R&_schDay=on&schDay=F&_schDay=on&schDay=S&_schDay=on&schStartTime=12%3A00&schStartAmPm=0&schEndTime=12%3A00&schEndAmPm=0&_selectedDepartments=1&schedOption1Dept=true&_schedOption1Dept=on&_schedOption11Dept=on&_schedOption12Dept=on&schedOption2Dept=true&_schedOption2Dept=on&_schedOption4Dept=on&_schedOption5Dept=on&_schedOption3Dept=on&_schedOption7Dept=on&_schedOption8Dept=on&_schedOption13Dept=on&_schedOption10Dept=on&_schedOption9Dept=on&schDayDept=M&_schDayDept=on&schDayDept=T&_schDayDept=on&schDayDept=W&_schDayDept=on&schDayDept=R&_schDayDept=on&schDayDept=F&_schDayDept=on&schDayDept=S&_schDayDept=on&schStartTimeDept=12%3A00&schStartAmPmDept=0&schEndTimeDept=12%3A00&schEndAmPmDept=0&courses=&sections=&instructorType=begin&instructor=&titleType=contain&title=&_hideFullSec=on&_showPopup=on"
-FILE = "data/fa25.json"
-options = Options()
-options.add_argument("--headless")
-options.add_experimental_option("detach", True)
+# Each term is written to data/<term>.json (e.g. data/fa25.json) and listed in the manifest
+DATA_DIR = "data"
+MANIFEST_FILE = os.path.join(DATA_DIR, "manifest.json")
+DEFAULT_TERMS = ["FA25"]
+manifestLock = threading.Lock()
+metrics = RunMetrics("classes_scraper")
+
+CHROME_ARGS = ["--headless"]
+# Attempts per term; a failed attempt gets a fresh browser from the pool
+SCRAPE_ATTEMPTS = 2
+
+
+# Columns of a "sectxt" row used by parseSectionRow, in order: section type,
+# days, times, building, room, instructor, seats remaining, capacity
+SECTION_COLUMNS = (3, 5, 6, 7, 8, 9, 10, 11)
+WAITLIST_PATTERN = re.compile(r"Waitlist\((\d+)\)")
+
+
+def parseSectionRow(cellTexts):
+    # Builds a Section from the texts of SECTION_COLUMNS; a full section's
+    # "Waitlist(N)" is stored as "-N"
+    (sectionType, days, times, buildingName, roomNumber, professor,
+     seatsRemainingText, spaces) = cellTexts
+    waitlistMatched = WAITLIST_PATTERN.findall(seatsRemainingText)
+    seatsRemaining = (
+        "-" + waitlistMatched[0]
+        if len(waitlistMatched) > 0
+        else seatsRemainingText
+    )
+    return Section(
+        sectionType,
+        days,
+        times,
+        buildingName,
+        roomNumber,
+        professor,
+        seatsRemaining,
+        spaces,
+    )
 
 
-def open_browser():
-    # Open URL
-    driver = webdriver.Chrome(
-        options=options, service=Service(ChromeDriverManager().install())
-    )
-    driver.get(URL)
+def termFile(term):
+    return os.path.join(DATA_DIR, term.lower() + ".json")
+
+
+# Pages are written here while a term is being scraped, and renamed over the
+# term files only once every page was read
+PARTIAL_SUFFIX = ".partial"
+
+
+class UnknownTermError(ValueError):
+    # The term dropdown has no such term; retrying will not help
+    pass
+
+
+def selectTerm(driver, term):
+    from selenium.common.exceptions import NoSuchElementException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import Select
+
+    # The search form has a term dropdown; select the requested term if present
+    try:
+        termSelect = Select(driver.find_element(By.ID, "selectedTerm"))
+    except NoSuchElementException:
+        print(f"{term}: term selector not found, using the default term")
+        return
+    # An unknown term would otherwise scrape the site's default term under this name
+    try:
+        termSelect.select_by_value(term)
+    except NoSuchElementException:
+        raise UnknownTermError(f"{term}: not offered by the Schedule of Classes")
+
+
+def open_browser(term=DEFAULT_TERMS[0], pool=None):
+    # Each term runs in its own search session since paging is tied to it. The
+    # browser comes from the pool, so later terms and retries skip Chrome startup
+    ownPool = pool is None
+    if ownPool:
+        pool = DriverPool(size=1, chrome_args=CHROME_ARGS, metrics=metrics)
+    try:
+        for attempt in range(1, SCRAPE_ATTEMPTS + 1):
+            try:
+                with pool.session() as driver, metrics.stage("scrape"):
+                    return scrapeTerm(driver, term)
+            except UnknownTermError:
+                raise
+            except Exception as e:
+                if attempt == SCRAPE_ATTEMPTS:
+                    raise
+                metrics.incr("retries")
+                print(f"{term}: attempt {attempt} failed ({e}), retrying")
+    finally:
+        if ownPool:
+            pool.close()
+
+
+def scrapeTerm(driver, term):
+    from selenium.common.exceptions import NoSuchElementException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import Select, WebDriverWait
+
+    file = termFile(term)
+    partialFile = file + PARTIAL_SUFFIX
+    with metrics.stage("page_load"):
+        driver.get(URL)
+    selectTerm(driver, term)
 
     # Selects all departments in search
     select = Select(driver.find_element(By.ID, "selectedSubjects"))
@@ -45,12 +150,13 @@ def open_browser():
 
     # Clicks the search button
     submitButton = driver.find_element(By.ID, "socFacSubmit")
-    submitButton.click()
+    with metrics.stage("page_load"):
+        submitButton.click()
 
     tdElements = driver.find_elements(By.XPATH, '//td[@align="right"]')
     if len(tdElements) == 0:
         print("No classes found")
-        return
+        return None
 
     pagesText = tdElements[0].text
     [currentPage, totalPages] = \
@@ -62,11 +168,14 @@ def open_browser():
     data = Data()
     department = ""
     courseName = ""
+    scrapedPage = 0
     while int(currentPage) <= int(totalPages):
         tableElement = driver.find_element(By.XPATH, '//table[@class="tbrdr"]')
         rows = tableElement.find_element(By.TAG_NAME, "tbody").find_elements(
             By.TAG_NAME, "tr"
         )
+        metrics.incr("pages")
+        metrics.incr("rows", len(rows))
 
         for row in rows:
             # Checks if the row contains the department
@@ -99,56 +208,37 @@ def open_browser():
                 if len(usefulElements) < 12:
                     continue
 
-                sectionType = usefulElements[3].text
-                days = usefulElements[5].text
-                times = usefulElements[6].text
-                buildingName = usefulElements[7].text
-                roomNumber = usefulElements[8].text
-                professor = usefulElements[9].text
-                seatsRemainingText = usefulElements[10].text
-                spaces = usefulElements[11].text
-                waitlistMatched = re.findall(r"Waitlist\((\d+)\)",
-                                             seatsRemainingText)
-                seatsRemaining = (
-                    "-" + waitlistMatched[0]
-                    if len(waitlistMatched) > 0
-                    else seatsRemainingText
-                )
+                section = parseSectionRow(
+                    [usefulElements[i].text for i in SECTION_COLUMNS])
 
                 print(courseName)
                 data.getDepartment(department).getCourse(courseName).addSection(
-                    Section(
-                        sectionType,
-                        days,
-                        times,
-                        buildingName,
-                        roomNumber,
-                        professor,
-                        seatsRemaining,
-                        spaces,
-                    )
-                )
+                    section)
+                metrics.incr("sections")
             lastRow = row
 
         # print(data.getData())
-        uploadData(data, FILE)
+        uploadData(data, partialFile)
+        scrapedPage = currentPage
 
         # Gets next page
         # Change to ?page= for general URL, &page= for specific URL
-        driver.get(URL + "?page=" + str(int(currentPage) + 1))
+        with metrics.stage("page_load"):
+            driver.get(URL + "?page=" + str(int(currentPage) + 1))
         
         try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.XPATH, '//table[@class="tbrdr"]'))
-            )
+            with metrics.stage("wait"):
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.XPATH, '//table[@class="tbrdr"]'))
+                )
         except:
             print("timeout")
-            return
+            break
 
         tdElements = driver.find_elements(By.XPATH, '//td[@align="right"]')
         if len(tdElements) == 0:
             print("No classes found")
-            return
+            break
         
         pagesText = tdElements[0].text
         [currentPage, totalPages] = \
@@ -156,30 +246,115 @@ def open_browser():
         currentPage = int(currentPage)
         totalPages = int(totalPages)
 
-    wait = WebDriverWait(driver, 600)
-    element = wait.until(
-        expected_conditions.title_contains("Student/Class Info Temp"))
+    # A timeout or empty page before the last one leaves the published files alone
+    if scrapedPage < totalPages:
+        raise RuntimeError(f"{term}: stopped after page {scrapedPage} of {totalPages}")
+    publishTerm(partialFile, file)
+    updateManifest(term, data, file)
+    print(f"{term}: Done")
+    return data
+
+
+def scrapeTerms(terms, workers=None):
+    """
+    Scrape several terms concurrently, one browser per term
+
+    Args:
+        terms (list): Term codes such as ["FA25", "WI26"]
+        workers (int): Concurrent browsers (default: one per term)
+
+    Returns:
+        dict: {term: Data} for every term that produced results
+    """
+    results = {}
+    workers = workers or len(terms)
+    with DriverPool(size=workers, chrome_args=CHROME_ARGS, metrics=metrics) as pool, \
+            ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(open_browser, term, pool): term for term in terms}
+        for future in as_completed(futures):
+            term = futures[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                print(f"{term}: scrape failed: {e}")
+                continue
+            if data is not None:
+                results[term] = data
+    # Workers finish in any order; the first term given becomes the default
+    finished = [term for term in terms if term in results]
+    if finished:
+        setCurrentTerm(finished[0])
+    return results
+
+
+def loadManifest():
+    if not os.path.exists(MANIFEST_FILE):
+        return {"current": None, "terms": {}}
+    with open(MANIFEST_FILE, "r") as f:
+        return json.load(f)
+
+
+def updateManifest(term, data, file):
+    # Threads finish in any order, so read-modify-write under a lock
+    with manifestLock:
+        manifest = loadManifest()
+        sectionCount = sum(
+            len(course.sections)
+            for department in data.departments.values()
+            for course in department.courses.values()
+        )
+        manifest["terms"][term] = {
+            "file": os.path.basename(file),
+            "departments": len(data.departments),
+            "sections": sectionCount,
+            "scrapedAt": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        writeManifest(manifest)
+
 
-    print("Done")
+def setCurrentTerm(term):
+    # The term the backend serves by default
+    with manifestLock:
+        manifest = loadManifest()
+        manifest["current"] = term
+        writeManifest(manifest)
+
+
+def writeManifest(manifest):
+    os.makedirs(DATA_DIR, exist_ok=True)
+    with open(MANIFEST_FILE, "w") as outfile:
+        json.dump(manifest, outfile, indent=2)
+
+
+def publishTerm(partialFile, file):
+    # Move a finished scrape (and its rated variant) over the term files
+    for suffix in ("", "_with_ratings"):
+        source = partialFile.replace(".json", suffix + ".json")
+        if os.path.exists(source):
+            os.replace(source, file.replace(".json", suffix + ".json"))
 
 
 def uploadData(data, file):
     dataJSON = data.getData()
     
     # Enhance data with professor ratings if available
-    if RMP_AVAILABLE:
+    if loadRateMyProfessor():
         print("Enhancing course data with professor ratings...")
         enhanced_data = enhance_course_data_with_ratings(dataJSON)
         
         # Save enhanced data
         enhanced_file = file.replace('.json', '_with_ratings.json')
-        with open(enhanced_file, "w") as outfile:
-            json.dump(enhanced_data, outfile, indent=2)
+        with metrics.stage("write_json"):
+            with open(enhanced_file, "w") as outfile:
+                json.dump(enhanced_data, outfile, indent=2)
+        metrics.record_file_written(enhanced_file)
         print(f"Enhanced data saved to {enhanced_file}")
     
     # Save original data
-    with open(file, "w") as outfile:
-        json.dump(dataJSON, outfile)
+    with metrics.stage("write_json"):
+        with open(file, "w") as outfile:
+            json.dump(dataJSON, outfile)
+    metrics.record_file_written(file)
 
 
 class Data:
@@ -320,7 +495,8 @@ def get_professor_rating(professor_name, school_name="University of California S
     Returns:
         dict: Professor rating data or None if not found
     """
-    if not RMP_AVAILABLE:
+    ratemyprofessor = loadRateMyProfessor()
+    if not ratemyprofessor:
         return None
     
     try:
@@ -361,7 +537,7 @@ def enhance_course_data_with_ratings(course_data):
     Returns:
         dict: Enhanced course data with professor ratings
     """
-    if not RMP_AVAILABLE:
+    if not loadRateMyProfessor():
         print("RateMyProfessor API not available. Skipping rating enhancement.")
         return course_data
     
@@ -382,16 +558,19 @@ def enhance_course_data_with_ratings(course_data):
                 
                 if professor_name and professor_name != 'TBA':
                     # Check cache first
+                    metrics.cache_hit(professor_name in professor_cache)
                     if professor_name in professor_cache:
                         enhanced_section['professor_rating'] = professor_cache[professor_name]
                     else:
                         # Get rating from RateMyProfessor
-                        rating_data = get_professor_rating(professor_name)
+                        with metrics.stage("rmp_call"):
+                            rating_data = get_professor_rating(professor_name)
                         enhanced_section['professor_rating'] = rating_data
                         professor_cache[professor_name] = rating_data
                         
                         # Add small delay to be respectful to the API
-                        time.sleep(0.5)
+                        with metrics.stage("wait"):
+                            time.sleep(0.5)
                 else:
                     enhanced_section['professor_rating'] = None
                 
@@ -418,4 +597,17 @@ def save_enhanced_data(data, filename="data/fa25_with_ratings.json"):
 
 # Only run if this script is executed directly
 if __name__ == "__main__":
-    open_browser()
+    parser = argparse.ArgumentParser(description="Scrape the UCSD Schedule of Classes")
+    parser.add_argument("terms", nargs="*", default=DEFAULT_TERMS,
+                        help="Term codes to scrape, e.g. FA25 WI26")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Concurrent browsers (default: one per term)")
+    parser.add_argument("--base-url", default=None,
+                        help="Schedule of Classes host, e.g. a replay server (default: $SOC_BASE_URL)")
+    args = parser.parse_args()
+    if args.base_url:
+        URL = args.base_url.rstrip("/") + "/scheduleOfClasses/scheduleOfClassesStudentResult.htm"
+    try:
+        scrapeTerms([term.upper() for term in args.terms], args.workers)
+    finally:
+        metrics.finish()
@@ -0,0 +1,193 @@
+import crypto from "crypto";
+
+// Deterministic candidate pre-ranking and response caching for /api/ai-filter-courses.
+// The LLM only ever sees the top candidates, in a compact one-line-per-course encoding.
+
+const DEFAULT_CANDIDATE_LIMIT = 25;
+const DESCRIPTION_CHARS = 180;
+
+const STOPWORDS = new Set([
+  "a", "an", "and", "any", "are", "as", "at", "be", "class", "classes", "course",
+  "courses", "do", "for", "from", "give", "good", "i", "in", "is", "it", "me",
+  "my", "of", "on", "or", "please", "show", "some", "that", "the", "to", "want",
+  "what", "which", "with", "would", "you"
+]);
+
+// Words in the query that ask for ranking by professor quality / easiness
+const RATING_WORDS = new Set(["rating", "ratings", "rated", "professor", "professors", "prof", "profs", "best", "great", "top"]);
+const EASY_WORDS = new Set(["easy", "easier", "easiest", "light", "chill"]);
+
+// Split free text into lowercase search terms
+export function tokenize(text) {
+  if (!text) return [];
+  return String(text)
+    .toLowerCase()
+    .split(/[^a-z0-9]+/)
+    .filter(t => t && !STOPWORDS.has(t));
+}
+
+// Normalize a course/section/requirement object into the fields the prompt needs
+export function describeCourse(course, catalog = {}) {
+  // Handle both section data (dept + code) and requirement data (course/courses)
+  let courseCode = 'Unknown';
+  if (course.dept && course.code) {
+    courseCode = `${course.dept} ${course.code}`;
+  } else if (course.course) {
+    courseCode = course.course;
+  } else if (course.courses && course.courses[0]) {
+    courseCode = course.courses[0];
+  }
+
+  // Sections do not carry catalog text, so fall back to the prereq data for it
+  const catalogEntry = catalog[courseCode] || {};
+
+  const courseInfo = {
+    code: courseCode,
+    title: course.title || catalogEntry.title || 'Unknown',
+    units: course.units || catalogEntry.units || 'Unknown',
+    description: course.description || catalogEntry.description || 'No description available',
+    type: course.type || 'string',
+    courses: course.courses || [courseCode],
+    professor: course.professor || 'TBA',
+    sectionType: course.sectionType || 'Unknown'
+  };
+
+  // Add professor rating information if available
+  if (course.professor_rating) {
+    courseInfo.professor_rating = {
+      rating: course.professor_rating.rating,
+      difficulty: course.professor_rating.difficulty,
+      num_ratings: course.professor_rating.num_ratings,
+      would_take_again: course.professor_rating.would_take_again,
+      department: course.professor_rating.department
+    };
+  }
+
+  return courseInfo;
+}
+
+// Score one candidate against the query terms; higher is more relevant
+function scoreCandidate(info, terms, wantsRating, wantsEasy) {
+  const code = info.code.toLowerCase();
+  const title = info.title.toLowerCase();
+  const description = info.description.toLowerCase();
+  const professor = info.professor.toLowerCase();
+  const codeTokens = new Set(tokenize(code));
+
+  let score = 0;
+  for (const term of terms) {
+    if (codeTokens.has(term)) score += 6;
+    if (title.includes(term)) score += 4;
+    if (professor.includes(term)) score += 3;
+    if (description.includes(term)) score += 1;
+  }
+
+  const rating = info.professor_rating;
+  if (rating && typeof rating.rating === "number") {
+    // Ratings always break ties; they dominate only when the query asks for them
+    score += wantsRating ? rating.rating * 2 : rating.rating * 0.1;
+    if (wantsEasy && typeof rating.difficulty === "number") {
+      score += (5 - rating.difficulty) * 2;
+    }
+  }
+  return score;
+}
+
+// Candidates sent to the LLM; read per call so a value from .env (loaded after imports) applies
+export function candidateLimit() {
+  return Number(process.env.AI_FILTER_CANDIDATES) || DEFAULT_CANDIDATE_LIMIT;
+}
+
+// Keep the `limit` best candidates for the query, one entry per course/professor pair
+export function prefilterCourses(courseData, userQuery, limit = candidateLimit()) {
+  const rawTerms = tokenize(userQuery);
+  const wantsRating = rawTerms.some(t => RATING_WORDS.has(t));
+  const wantsEasy = rawTerms.some(t => EASY_WORDS.has(t));
+  const terms = rawTerms.filter(t => !RATING_WORDS.has(t) && !EASY_WORDS.has(t));
+
+  const seen = new Set();
+  const scored = [];
+  courseData.forEach((info, index) => {
+    const key = `${info.code}|${info.professor}`;
+    if (seen.has(key)) return;
+    seen.add(key);
+    scored.push({ info, index, score: scoreCandidate(info, terms, wantsRating, wantsEasy) });
+  });
+
+  // Stable: equal scores keep the order the client sent them in
+  scored.sort((a, b) => b.score - a.score || a.index - b.index);
+  return scored.slice(0, limit).map(s => s.info);
+}
+
+// One line per candidate instead of pretty-printed JSON:
+// code | title | units | type | professor | rating/difficulty/num_ratings/would_take_again | description
+export function encodeCandidates(candidates) {
+  return candidates.map(info => {
+    const r = info.professor_rating;
+    const rating = r ? `${r.rating ?? "-"}/${r.difficulty ?? "-"}/${r.num_ratings ?? "-"}/${r.would_take_again ?? "-"}` : "-";
+    const type = info.type === "one" && info.courses.length > 1 ? `one of ${info.courses.join(", ")}` : info.type;
+    let description = info.description.replace(/\s+/g, " ");
+    if (description.length > DESCRIPTION_CHARS) {
+      description = description.slice(0, DESCRIPTION_CHARS) + "…";
+    }
+    return [info.code, info.title, info.units, type, info.professor, rating, description].join(" | ");
+  }).join("\n");
+}
+
+// Cache key: normalized query plus the exact candidate set the model will see
+export function cacheKey({ userQuery, major, completedCourses, candidates }) {
+  const normalizedQuery = tokenize(userQuery).join(" ");
+  const completed = [...(completedCourses || [])].map(c => c.trim().toUpperCase()).sort();
+  const candidateKeys = candidates.map(c => `${c.code}|${c.professor}`).sort();
+  return crypto
+    .createHash("sha1")
+    .update(JSON.stringify([normalizedQuery, major || "", completed, candidateKeys]))
+    .digest("hex");
+}
+
+// Small LRU cache with expiry; Map iteration order doubles as recency order
+export class ResponseCache {
+  constructor(maxEntries = 500, ttlMs = 60 * 60 * 1000) {
+    this.maxEntries = maxEntries;
+    this.ttlMs = ttlMs;
+    this.entries = new Map();
+    this.hits = 0;
+    this.misses = 0;
+  }
+
+  get(key) {
+    const entry = this.entries.get(key);
+    if (!entry || entry.expires < Date.now()) {
+      if (entry) this.entries.delete(key);
+      this.misses++;
+      return undefined;
+    }
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.hits++;
+    return entry.value;
+  }
+
+  set(key, value) {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expires: Date.now() + this.ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  clear() {
+    this.entries.clear();
+  }
+
+  stats() {
+    return { size: this.entries.size, hits: this.hits, misses: this.misses };
+  }
+}
+
+// Extract the JSON object from a model response that may be wrapped in prose/markdown
+export function extractJson(text) {
+  const jsonStart = text.indexOf('{');
+  const jsonEnd = text.lastIndexOf('}') + 1;
+  return JSON.parse(text.slice(jsonStart, jsonEnd));
+}
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the Python data pipeline's hot functions
+
+Fixtures come from the checked-in fa25.json and ucsd_all_professors.json, plus
+synthetic catalogs scaled 10x / 100x by cloning departments and professors.
+Each benchmark reports throughput (items/sec, best of N runs) and peak traced
+memory, and is compared against stored baselines:
+    python bench_pipeline.py                       # run and compare
+    python bench_pipeline.py --save-baseline       # record baselines on this machine
+Without local baselines the checked-in reference_baselines.json is used, and
+only peak memory is checked since throughput depends on the machine.
+    python bench_pipeline.py --scales 1 10 100 --only integrate
+Exits non-zero when any benchmark regresses past the thresholds.
+"""
+
+import argparse
+import contextlib
+import copy
+import gc
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(BENCH_DIR, '..')
+COURSE_FILE = os.path.join(BACKEND_DIR, 'public', 'course_data', 'fa25.json')
+PROFESSORS_FILE = os.path.join(BACKEND_DIR, 'rmp_scraper', 'ucsd_all_professors.json')
+BASELINE_FILE = os.path.join(BENCH_DIR, 'baselines.json')
+REFERENCE_BASELINE_FILE = os.path.join(BENCH_DIR, 'reference_baselines.json')
+
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'rmp_scraper'))
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'Classes_Scraper'))
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'pipeline'))
+
+import integrate_cse_math_ratings as dept_ratings  # noqa: E402
+import integrate_individual_professor_ratings as individual_ratings  # noqa: E402
+import schemas  # noqa: E402
+
+try:
+    import classesScraper
+    SCRAPER_AVAILABLE = True
+except ImportError as e:
+    print(f"⚠️  classesScraper not importable ({e}); skipping scraper benchmarks")
+    SCRAPER_AVAILABLE = False
+
+DEFAULT_SCALES = [1, 10]
+DEFAULT_THROUGHPUT_THRESHOLD = 0.20  # fail if >20% slower than baseline
+DEFAULT_MEMORY_THRESHOLD = 0.25      # fail if peak memory grows >25%
+
+
+def load_json(path):
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def scale_courses(courses, scale):
+    """Clone every department `scale` times (CSE, CSE~1, CSE~2, ...)"""
+    if scale == 1:
+        return courses
+    scaled = {}
+    for i in range(scale):
+        for dept, dept_courses in courses.items():
+            scaled[dept if i == 0 else f"{dept}~{i}"] = copy.deepcopy(dept_courses)
+    return scaled
+
+
+def scale_professors(professors, scale):
+    """Clone professors with distinct ids and name suffixes so lookups grow too"""
+    if scale == 1:
+        return professors
+    scaled = []
+    for i in range(scale):
+        for prof in professors:
+            clone = dict(prof)
+            if i:
+                clone['id'] = f"{prof['id']}~{i}"
+                clone['last_name'] = f"{prof['last_name']}{i}"
+                clone['full_name'] = f"{prof['first_name']} {clone['last_name']}"
+            scaled.append(clone)
+    return scaled
+
+
+def count_sections(courses):
+    return sum(len(sections) for dept_courses in courses.values() for sections in dept_courses.values())
+
+
+def section_row_texts(courses):
+    """Reconstruct the scraped cell texts (SECTION_COLUMNS) for every section"""
+    rows = []
+    for dept_courses in courses.values():
+        for sections in dept_courses.values():
+            for s in sections:
+                seats = s['seatsRemaining']
+                if seats.startswith('-'):
+                    seats = f"FULL Waitlist({seats[1:]})"
+                rows.append([s['sectionType'], s['days'], s['times'], s['buildingName'],
+                             s['roomNumber'], s['professor'], seats, s['spaces']])
+    return rows
+
+
+def build_scraper_data(courses):
+    data = classesScraper.Data()
+    for dept, dept_courses in courses.items():
+        data.addDepartment(classesScraper.Department(dept))
+        for course_num, sections in dept_courses.items():
+            data.getDepartment(dept).addCourse(classesScraper.Course(course_num))
+            for s in sections:
+                data.getDepartment(dept).getCourse(course_num).addSection(classesScraper.Section(
+                    s['sectionType'], s['days'], s['times'], s['buildingName'],
+                    s['roomNumber'], s['professor'], s['seatsRemaining'], s['spaces']))
+    return data
+
+
+class Fixture:
+    """Inputs for one catalog scale, built once and shared by every benchmark"""
+
+    def __init__(self, scale, base_courses, base_professors):
+        self.scale = scale
+        raw_courses = scale_courses(base_courses, scale)
+        self.courses = schemas.convert(raw_courses, schemas.CourseData)
+        self.professors = schemas.convert(scale_professors(base_professors, scale), schemas.Professors)
+        self.courses_json = json.dumps(raw_courses).encode('utf-8')
+        self.num_sections = count_sections(self.courses)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.lookup = individual_ratings.create_professor_lookup(self.professors)
+            self.dept_stats = dept_ratings.calculate_department_stats(self.professors)
+        self.dept_mapping = dept_ratings.create_department_mapping()
+        self.section_professors = [
+            s.professor for dc in self.courses.values() for ss in dc.values() for s in ss]
+        self.row_texts = section_row_texts(raw_courses) if SCRAPER_AVAILABLE else []
+        self.scraper_data = build_scraper_data(raw_courses) if SCRAPER_AVAILABLE else None
+
+
+def bench_name_normalization(fx):
+    for name in fx.section_professors:
+        for variation in individual_ratings.convert_name_format(name):
+            individual_ratings.normalize_name(variation)
+    return len(fx.section_professors)
+
+
+def bench_find_professor_rating(fx):
+    for name in fx.section_professors:
+        individual_ratings.find_professor_rating(name, fx.lookup)
+    return len(fx.section_professors)
+
+
+def bench_integrate_individual_ratings(fx):
+    individual_ratings.integrate_individual_ratings(fx.courses, fx.lookup)
+    return fx.num_sections
+
+
+def bench_integrate_ratings(fx):
+    dept_ratings.integrate_ratings(fx.courses, fx.dept_stats, fx.dept_mapping)
+    return fx.num_sections
+
+
+def bench_calculate_department_stats(fx):
+    dept_ratings.calculate_department_stats(fx.professors)
+    return len(fx.professors)
+
+
+def bench_decode_course_data(fx):
+    schemas.loads(fx.courses_json, schemas.CourseData)
+    return fx.num_sections
+
+
+def bench_encode_course_data(fx):
+    schemas.dumps(fx.courses, indent=2)
+    return fx.num_sections
+
+
+def bench_get_data_serialization(fx):
+    json.dumps(fx.scraper_data.getData())
+    return fx.num_sections
+
+
+def bench_parse_section_rows(fx):
+    for texts in fx.row_texts:
+        classesScraper.parseSectionRow(texts)
+    return len(fx.row_texts)
+
+
+BENCHMARKS = {
+    'normalize_name': (bench_name_normalization, False),
+    'find_professor_rating': (bench_find_professor_rating, False),
+    'integrate_individual_ratings': (bench_integrate_individual_ratings, False),
+    'integrate_ratings': (bench_integrate_ratings, False),
+    'calculate_department_stats': (bench_calculate_department_stats, False),
+    'decode_course_data': (bench_decode_course_data, False),
+    'encode_course_data': (bench_encode_course_data, False),
+    'getData_serialization': (bench_get_data_serialization, True),
+    'parse_section_rows': (bench_parse_section_rows, True),
+}
+
+
+def run_benchmark(fn, fixture, repeat):
+    """
+    Time `fn` and measure its peak allocation
+
+    Returns:
+        dict: items, best_seconds, throughput (items/sec), peak_kb
+    """
+    best = float('inf')
+    items = 0
+    for _ in range(repeat):
+        gc.collect()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            items = fn(fixture)
+            elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+
+    # Separate traced run: tracemalloc slows execution, so it never affects timings
+    gc.collect()
+    tracemalloc.start()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn(fixture)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'items': items,
+        'best_seconds': round(best, 6),
+        'throughput': round(items / best, 1) if best > 0 else None,
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def compare(result, baseline, throughput_threshold, memory_threshold):
+    """
+    List of regression messages for one benchmark (empty when within thresholds)
+
+    A throughput_threshold of None skips the throughput check.
+    """
+    problems = []
+    if throughput_threshold is not None and baseline.get('throughput') and result['throughput'] is not None:
+        floor = baseline['throughput'] * (1 - throughput_threshold)
+        if result['throughput'] < floor:
+            change = result['throughput'] / baseline['throughput'] - 1
+            problems.append(f"throughput {change:+.0%} ({result['throughput']:.0f} vs {baseline['throughput']:.0f}/s)")
+    if baseline.get('peak_kb'):
+        ceiling = baseline['peak_kb'] * (1 + memory_threshold)
+        if result['peak_kb'] > ceiling:
+            change = result['peak_kb'] / baseline['peak_kb'] - 1
+            problems.append(f"peak memory {change:+.0%} ({result['peak_kb']:.0f} vs {baseline['peak_kb']:.0f} KB)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the Python data pipeline')
+    parser.add_argument('--scales', type=int, nargs='+', default=DEFAULT_SCALES)
+    parser.add_argument('--only', default=None, help='Run benchmarks whose name contains this text')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--baseline-file', default=BASELINE_FILE)
+    parser.add_argument('--throughput-threshold', type=float, default=DEFAULT_THROUGHPUT_THRESHOLD)
+    parser.add_argument('--memory-threshold', type=float, default=DEFAULT_MEMORY_THRESHOLD)
+    parser.add_argument('--output', default=None, help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    base_courses = load_json(COURSE_FILE)
+    base_professors = load_json(PROFESSORS_FILE)
+    baselines = load_json(args.baseline_file) if os.path.exists(args.baseline_file) else {}
+    # Fall back to the shared reference, whose throughput is from another machine
+    use_reference = not baselines and not args.save_baseline and os.path.exists(REFERENCE_BASELINE_FILE)
+    if use_reference:
+        baselines = load_json(REFERENCE_BASELINE_FILE)
+        print(f"ℹ️  No local baselines; checking peak memory against {os.path.basename(REFERENCE_BASELINE_FILE)} "
+              f"(Python {baselines.get('python')}, {baselines.get('json_backend')})")
+    baseline_results = baselines.get('results', {})
+    throughput_threshold = None if use_reference else args.throughput_threshold
+
+    results = {}
+    regressions = []
+    for scale in args.scales:
+        fixture = Fixture(scale, base_courses, base_professors)
+        print(f"\n📦 Scale {scale}x: {fixture.num_sections} sections, {len(fixture.professors)} professors")
+        for name, (fn, needs_scraper) in BENCHMARKS.items():
+            if args.only and args.only not in name:
+                continue
+            if needs_scraper and not SCRAPER_AVAILABLE:
+                continue
+            key = f"{name}[{scale}x]"
+            result = run_benchmark(fn, fixture, args.repeat)
+            results[key] = result
+
+            status = ''
+            if key in baseline_results and not args.save_baseline:
+                problems = compare(result, baseline_results[key], throughput_threshold, args.memory_threshold)
+                if problems:
+                    regressions.append((key, problems))
+                    status = '  ❌ ' + '; '.join(problems)
+                else:
+                    status = '  ✅'
+            print(f"   {key:<40} {result['throughput']:>12,.0f} items/s  {result['peak_kb']:>10,.0f} KB peak{status}")
+        del fixture
+
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        # Peak memory differs a lot between the msgspec and fallback decoders
+        'json_backend': 'msgspec' if schemas.MSGSPEC_AVAILABLE else 'orjson' if schemas.ORJSON_AVAILABLE else 'json',
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        baseline_results.update(results)
+        report['results'] = baseline_results
+        with open(args.baseline_file, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Baselines saved to {args.baseline_file}")
+        return 0
+
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmark(s) regressed past thresholds")
+        return 1
+    if baseline_results:
+        print("\n✅ No regressions")
+    else:
+        print("\nℹ️  No baselines yet; run with --save-baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,644 @@
+#!/usr/bin/env python3
+"""
+End-to-end HTTP load test for the backend API
+
+Starts the backend locally with the stub LLM (LLM_PROVIDER=stub), builds student
+profiles from public/majorreq and public/collegedata with sampled completed
+lists, and replays a weighted mix of /api/courses, /api/prereqs/:course,
+/api/suggest and /api/ai-filter-courses from closed-loop asyncio clients:
+    python load_api.py                                   # 8 clients for 30s
+    python load_api.py --concurrency 8 32 128 --seconds 20
+    python load_api.py --cluster --stub-latency-ms 400   # cluster.js, slow "model"
+    python load_api.py --url http://localhost:3001 --pid 4242
+    python load_api.py --compare results/api-1dfb51a-20261019-101500.json
+Reports throughput and a latency histogram per route, plus server memory and
+throughput over time. Each run is saved under benchmarks/results/, named by
+commit, so runs from different commits can be compared.
+
+Needs aiohttp or httpx (pip install aiohttp). Server memory is read with psutil
+when installed, otherwise from /proc.
+"""
+
+import argparse
+import asyncio
+import bisect
+import glob
+import itertools
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(BENCH_DIR, '..')
+PUBLIC_DIR = os.path.join(BACKEND_DIR, 'public')
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'pipeline'))
+
+import schemas  # noqa: E402
+
+# route name -> (method, route label for reports)
+ROUTES = {
+    'courses': ('GET', '/api/courses'),
+    'prereqs': ('GET', '/api/prereqs/:course'),
+    'suggest': ('POST', '/api/suggest'),
+    'ai-filter': ('POST', '/api/ai-filter-courses'),
+}
+DEFAULT_MIX = 'suggest=4,prereqs=4,courses=1,ai-filter=1'
+# ai-filter answers the server took from its response cache (X-Cache: hit) are
+# reported as their own route, so the model-backed numbers are not diluted
+CACHED_ROUTE = 'ai-filter-cached'
+ROUTE_LABELS = {name: label for name, (_, label) in ROUTES.items()}
+ROUTE_LABELS[CACHED_ROUTE] = '/api/ai-filter-courses (hit)'
+# Replaced per request so each ai-filter query misses the server's response cache
+UNIQUE_PLACEHOLDER = 'req000000000'
+# Histogram bucket upper bounds in ms; the last bucket is everything slower
+BUCKET_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+READY_TIMEOUT = 120
+
+# What students type into the AI course filter
+USER_QUERIES = [
+    "machine learning courses with good professors",
+    "easy upper division electives",
+    "systems and networking",
+    "courses about computer security",
+    "data science and statistics",
+    "highly rated professors only",
+    "graphics, vision or games",
+    "theory and algorithms",
+    "lots of programming projects",
+    "something light to balance a hard quarter",
+]
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+def tree_leaves(node):
+    """Every course code in a requirement tree"""
+    if isinstance(node, str):
+        return [node]
+    children = node if isinstance(node, list) else node.courses
+    return [code for child in children for code in tree_leaves(child)]
+
+
+def tree_courses(node, rng):
+    """Courses a student would take to satisfy one requirement tree"""
+    if isinstance(node, str):
+        return [node]
+    if isinstance(node, list):
+        return [rng.choice(node)] if node else []
+    if node.type == 'all':
+        return [code for child in node.courses for code in tree_courses(child, rng)]
+    picks = rng.sample(node.courses, min(node.count or (2 if node.type == 'two' else 1), len(node.courses)))
+    return [code for child in picks for code in tree_courses(child, rng)]
+
+
+def sample_completed(major, college, rng):
+    """
+    A plausible completed list: a prefix of the lower division, less of the upper
+    division (progress squared) and some college requirements
+    """
+    progress = rng.random()
+    blocks = major.requirements
+    lower = blocks['lower_division'].courses if 'lower_division' in blocks else []
+    upper = blocks['upper_division'].courses if 'upper_division' in blocks else []
+    college_reqs = college.requirements.courses if college.requirements else []
+
+    taken = lower[:round(progress * len(lower))] + upper[:round(progress ** 2 * len(upper))]
+    taken += [item for item in college_reqs if rng.random() < progress]
+    return list(dict.fromkeys(code for item in taken for code in tree_courses(item, rng)))
+
+
+def build_profiles(count, seed=0):
+    """Random (major, college, completed, honors) suggest bodies from the requirement files"""
+    majors = {os.path.splitext(os.path.basename(path))[0].upper(): schemas.load(path, schemas.MajorRequirements)
+              for path in sorted(glob.glob(os.path.join(PUBLIC_DIR, 'majorreq', '*.json')))}
+    colleges = [schemas.load(path, schemas.CollegeRequirements)
+                for path in sorted(glob.glob(os.path.join(PUBLIC_DIR, 'collegedata', '*.json')))]
+    # Honors variants are chosen through honorsSequence, as in the frontend dropdown
+    choices = [code for code in majors if not code.endswith('H')]
+    if not choices or not colleges:
+        raise SystemExit("❌ No major or college requirement files under public/")
+
+    rng = random.Random(seed)
+    profiles = []
+    for _ in range(count):
+        code = rng.choice(choices)
+        honors = f"{code}H" in majors and rng.random() < 0.1
+        college = rng.choice(colleges)
+        profiles.append({
+            'major': code,
+            'college': college.college,
+            'completed': sample_completed(majors[f"{code}H" if honors else code], college, rng),
+            'honorsSequence': honors,
+        })
+    return profiles
+
+
+def prereq_paths(profiles):
+    """/api/prereqs paths for requirement courses that have prereq data (others 404)"""
+    codes = set()
+    for profile in profiles:
+        codes.update(profile['completed'])
+    for path in glob.glob(os.path.join(PUBLIC_DIR, 'majorreq', '*.json')):
+        major = schemas.load(path, schemas.MajorRequirements)
+        for block in major.requirements.values():
+            codes.update(code for item in block.courses for code in tree_leaves(item))
+    existing = [code for code in sorted(codes)
+                if os.path.exists(os.path.join(PUBLIC_DIR, 'prereqdata', f"{code.replace(' ', '_')}.json"))]
+    return [f"/api/prereqs/{code.replace(' ', '_')}" for code in existing]
+
+
+def ai_filter_body(profile, suggestion, rng):
+    """ai-filter request shaped like Scheduler.jsx: one section per suggested course, lectures first"""
+    by_course = {}
+    for section in suggestion.get('sections', []):
+        key = f"{section.get('dept')} {section.get('code')}"
+        if key not in by_course or (section.get('sectionType') == 'LE' and by_course[key]['sectionType'] != 'LE'):
+            by_course[key] = {
+                'dept': section.get('dept'),
+                'code': section.get('code'),
+                'professor': section.get('professor'),
+                'professor_rating': section.get('professor_rating'),
+                'sectionType': section.get('sectionType') or 'LE',
+            }
+    return {
+        'userQuery': f"{rng.choice(USER_QUERIES)} {UNIQUE_PLACEHOLDER}",
+        'courses': list(by_course.values()),
+        'completedCourses': profile['completed'],
+        'major': profile['major'],
+    }
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in ROUTES:
+            raise SystemExit(f"❌ Unknown route {name!r} in --mix; choose from {', '.join(ROUTES)}")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+# ---------------------------------------------------------------------------
+# HTTP clients
+# ---------------------------------------------------------------------------
+
+class AiohttpClient:
+    name = 'aiohttp'
+
+    def __init__(self, base_url, connections, timeout):
+        self.base_url = base_url
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=connections),
+            timeout=aiohttp.ClientTimeout(total=timeout))
+
+    async def request(self, method, path, body=None):
+        headers = {'Content-Type': 'application/json'} if body is not None else None
+        async with self.session.request(method, self.base_url + path, data=body, headers=headers) as response:
+            data = await response.read()
+            return response.status, data, response.headers.get('X-Cache')
+
+    async def close(self):
+        await self.session.close()
+
+
+class HttpxClient:
+    name = 'httpx'
+
+    def __init__(self, base_url, connections, timeout):
+        self.client = httpx.AsyncClient(
+            base_url=base_url, timeout=timeout,
+            limits=httpx.Limits(max_connections=connections, max_keepalive_connections=connections))
+
+    async def request(self, method, path, body=None):
+        headers = {'Content-Type': 'application/json'} if body is not None else None
+        response = await self.client.request(method, path, content=body, headers=headers)
+        return response.status_code, response.content, response.headers.get('X-Cache')
+
+    async def close(self):
+        await self.client.aclose()
+
+
+def make_client(base_url, connections, timeout, prefer=None):
+    if prefer != 'httpx' and AIOHTTP_AVAILABLE:
+        return AiohttpClient(base_url, connections, timeout)
+    if HTTPX_AVAILABLE:
+        return HttpxClient(base_url, connections, timeout)
+    if AIOHTTP_AVAILABLE:
+        return AiohttpClient(base_url, connections, timeout)
+    raise SystemExit("❌ load_api.py needs aiohttp or httpx: pip install aiohttp")
+
+
+# ---------------------------------------------------------------------------
+# Server process and memory
+# ---------------------------------------------------------------------------
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port, cluster=False, workers=None, stub_latency_ms=0, log_path=None):
+    """Start server.js (or cluster.js) with the stub LLM and file watching off"""
+    env = dict(os.environ, PORT=str(port), LLM_PROVIDER='stub', CATALOG_WATCH='0',
+               LLM_STUB_LATENCY_MS=str(stub_latency_ms))
+    if workers:
+        env['CLUSTER_WORKERS'] = str(workers)
+    log = open(log_path, 'w') if log_path else subprocess.DEVNULL
+    proc = subprocess.Popen(['node', 'cluster.js' if cluster else 'server.js'],
+                            cwd=BACKEND_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+    proc.log_file = log if log_path else None
+    return proc
+
+
+def stop_server(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    if proc.log_file:
+        proc.log_file.close()
+
+
+def _proc_children(pid):
+    children = []
+    for task in glob.glob(f"/proc/{pid}/task/*/children"):
+        try:
+            with open(task) as f:
+                children.extend(int(child) for child in f.read().split())
+        except OSError:
+            pass
+    return children
+
+
+def _proc_rss_kb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss_mb(pid):
+    """Resident memory of a process and its children (cluster workers), or None if unreadable"""
+    if PSUTIL_AVAILABLE:
+        try:
+            root = psutil.Process(pid)
+            procs = [root] + root.children(recursive=True)
+            return round(sum(p.memory_info().rss for p in procs) / 1024 / 1024, 1)
+        except psutil.Error:
+            return None
+    if not os.path.exists(f"/proc/{pid}"):
+        return None
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        total += _proc_rss_kb(current)
+        pending.extend(_proc_children(current))
+    return round(total / 1024, 1)
+
+
+async def wait_ready(http, proc=None, timeout=READY_TIMEOUT):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if proc and proc.poll() is not None:
+            raise SystemExit(f"❌ Backend exited with code {proc.returncode} before it was ready")
+        try:
+            status, _, _ = await http.request('GET', '/api/catalog')
+            if status == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.25)
+    raise SystemExit(f"❌ Backend not ready after {timeout}s")
+
+
+# ---------------------------------------------------------------------------
+# Load
+# ---------------------------------------------------------------------------
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    return round(sorted_values[min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))], 2)
+
+
+def histogram(latencies):
+    counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+    for latency in latencies:
+        counts[bisect.bisect_left(BUCKET_BOUNDS_MS, latency)] += 1
+    return counts
+
+
+def bucket_label(i):
+    if i == len(BUCKET_BOUNDS_MS):
+        return f">{BUCKET_BOUNDS_MS[-1]}"
+    return f"≤{BUCKET_BOUNDS_MS[i]}"
+
+
+async def run_stage(http, pools, mix, concurrency, seconds, server_pid, sample_interval, seed,
+                    ai_filter_repeat=0.0, unique_ids=None):
+    """
+    Closed-loop clients for one stage
+
+    Each ai-filter request gets a query never sent before, except for the
+    `ai_filter_repeat` share that resends a pool body as is and may be answered
+    from the server's response cache.
+
+    Returns:
+        dict: per-route stats, totals and a per-second timeline with server memory
+    """
+    names = [name for name in mix if pools.get(name)]
+    weights = [mix[name] for name in names]
+    samples = []     # (completed at, route, latency ms, ok)
+    memory = []      # (t, rss mb)
+    started = time.perf_counter()
+    deadline = started + seconds
+    cpu_started = time.process_time()
+    unique_ids = unique_ids or itertools.count(1)
+    placeholder = UNIQUE_PLACEHOLDER.encode()
+
+    async def client(index):
+        rng = random.Random(seed * 1000 + index)
+        while time.perf_counter() < deadline:
+            name = rng.choices(names, weights)[0]
+            method, path, body = rng.choice(pools[name])
+            if name == 'ai-filter' and rng.random() >= ai_filter_repeat:
+                body = body.replace(placeholder, f"req{next(unique_ids):09d}".encode())
+            route = name
+            sent = time.perf_counter()
+            try:
+                status, _, cache = await http.request(method, path, body)
+                ok = status < 400
+                if cache == 'hit':
+                    route = CACHED_ROUTE
+            except Exception:
+                ok = False
+            done = time.perf_counter()
+            samples.append((done - started, route, (done - sent) * 1000, ok))
+
+    async def sampler():
+        while time.perf_counter() < deadline:
+            memory.append((round(time.perf_counter() - started, 2), process_tree_rss_mb(server_pid)))
+            await asyncio.sleep(sample_interval)
+
+    tasks = [asyncio.create_task(client(i)) for i in range(concurrency)]
+    if server_pid:
+        tasks.append(asyncio.create_task(sampler()))
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - started
+    client_cpu = (time.process_time() - cpu_started) / elapsed
+
+    routes = {}
+    seen = {route for _, route, _, _ in samples}
+    for name in [name for name in ROUTE_LABELS if name in names or name in seen]:
+        latencies = sorted(latency for _, route, latency, _ in samples if route == name)
+        errors = sum(1 for _, route, _, ok in samples if route == name and not ok)
+        routes[name] = {
+            'route': ROUTE_LABELS[name],
+            'requests': len(latencies),
+            'errors': errors,
+            'rps': round(len(latencies) / elapsed, 1),
+            'p50_ms': percentile(latencies, 50),
+            'p90_ms': percentile(latencies, 90),
+            'p99_ms': percentile(latencies, 99),
+            'max_ms': round(latencies[-1], 2) if latencies else None,
+            'histogram': histogram(latencies),
+        }
+
+    seconds_total = int(elapsed) + 1
+    per_second = [[] for _ in range(seconds_total)]
+    errors_per_second = [0] * seconds_total
+    rss_per_second = [None] * seconds_total
+    for t, _, latency, ok in samples:
+        per_second[int(t)].append(latency)
+        errors_per_second[int(t)] += not ok
+    for t, mb in memory:
+        if mb is not None and int(t) < seconds_total:
+            rss_per_second[int(t)] = max(mb, rss_per_second[int(t)] or 0)
+    timeline = [{
+        't': second,
+        'requests': len(per_second[second]),
+        'errors': errors_per_second[second],
+        'p99_ms': percentile(sorted(per_second[second]), 99),
+        'rss_mb': rss_per_second[second],
+    } for second in range(seconds_total)]
+
+    all_latencies = sorted(latency for _, _, latency, _ in samples)
+    rss_values = [mb for _, mb in memory if mb is not None]
+    return {
+        'concurrency': concurrency,
+        'seconds': round(elapsed, 2),
+        'requests': len(samples),
+        'errors': sum(1 for *_, ok in samples if not ok),
+        'rps': round(len(samples) / elapsed, 1),
+        'p50_ms': percentile(all_latencies, 50),
+        'p99_ms': percentile(all_latencies, 99),
+        'client_cpu': round(client_cpu, 2),
+        'rss_mb_start': rss_values[0] if rss_values else None,
+        'rss_mb_peak': max(rss_values) if rss_values else None,
+        'routes': routes,
+        'timeline': timeline,
+    }
+
+
+async def build_pools(http, profiles, ai_bodies_per_profile, seed):
+    """Encoded requests per route; suggest responses seed the ai-filter bodies"""
+    rng = random.Random(seed)
+    pools = {
+        'courses': [('GET', '/api/courses', None)],
+        'prereqs': [('GET', path, None) for path in prereq_paths(profiles)],
+        'suggest': [('POST', '/api/suggest', schemas.dumps(profile)) for profile in profiles],
+        'ai-filter': [],
+    }
+    failures = 0
+    for profile, (_, _, body) in zip(profiles, pools['suggest']):
+        status, data, _ = await http.request('POST', '/api/suggest', body)
+        if status != 200:
+            failures += 1
+            continue
+        suggestion = schemas.loads(data)
+        for _ in range(ai_bodies_per_profile):
+            body = schemas.dumps(ai_filter_body(profile, suggestion, rng))
+            pools['ai-filter'].append(('POST', '/api/ai-filter-courses', body))
+    if failures:
+        print(f"⚠️  {failures}/{len(profiles)} warmup suggest calls failed")
+    return pools
+
+
+def print_stage(stage):
+    print(f"\n🚦 {stage['concurrency']} clients, {stage['seconds']:.0f}s: {stage['rps']:,.1f} req/s, "
+          f"p50 {stage['p50_ms']} ms, p99 {stage['p99_ms']} ms"
+          + (f", {stage['errors']} errors" if stage['errors'] else ''))
+    for name, route in stage['routes'].items():
+        print(f"   {route['route']:<30} {route['rps']:>9,.1f} req/s  p50 {route['p50_ms']:>8} ms  "
+              f"p90 {route['p90_ms']:>8} ms  p99 {route['p99_ms']:>8} ms"
+              + (f"  errors {route['errors']}" if route['errors'] else ''))
+        total = route['requests'] or 1
+        bars = [f"{bucket_label(i)}:{count * 100 / total:.0f}%"
+                for i, count in enumerate(route['histogram']) if count]
+        print(f"      {'  '.join(bars)}")
+    if stage['rss_mb_peak'] is not None:
+        print(f"   💾 server RSS {stage['rss_mb_start']} MB at start, {stage['rss_mb_peak']} MB peak")
+    if stage['client_cpu'] > 0.9:
+        print(f"   ⚠️  load generator at {stage['client_cpu']:.0%} CPU; results may be client bound")
+
+
+def compare(report, previous):
+    """Print per-route throughput and p99 changes against an earlier run"""
+    print(f"\n📊 Compared with {previous.get('commit')} ({previous.get('created_at')})")
+    for key in ('client', 'server'):
+        if previous.get(key) != report[key]:
+            print(f"   ⚠️  {key} differs: {previous.get(key)} then, {report[key]} now")
+    earlier = {stage['concurrency']: stage for stage in previous.get('stages', [])}
+    for stage in report['stages']:
+        old = earlier.get(stage['concurrency'])
+        if not old:
+            print(f"   {stage['concurrency']} clients: no matching stage")
+            continue
+        for name, route in stage['routes'].items():
+            before = old['routes'].get(name)
+            if not before or not before['rps'] or not before['p99_ms']:
+                continue
+            print(f"   {stage['concurrency']:>4} clients {route['route']:<30} "
+                  f"req/s {route['rps'] / before['rps'] - 1:+6.0%}  p99 {route['p99_ms'] / before['p99_ms'] - 1:+6.0%}")
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=BACKEND_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+async def run(args):
+    mix = parse_mix(args.mix)
+    proc = None
+    port = None
+    if args.url:
+        base_url = args.url.rstrip('/')
+        server_pid = args.pid
+    else:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        proc = start_server(port, args.cluster, args.workers, args.stub_latency_ms, args.server_log)
+        server_pid = proc.pid
+
+    http = make_client(base_url, max(args.concurrency), args.timeout, args.client)
+    try:
+        started = time.perf_counter()
+        await wait_ready(http, proc)
+        if proc:
+            print(f"🚀 Backend ({'cluster.js' if args.cluster else 'server.js'}, stub LLM) "
+                  f"ready on port {port} in {time.perf_counter() - started:.1f}s")
+
+        profiles = build_profiles(args.profiles, args.seed)
+        pools = await build_pools(http, profiles, args.ai_bodies, args.seed)
+        print(f"🧪 {len(profiles)} profiles, {len(pools['prereqs'])} prereq paths, "
+              f"{len(pools['ai-filter'])} ai-filter bodies ({http.name} client)")
+
+        stages = []
+        unique_ids = itertools.count(1)
+        for i, concurrency in enumerate(args.concurrency):
+            stage = await run_stage(http, pools, mix, concurrency, args.seconds, server_pid,
+                                    args.sample_interval, args.seed + i, args.ai_filter_repeat, unique_ids)
+            print_stage(stage)
+            stages.append(stage)
+    finally:
+        await http.close()
+        if proc:
+            stop_server(proc)
+
+    return {
+        'commit': git_commit(),
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'client': http.name,
+        'server': 'external' if args.url else ('cluster.js' if args.cluster else 'server.js'),
+        'config': {
+            'mix': mix,
+            'seconds': args.seconds,
+            'profiles': args.profiles,
+            'stub_latency_ms': None if args.url else args.stub_latency_ms,
+            'ai_filter_repeat': args.ai_filter_repeat,
+            'workers': args.workers,
+            'seed': args.seed,
+        },
+        'histogram_bounds_ms': BUCKET_BOUNDS_MS,
+        'stages': stages,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTTP load test for the backend API with a stub LLM')
+    parser.add_argument('--url', default=None, help='Test a running backend instead of starting one')
+    parser.add_argument('--pid', type=int, default=None, help='Server pid to sample memory from (with --url)')
+    parser.add_argument('--cluster', action='store_true', help='Start cluster.js instead of server.js')
+    parser.add_argument('--workers', type=int, default=None, help='CLUSTER_WORKERS for --cluster')
+    parser.add_argument('--stub-latency-ms', type=int, default=0, help='Simulated model latency')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[8],
+                        help='Concurrent clients; several values run as successive stages')
+    parser.add_argument('--seconds', type=float, default=30, help='Duration of each stage')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help=f'Route weights (default: {DEFAULT_MIX})')
+    parser.add_argument('--profiles', type=int, default=200, help='Sampled student profiles')
+    parser.add_argument('--ai-bodies', type=int, default=3, help='ai-filter queries per profile')
+    parser.add_argument('--ai-filter-repeat', type=float, default=0.0,
+                        help='Share of ai-filter requests that resend an earlier body (cacheable); '
+                             'the rest use a fresh query')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--timeout', type=float, default=30, help='Per-request timeout in seconds')
+    parser.add_argument('--sample-interval', type=float, default=0.5, help='Memory sampling interval (s)')
+    parser.add_argument('--client', choices=['aiohttp', 'httpx'], default=None)
+    parser.add_argument('--server-log', default=None, help='Write the started backend output here')
+    parser.add_argument('--output', default=None, help='Results file (default: results/api-<commit>-<time>.json)')
+    parser.add_argument('--compare', default=None, help='Earlier results file to compare against')
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+
+    output = args.output or os.path.join(
+        RESULTS_DIR, f"api-{report['commit']}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    schemas.dump(report, output, indent=2)
+    print(f"\n💾 Results saved to {output}")
+
+    if args.compare:
+        compare(report, schemas.load(args.compare))
+    return 1 if any(stage['errors'] for stage in report['stages']) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,456 @@
+import * as fs from "fs";
+import { promises as fsp } from "fs";
+import path from "path";
+import zlib from "zlib";
+import { DAY_CODES } from "./sectionIndex.js";
+
+// Catalog data the server keeps in memory: term-partitioned sections, major and
+// college requirements, prereq records, programs and the search index. Everything
+// is plain data so a cluster primary can load it once and hand workers a JSON
+// snapshot (see cluster.js) instead of every worker re-parsing thousands of files.
+//
+// Every file read is recorded in catalog.sources with its mtime/size stamp, so
+// reloadCatalog() only re-parses files that changed and reuses everything else.
+
+// Utility to split days string like "TuTh" => ["Tu", "Th"]
+export function parseDays(daysStr) {
+  // Always parse in order: M Tu W Th F Sa Su (handle abbreviations properly)
+  const result = [];
+
+  // Walk through days in order and check if daysStr contains them
+  for (const day of DAY_CODES) {
+    if (daysStr.includes(day)) {
+      result.push(day);
+      // Remove found day so it’s not double counted (important for 'Th' and 'T')
+      daysStr = daysStr.replace(day, '');
+    }
+  }
+  return result;
+}
+
+// Utility to parse times like "3:30p-4:50p" into { start: "15:30", end: "16:50" }
+export function parseTimes(timesStr) {
+  // Simple regex to split start/end and convert to 24h format
+  // Assumes times are always like "h:mmp-h:mmp" or "hh:mmp-h:mmp"
+  const parts = timesStr.split('-');
+  if (parts.length !== 2) return { start: null, end: null };
+
+  function convert12to24(time12h) {
+    const match = time12h.match(/(\d{1,2}):(\d{2})(a|p)/i);
+    if (!match) return null;
+    let [_, hour, min, ampm] = match;
+    hour = parseInt(hour);
+    min = parseInt(min);
+    if (ampm.toLowerCase() === 'p' && hour !== 12) hour += 12;
+    if (ampm.toLowerCase() === 'a' && hour === 12) hour = 0;
+    return `${hour.toString().padStart(2, '0')}:${min.toString().padStart(2, '0')}`;
+  }
+
+  return {
+    start: convert12to24(parts[0]),
+    end: convert12to24(parts[1]),
+  };
+}
+
+
+// Course data is term-partitioned: public/course_data/<term>.json (plus rated variants)
+// and an optional manifest.json written by the scraper. Terms are parsed on first use.
+const COURSE_DATA_DIR = "public/course_data";
+const COURSE_MANIFEST = path.join(COURSE_DATA_DIR, "manifest.json");
+// Try to load enhanced data with ratings first, fallback to original data
+const COURSE_FILE_SUFFIXES = [
+  "_with_individual_professor_ratings",
+  "_with_cse_math_ratings",
+  "_with_ratings",
+  ""
+];
+const TERM_FILE_PATTERN = /^([a-z]{2}\d{2})(_with_[a-z_]+)?\.json$/;
+const QUARTER_ORDER = ["WI", "SP", "S1", "S2", "S3", "SU", "FA"];
+
+export function termSortKey(term) {
+  return Number(term.slice(2)) * 10 + QUARTER_ORDER.indexOf(term.slice(0, 2));
+}
+
+function bestCourseFile(stem) {
+  for (const suffix of COURSE_FILE_SUFFIXES) {
+    const file = path.join(COURSE_DATA_DIR, `${stem}${suffix}.json`);
+    if (fs.existsSync(file)) return file;
+  }
+  return null;
+}
+
+// Map of term code -> best data file, plus the default term
+function discoverTerms() {
+  const files = {};
+  let current = null;
+  if (fs.existsSync(COURSE_MANIFEST)) {
+    const manifest = JSON.parse(fs.readFileSync(COURSE_MANIFEST, "utf-8"));
+    current = manifest.current || null;
+    for (const [term, entry] of Object.entries(manifest.terms || {})) {
+      const file = bestCourseFile(path.basename(entry.file || `${term.toLowerCase()}.json`, ".json"));
+      if (file) files[term.toUpperCase()] = file;
+    }
+  } else {
+    for (const name of fs.readdirSync(COURSE_DATA_DIR).sort()) {
+      const match = name.match(TERM_FILE_PATTERN);
+      if (match && !files[match[1].toUpperCase()]) {
+        files[match[1].toUpperCase()] = bestCourseFile(match[1]);
+      }
+    }
+  }
+  if (!current) {
+    // Without a manifest the newest term is the default
+    current = Object.keys(files).sort((a, b) => termSortKey(b) - termSortKey(a))[0] || null;
+  }
+  return { files, current };
+}
+
+// Sections of a term file flattened into the shape the routes use
+export function transformCourses(data) {
+  const transformed = [];
+  for (const dept in data) {
+    for (const courseNum in data[dept]) {
+      for (const section of data[dept][courseNum]) {
+        transformed.push({
+          dept,
+          code: courseNum,
+          sectionType: section.sectionType,
+          days: Array.isArray(section.days) ? section.days : parseDays(section.days),
+          times: typeof section.times === "object" ? section.times : parseTimes(section.times),
+          buildingName: section.buildingName,
+          roomNumber: section.roomNumber,
+          professor: section.professor,
+          seatsRemaining: section.seatsRemaining?.toString().trim() === "" ? null : Number(section.seatsRemaining),
+          spaces: section.spaces?.toString().trim() === "" ? null : Number(section.spaces),
+          // Add professor rating data if available
+          professor_rating: section.professor_rating || null,
+        });
+      }
+    }
+  }
+  return transformed;
+}
+
+export function loadCourses(courseFile, sources = null) {
+  const stamp = fileStamp(fs.statSync(courseFile));
+  const transformed = transformCourses(JSON.parse(fs.readFileSync(courseFile, "utf-8")));
+  sources?.set(courseFile, { stamp, value: transformed });
+  return transformed;
+}
+
+function fileStamp(stats) {
+  return `${stats.mtimeMs}:${stats.size}`;
+}
+
+// Parsed JSON files of a directory, keyed by keyOf(file, data)
+function loadJsonDir(dir, keyOf, sources) {
+  const result = {};
+  for (const name of fs.readdirSync(dir)) {
+    if (!name.endsWith(".json")) continue;
+    const file = path.join(dir, name);
+    const stamp = fileStamp(fs.statSync(file));
+    const data = JSON.parse(fs.readFileSync(file, "utf-8"));
+    sources.set(file, { stamp, value: data });
+    result[keyOf(file, data)] = data;
+  }
+  return result;
+}
+
+// Major requirements keyed by file name, e.g. cs25.json -> CS25
+const majorReqsDir = path.join(process.cwd(), "public/majorreq");
+const majorKey = file => path.basename(file, ".json").toUpperCase();
+function loadAllMajorReqs(sources) {
+  return loadJsonDir(majorReqsDir, majorKey, sources);
+}
+
+// Prereq records keyed by course code
+const PREQ_DIR = path.join(process.cwd(), "public/prereqdata");
+const DEPARTMENTS_FILE = path.join(PREQ_DIR, "departments.json");
+const prereqKey = (file, data) => data.code;
+function loadAllPrereqsSync(sources) {
+  return loadJsonDir(PREQ_DIR, prereqKey, sources);
+}
+
+// College requirements keyed by college name
+const collegesDir = path.join(process.cwd(), "public", "collegedata");
+const collegeKey = (file, data) => data.college;
+function loadColleges(sources) {
+  return loadJsonDir(collegesDir, collegeKey, sources);
+}
+
+const SEARCH_INDEX_FILE = path.join(process.cwd(), "public/search/course_index.json.gz");
+const parseSearchIndex = buffer => JSON.parse(zlib.gunzipSync(buffer).toString("utf-8"));
+
+// Directories a reload needs to look at
+export const CATALOG_DIRS = [COURSE_DATA_DIR, majorReqsDir, PREQ_DIR, collegesDir, path.dirname(SEARCH_INDEX_FILE)];
+
+// allTerms parses every term up front (for snapshots); otherwise terms load on first use
+export function loadCatalog({ allTerms = false } = {}) {
+  const sources = new Map();
+  const terms = discoverTerms();
+  const coursesByTerm = new Map();
+  if (allTerms) {
+    for (const [term, file] of Object.entries(terms.files)) {
+      coursesByTerm.set(term, loadCourses(file, sources));
+    }
+  }
+  const allPrereqs = loadAllPrereqsSync(sources);
+  let searchIndex = null;
+  if (fs.existsSync(SEARCH_INDEX_FILE)) {
+    const stamp = fileStamp(fs.statSync(SEARCH_INDEX_FILE));
+    searchIndex = parseSearchIndex(fs.readFileSync(SEARCH_INDEX_FILE));
+    sources.set(SEARCH_INDEX_FILE, { stamp, value: searchIndex });
+  }
+  return {
+    terms,
+    coursesByTerm,
+    allMajorReqs: loadAllMajorReqs(sources),
+    allPrereqs,
+    colleges: loadColleges(sources),
+    programs: sources.get(DEPARTMENTS_FILE).value,
+    searchIndex,
+    sources,
+    loadedAt: new Date().toISOString(),
+  };
+}
+
+// Reuses the previous parse of a file when its stamp is unchanged
+async function reloadFile(file, previous, sources, report, parse) {
+  const stamp = fileStamp(await fsp.stat(file));
+  const old = previous.get(file);
+  report.checked += 1;
+  if (old && old.stamp === stamp) {
+    sources.set(file, old);
+    return { value: old.value, fresh: false };
+  }
+  const value = parse(await fsp.readFile(file));
+  sources.set(file, { stamp, value });
+  report.parsed.push(path.relative(process.cwd(), file));
+  return { value, fresh: true };
+}
+
+// Returns previousValue itself when no file in the directory was added, changed or removed
+async function reloadJsonDir(dir, keyOf, previousValue, previous, sources, report) {
+  const files = (await fsp.readdir(dir)).filter(name => name.endsWith(".json")).map(name => path.join(dir, name));
+  const loaded = await Promise.all(
+    files.map(file => reloadFile(file, previous, sources, report, buffer => JSON.parse(buffer.toString("utf-8"))))
+  );
+  const removed = [...previous.keys()].filter(file => path.dirname(file) === dir && !sources.has(file));
+  report.removed.push(...removed.map(file => path.relative(process.cwd(), file)));
+  if (!removed.length && !loaded.some(entry => entry.fresh)) return previousValue;
+
+  const result = {};
+  files.forEach((file, i) => {
+    result[keyOf(file, loaded[i].value)] = loaded[i].value;
+  });
+  return result;
+}
+
+/**
+ * Build the next catalog from `previous` without blocking on unchanged files:
+ * everything is stat'ed asynchronously and only new or modified files are read
+ * and parsed. Collections with no changes keep their identity, so caches keyed
+ * on them stay valid. Terms that were loaded before (plus the current term)
+ * are kept loaded.
+ */
+export async function reloadCatalog(previous) {
+  const started = performance.now();
+  const sources = new Map();
+  const report = { checked: 0, parsed: [], removed: [], changed: [] };
+  const old = previous.sources;
+
+  const terms = discoverTerms();
+  const coursesByTerm = new Map();
+  const wanted = new Set([...previous.coursesByTerm.keys(), terms.current]);
+  for (const term of wanted) {
+    if (!term || !terms.files[term]) continue;
+    const { value } = await reloadFile(terms.files[term], old, sources, report,
+      buffer => transformCourses(JSON.parse(buffer.toString("utf-8"))));
+    coursesByTerm.set(term, value);
+  }
+
+  const [allMajorReqs, allPrereqs, colleges] = await Promise.all([
+    reloadJsonDir(majorReqsDir, majorKey, previous.allMajorReqs, old, sources, report),
+    reloadJsonDir(PREQ_DIR, prereqKey, previous.allPrereqs, old, sources, report),
+    reloadJsonDir(collegesDir, collegeKey, previous.colleges, old, sources, report),
+  ]);
+  let searchIndex = null;
+  if (fs.existsSync(SEARCH_INDEX_FILE)) {
+    ({ value: searchIndex } = await reloadFile(SEARCH_INDEX_FILE, old, sources, report, parseSearchIndex));
+  }
+
+  const next = {
+    terms,
+    coursesByTerm,
+    allMajorReqs,
+    allPrereqs,
+    colleges,
+    programs: sources.get(DEPARTMENTS_FILE).value,
+    searchIndex,
+    sources,
+    loadedAt: new Date().toISOString(),
+  };
+  const termsChanged = JSON.stringify(terms) !== JSON.stringify(previous.terms) ||
+    [...coursesByTerm].some(([term, courses]) => previous.coursesByTerm.get(term) !== courses);
+  if (termsChanged) report.changed.push("terms");
+  for (const key of ["allMajorReqs", "allPrereqs", "colleges", "programs", "searchIndex"]) {
+    if (next[key] !== previous[key]) report.changed.push(key);
+  }
+  report.ms = Math.round(performance.now() - started);
+  return { catalog: next, report };
+}
+
+// Catalog fields whose values, or entries, are also the values of catalog.sources
+const SNAPSHOT_FIELDS = ["coursesByTerm", "allMajorReqs", "allPrereqs", "colleges", "programs", "searchIndex"];
+
+/**
+ * Snapshots are JSON rather than v8.serialize(): strings v8.deserialize() returns
+ * are not internalized, which made /api/suggest in a worker run at about half the
+ * rate of a process that parsed the files itself. A source entry stores where its
+ * value sits in the catalog instead of a second copy, so readSnapshot() gives back
+ * the same shared objects reloadCatalog() relies on.
+ */
+export function writeSnapshot(file, catalog) {
+  const places = new Map();
+  for (const field of SNAPSHOT_FIELDS) {
+    const value = catalog[field];
+    if (!value || typeof value !== "object") continue;
+    if (!places.has(value)) places.set(value, [field]);
+    if (Array.isArray(value)) continue;
+    for (const [key, entry] of value instanceof Map ? value : Object.entries(value)) {
+      if (!places.has(entry)) places.set(entry, [field, key]);
+    }
+  }
+  const buffer = Buffer.from(JSON.stringify({
+    ...catalog,
+    coursesByTerm: [...catalog.coursesByTerm],
+    sources: [...catalog.sources].map(([source, { stamp, value }]) => [source, stamp, places.get(value) ?? { value }]),
+  }));
+  const tmpFile = `${file}.tmp`;
+  fs.writeFileSync(tmpFile, buffer);
+  fs.renameSync(tmpFile, file);
+  return buffer.length;
+}
+
+export function readSnapshot(file) {
+  const snapshot = JSON.parse(fs.readFileSync(file, "utf-8"));
+  const catalog = { ...snapshot, coursesByTerm: new Map(snapshot.coursesByTerm), sources: new Map() };
+  for (const [source, stamp, place] of snapshot.sources) {
+    const value = Array.isArray(place)
+      ? place.reduce((parent, key) => (parent instanceof Map ? parent.get(key) : parent[key]), catalog)
+      : place.value;
+    catalog.sources.set(source, { stamp, value });
+  }
+  return catalog;
+}
+
+const RELOAD_DEBOUNCE_MS = 500;
+
+/**
+ * Runs catalog reloads one at a time: reloads requested while one is running
+ * share exactly one follow-up reload, and file-change events are debounced.
+ * reload() resolves with the report of a reload that started after the call, so
+ * a caller always sees its own changes. After every reload `onReload(result,
+ * next)` is called, with `next` set only when something changed. A failing
+ * reload (e.g. a half-written file) keeps the current catalog.
+ */
+export class CatalogReloader {
+  constructor(catalog, onReload) {
+    this.catalog = catalog;
+    this.onReload = onReload;
+    this.reloading = null;
+    this.queued = null;
+    this.timer = null;
+    this.last = null;
+  }
+
+  reload(reason) {
+    if (!this.reloading) return this.run(reason);
+    if (!this.queued) {
+      this.queued = this.reloading.then(() => {
+        this.queued = null;
+        return this.reload(reason);
+      });
+    }
+    return this.queued;
+  }
+
+  run(reason) {
+    this.reloading = (async () => {
+      const at = new Date().toISOString();
+      try {
+        const { catalog: next, report } = await reloadCatalog(this.catalog);
+        const changed = report.changed.length > 0;
+        this.last = { reason, at, ...report };
+        if (changed) this.catalog = next;
+        this.onReload(this.last, changed ? next : null);
+        if (changed || report.removed.length) {
+          console.log(`Catalog reloaded (${reason}) in ${report.ms} ms: ${report.parsed.length} files parsed, ` +
+            `${report.removed.length} removed, changed ${report.changed.join(", ") || "nothing"}`);
+        }
+      } catch (error) {
+        this.last = { reason, at, error: error.message };
+        this.onReload(this.last, null);
+        console.error(`Catalog reload failed (${reason}): ${error.message}`);
+      } finally {
+        this.reloading = null;
+      }
+      return this.last;
+    })();
+    return this.reloading;
+  }
+
+  schedule(reason) {
+    clearTimeout(this.timer);
+    this.timer = setTimeout(() => this.reload(reason), RELOAD_DEBOUNCE_MS);
+  }
+
+  // Reload when anything under CATALOG_DIRS changes
+  watch() {
+    for (const dir of CATALOG_DIRS) {
+      if (!fs.existsSync(dir)) continue;
+      fs.watch(dir, (event, file) => {
+        if (file && !file.endsWith(".tmp")) this.schedule(`${path.basename(dir)}/${file}`);
+      });
+    }
+  }
+}
+
+/**
+ * The reload side of a cluster.js worker: reloads run in the primary, which
+ * rewrites the snapshot and messages every worker; `apply(next)` is called with
+ * the re-read snapshot. Same interface as CatalogReloader.
+ */
+export class ClusterCatalogClient {
+  constructor(snapshotFile, apply) {
+    this.snapshotFile = snapshotFile;
+    this.apply = apply;
+    this.last = null;
+    this.pending = new Map();
+    this.nextId = 0;
+    process.on("message", message => this.receive(message));
+  }
+
+  get reloading() {
+    return this.pending.size > 0;
+  }
+
+  reload(reason) {
+    return new Promise(resolve => {
+      const id = ++this.nextId;
+      this.pending.set(id, resolve);
+      process.send({ type: "catalog:reload", id, reason });
+    });
+  }
+
+  receive(message) {
+    if (message?.type === "catalog:reloaded") {
+      if (message.changed) this.apply(readSnapshot(this.snapshotFile));
+      this.last = message.result;
+    } else if (message?.type === "catalog:reload-result") {
+      // Sent after the catalog:reloaded broadcast, so the new catalog is already in use
+      this.pending.get(message.id)?.(message.result);
+      this.pending.delete(message.id);
+    }
+  }
+}
@@ -0,0 +1,71 @@
+import cluster from "cluster";
+import * as fs from "fs";
+import os from "os";
+import path from "path";
+import { fileURLToPath } from "url";
+import { loadCatalog, writeSnapshot, CatalogReloader } from "./catalog.js";
+
+// Multi-core mode: `npm run start:cluster` (CLUSTER_WORKERS=4 to pin the count).
+// The primary parses the catalog once, writes a JSON snapshot, and forks server.js
+// workers that parse it and share the listening port. Workers that die are
+// replaced.
+//
+// Reloads also run in the primary: file changes (unless CATALOG_WATCH=0), SIGHUP
+// to the primary, and SIGHUP or POST /api/catalog/reload (see CATALOG_RELOAD_TOKEN
+// in server.js) on any worker. A reload that changed anything rewrites the
+// snapshot before every worker is told to re-read it, so replacement workers
+// start from current data too.
+
+const WORKERS = Number(process.env.CLUSTER_WORKERS) || os.availableParallelism();
+const SNAPSHOT_FILE = path.join(os.tmpdir(), `ucsd-scheduler-catalog-${process.pid}.json`);
+
+let started = Date.now();
+const catalog = loadCatalog({ allTerms: true });
+const loadMs = Date.now() - started;
+started = Date.now();
+const bytes = writeSnapshot(SNAPSHOT_FILE, catalog);
+console.log(
+  `Catalog loaded in ${loadMs} ms, snapshot ${(bytes / 1024 / 1024).toFixed(1)} MB written in ${Date.now() - started} ms`
+);
+
+function broadcast(message) {
+  for (const worker of Object.values(cluster.workers)) worker.send(message);
+}
+
+const reloader = new CatalogReloader(catalog, (result, next) => {
+  if (next) writeSnapshot(SNAPSHOT_FILE, next);
+  broadcast({ type: "catalog:reloaded", changed: Boolean(next), result });
+});
+if (process.env.CATALOG_WATCH !== "0") reloader.watch();
+process.on("SIGHUP", () => reloader.reload("SIGHUP"));
+
+let stopping = false;
+cluster.setupPrimary({ exec: path.join(path.dirname(fileURLToPath(import.meta.url)), "server.js") });
+
+function fork() {
+  return cluster.fork({ CATALOG_SNAPSHOT: SNAPSHOT_FILE });
+}
+
+cluster.on("message", async (worker, message) => {
+  if (message?.type !== "catalog:reload") return;
+  const result = await reloader.reload(`${message.reason} (worker ${worker.process.pid})`);
+  if (worker.isConnected()) worker.send({ type: "catalog:reload-result", id: message.id, result });
+});
+
+cluster.on("exit", (worker, code, signal) => {
+  if (stopping) return;
+  console.log(`Worker ${worker.process.pid} exited (${signal || code}), starting a replacement`);
+  fork();
+});
+
+function stop() {
+  stopping = true;
+  for (const worker of Object.values(cluster.workers)) worker.kill();
+  fs.rmSync(SNAPSHOT_FILE, { force: true });
+  process.exit(0);
+}
+process.on("SIGINT", stop);
+process.on("SIGTERM", stop);
+
+for (let i = 0; i < WORKERS; i++) fork();
+console.log(`Started ${WORKERS} workers on port ${process.env.PORT || 3001}`);
@@ -0,0 +1,150 @@
+import * as fs from "fs";
+import zlib from "zlib";
+
+// Query side of the BM25 course index built by pipeline/course_search.py.
+// Tokenization and query syntax must stay in sync with that script.
+
+const TOKEN_SPLIT = /[^a-z0-9]+/;
+const FILTER_FIELDS = new Set(["dept", "units", "level"]);
+const MAX_PREFIX_TERMS = 50;
+
+function normalizeToken(token) {
+  if (token.length > 4 && token.endsWith("s") && !token.endsWith("ss")) {
+    return token.slice(0, -1);
+  }
+  return token;
+}
+
+export class CourseSearchIndex {
+  constructor(index) {
+    this.docs = index.docs;
+    this.stopwords = new Set(index.stopwords);
+    this.postings = new Map();
+    for (const [term, [docDeltas, scores]] of Object.entries(index.terms)) {
+      const docIds = new Int32Array(docDeltas.length);
+      let current = 0;
+      docDeltas.forEach((delta, i) => {
+        current += delta;
+        docIds[i] = current;
+      });
+      this.postings.set(term, { docIds, scores: Float32Array.from(scores) });
+    }
+    this.sortedTerms = [...this.postings.keys()].sort();
+  }
+
+  static load(file) {
+    return new CourseSearchIndex(JSON.parse(zlib.gunzipSync(fs.readFileSync(file)).toString("utf-8")));
+  }
+
+  tokenize(text) {
+    return String(text || "")
+      .toLowerCase()
+      .split(TOKEN_SPLIT)
+      .filter(t => t && !this.stopwords.has(t))
+      .map(normalizeToken);
+  }
+
+  parseQuery(query) {
+    const terms = [];
+    const prefixes = [];
+    const filters = {};
+    for (const raw of String(query || "").split(/\s+/).filter(Boolean)) {
+      const sep = raw.indexOf(":");
+      const field = sep > 0 ? raw.slice(0, sep).toLowerCase() : "";
+      if (FILTER_FIELDS.has(field) && raw.length > sep + 1) {
+        filters[field] = raw.slice(sep + 1);
+        continue;
+      }
+      if (raw.endsWith("*") && raw.length > 1) {
+        const prefix = raw.slice(0, -1).toLowerCase().replace(/[^a-z0-9]+/g, "");
+        if (prefix) prefixes.push(prefix);
+        continue;
+      }
+      terms.push(...this.tokenize(raw));
+    }
+    return { terms, prefixes, filters };
+  }
+
+  // Binary search for the first vocabulary term >= prefix, then walk forward
+  expandPrefix(prefix) {
+    let lo = 0;
+    let hi = this.sortedTerms.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1;
+      if (this.sortedTerms[mid] < prefix) lo = mid + 1;
+      else hi = mid;
+    }
+    const expanded = [];
+    for (let i = lo; i < this.sortedTerms.length && expanded.length < MAX_PREFIX_TERMS; i++) {
+      if (!this.sortedTerms[i].startsWith(prefix)) break;
+      expanded.push(this.sortedTerms[i]);
+    }
+    return expanded;
+  }
+
+  matchesFilters(doc, filters) {
+    const [, , dept, , unitsMin, unitsMax, level] = doc;
+    if (filters.dept && dept.toUpperCase() !== filters.dept.toUpperCase()) return false;
+    if (filters.level && level !== filters.level.toLowerCase()) return false;
+    if (filters.units !== undefined) {
+      const wanted = Number(filters.units);
+      if (Number.isNaN(wanted) || unitsMin === null || wanted < unitsMin || wanted > unitsMax) return false;
+    }
+    return true;
+  }
+
+  search(query, { limit = 10, ...extraFilters } = {}) {
+    const { terms, prefixes, filters } = this.parseQuery(query);
+    for (const [key, value] of Object.entries(extraFilters)) {
+      if (FILTER_FIELDS.has(key) && value !== undefined && value !== "") filters[key] = String(value);
+    }
+    const hasFilters = Object.keys(filters).length > 0;
+
+    const scores = new Map();
+    for (const term of terms) {
+      const posting = this.postings.get(term);
+      if (!posting) continue;
+      for (let i = 0; i < posting.docIds.length; i++) {
+        const docId = posting.docIds[i];
+        scores.set(docId, (scores.get(docId) || 0) + posting.scores[i]);
+      }
+    }
+    for (const prefix of prefixes) {
+      // A document matching several expansions of one prefix only counts its best one
+      const best = new Map();
+      for (const term of this.expandPrefix(prefix)) {
+        const posting = this.postings.get(term);
+        for (let i = 0; i < posting.docIds.length; i++) {
+          const docId = posting.docIds[i];
+          if (posting.scores[i] > (best.get(docId) || 0)) best.set(docId, posting.scores[i]);
+        }
+      }
+      for (const [docId, score] of best) {
+        scores.set(docId, (scores.get(docId) || 0) + score);
+      }
+    }
+
+    let candidates;
+    if (terms.length === 0 && prefixes.length === 0) {
+      // Filter-only query: list matching courses in catalog order
+      candidates = this.docs.map((_, docId) => [docId, 0]);
+    } else {
+      candidates = [...scores.entries()].sort((a, b) => b[1] - a[1] || a[0] - b[0]);
+    }
+
+    const results = [];
+    for (const [docId, score] of candidates) {
+      const doc = this.docs[docId];
+      if (hasFilters && !this.matchesFilters(doc, filters)) continue;
+      results.push({
+        code: doc[0],
+        title: doc[1],
+        dept: doc[2],
+        units: doc[3],
+        score: Math.round(score * 1000) / 1000
+      });
+      if (results.length >= limit) break;
+    }
+    return results;
+  }
+}
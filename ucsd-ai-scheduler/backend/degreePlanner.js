@@ -0,0 +1,390 @@
+// Quarter-by-quarter degree planner.
+//
+// Picks concrete courses for every major and college requirement (plus the
+// prerequisites they pull in), then schedules them under a unit cap with a
+// branch-and-bound search. Search states are bitsets of planned courses already
+// taken, memoized on the earliest quarter each state was reached, and pruned
+// with an admissible lower bound: the longest remaining prerequisite chain and
+// the remaining units divided by the cap.
+
+export const DEFAULT_UNIT_CAP = 16;
+const DEFAULT_UNITS = 4;
+// Expansion budget; past it the best plan found so far is returned with optimal: false
+const NODE_LIMIT = 50000;
+// Only the highest-priority available courses are branched on each quarter. When
+// that drops any candidate, a plan is only reported optimal if it meets the lower bound.
+const BRANCH_WIDTH = 8;
+// Regular-year quarters used to label plans (summer sessions are not planned)
+const PLAN_QUARTERS = ["WI", "SP", "FA"];
+
+function parseUnits(units) {
+  const match = String(units ?? "").match(/\d+(\.\d+)?/);
+  return match ? Number(match[0]) : DEFAULT_UNITS;
+}
+
+// College requirement groups can nest option lists (e.g. Warren's PHIL/POLI 27-28)
+function flattenOptions(courses) {
+  return courses.flatMap(c => (Array.isArray(c) ? flattenOptions(c) : [c]));
+}
+
+function isPlaceholder(code, catalog) {
+  // "CSE Elective": a free choice rather than a specific course
+  return !catalog[code] && !/\d/.test(code);
+}
+
+export function prereqsSatisfied(node, has) {
+  if (!node) return true;
+  if (typeof node === "string") return has(node);
+  if (Array.isArray(node)) return node.every(n => prereqsSatisfied(n, has));
+  const met = node.courses.filter(c => prereqsSatisfied(c, has)).length;
+  if (node.type === "one") return met >= 1;
+  if (node.type === "two") return met >= Math.min(2, node.courses.length);
+  return met === node.courses.length;
+}
+
+export function nextTerm(term) {
+  const quarter = term.slice(0, 2).toUpperCase();
+  const year = Number(term.slice(2));
+  const index = PLAN_QUARTERS.indexOf(quarter);
+  if (index === -1 || index === PLAN_QUARTERS.length - 1) {
+    return `${PLAN_QUARTERS[0]}${String(year + 1).padStart(2, "0")}`;
+  }
+  return `${PLAN_QUARTERS[index + 1]}${String(year).padStart(2, "0")}`;
+}
+
+// Chooses which courses to plan: the cheapest option of each requirement,
+// counting the prerequisites it would add on top of what is already planned
+class CourseSelection {
+  constructor(catalog, completed, excluded) {
+    this.catalog = catalog;
+    this.completed = completed;
+    this.excluded = excluded;
+    this.closures = new Map();
+    this.planned = new Set();
+    this.used = new Set();
+  }
+
+  // Courses (not yet completed) needed to take `code`, itself included; null if impossible
+  closure(code, stack = new Set()) {
+    if (this.completed.has(code)) return new Set();
+    if (this.closures.has(code)) return this.closures.get(code);
+    if (this.excluded.has(code) || stack.has(code)) return null;
+    stack.add(code);
+    const needed = this.nodeClosure(this.catalog[code]?.prereqs, stack);
+    stack.delete(code);
+    const result = needed ? new Set([...needed, code]) : null;
+    this.closures.set(code, result);
+    return result;
+  }
+
+  nodeClosure(node, stack) {
+    if (!node) return new Set();
+    if (typeof node === "string") return this.closure(node, stack);
+    const children = node.courses.map(c => this.nodeClosure(c, stack));
+    if (node.type === "all") {
+      if (children.some(c => c === null)) return null;
+      return new Set(children.flatMap(c => [...c]));
+    }
+    const ranked = children.filter(Boolean).sort((a, b) => this.marginal(a) - this.marginal(b));
+    const needed = node.type === "two" ? Math.min(2, node.courses.length) : 1;
+    if (ranked.length < needed) return null;
+    return new Set(ranked.slice(0, needed).flatMap(c => [...c]));
+  }
+
+  marginal(courses) {
+    let cost = 0;
+    for (const c of courses) if (!this.planned.has(c)) cost += 1;
+    return cost;
+  }
+
+  // Options in order of added courses, keeping the listed order on ties
+  rankOptions(options) {
+    return options
+      .filter(c => !this.used.has(c))
+      .map((code, order) => ({ code, order, closure: this.closure(code) }))
+      .filter(o => o.closure)
+      .sort((a, b) => this.marginal(a.closure) - this.marginal(b.closure) || a.order - b.order);
+  }
+
+  take(code, closure) {
+    closure.forEach(c => this.planned.add(c));
+    this.used.add(code);
+  }
+}
+
+export function selectCourses(requirements, catalog, completed, excluded = new Set()) {
+  const selection = new CourseSelection(catalog, completed, excluded);
+  const satisfies = new Map();
+  const placeholders = [];
+  const unmet = [];
+
+  const label = (code, requirement) => {
+    if (!satisfies.has(code)) satisfies.set(code, requirement);
+  };
+
+  // Required courses first so option groups can reuse what they pull in
+  const ordered = [
+    ...requirements.filter(r => typeof r === "string"),
+    ...requirements.filter(r => r.type === "one"),
+    ...requirements.filter(r => r.type === "at_least"),
+  ];
+  for (const req of ordered) {
+    if (typeof req === "string") {
+      if (completed.has(req)) continue;
+      const closure = selection.closure(req);
+      if (!closure) {
+        unmet.push({ requirement: req, reason: "prerequisites cannot be satisfied" });
+        continue;
+      }
+      selection.take(req, closure);
+      label(req, req);
+      continue;
+    }
+
+    const options = flattenOptions(req.courses);
+    const count = req.type === "at_least" ? req.count : 1;
+    const name = req.type === "at_least" ? `${count} of ${options.join(", ")}` : `one of ${options.join(", ")}`;
+    let needed = count - options.filter(c => completed.has(c)).length;
+    if (needed <= 0) continue;
+
+    const placeholder = options.find(c => isPlaceholder(c, catalog));
+    if (placeholder && options.length === 1) {
+      for (let i = 1; i <= needed; i++) {
+        placeholders.push({ code: `${placeholder} (${i})`, group: placeholder, requirement: name });
+      }
+      continue;
+    }
+
+    for (const option of selection.rankOptions(options)) {
+      if (needed === 0) break;
+      selection.take(option.code, option.closure);
+      label(option.code, name);
+      needed -= 1;
+    }
+    if (needed > 0) unmet.push({ requirement: name, reason: `${needed} more course(s) have no plannable option` });
+  }
+
+  for (const code of selection.planned) label(code, "prerequisite");
+  return { courses: [...selection.planned], placeholders, satisfies, unmet };
+}
+
+export class DegreePlanner {
+  constructor(catalog, { unitCap = DEFAULT_UNIT_CAP, nodeLimit = NODE_LIMIT } = {}) {
+    this.catalog = catalog;
+    this.unitCap = unitCap;
+    this.nodeLimit = nodeLimit;
+  }
+
+  plan(requirements, { completed = [], excluded = [], startTerm = null } = {}) {
+    const started = Date.now();
+    const done = new Set(completed);
+    const selected = selectCourses(requirements, this.catalog, done, new Set(excluded));
+
+    const courses = [
+      ...selected.courses.map(code => ({
+        code,
+        units: parseUnits(this.catalog[code]?.units),
+        prereqs: this.catalog[code]?.prereqs || null,
+        group: null,
+        requirement: selected.satisfies.get(code),
+      })),
+      ...selected.placeholders.map(p => ({ ...p, units: DEFAULT_UNITS, prereqs: null })),
+    ];
+    this.setup(courses, done);
+    const search = this.search();
+
+    let term = startTerm;
+    const quarters = search.quarters.map(mask => {
+      const picked = this.members(mask);
+      const quarter = {
+        term,
+        units: picked.reduce((sum, i) => sum + courses[i].units, 0),
+        courses: picked.map(i => ({
+          code: courses[i].code,
+          title: this.catalog[courses[i].code]?.title || null,
+          units: courses[i].units,
+          requirement: courses[i].requirement,
+        })),
+      };
+      term = term ? nextTerm(term) : null;
+      return quarter;
+    });
+
+    const scheduled = search.quarters.reduce((acc, mask) => acc | mask, 0n);
+    const unplaced = courses.filter((_, i) => !(scheduled & this.bits[i])).map(c => c.code);
+    return {
+      quarters,
+      totalQuarters: quarters.length,
+      totalUnits: courses.reduce((sum, c) => sum + c.units, 0),
+      lowerBound: this.lowerBound(0n),
+      optimal: search.optimal,
+      unmet: [
+        ...selected.unmet,
+        ...unplaced.map(code => ({ requirement: code, reason: "prerequisites not reachable in the plan" })),
+      ],
+      stats: { courses: courses.length, expanded: search.expanded, ms: Date.now() - started },
+    };
+  }
+
+  setup(courses, completed) {
+    this.courses = courses;
+    this.completed = completed;
+    this.index = new Map(courses.map((c, i) => [c.code, i]));
+    this.bits = courses.map((_, i) => 1n << BigInt(i));
+    this.full = this.bits.reduce((acc, bit) => acc | bit, 0n);
+  }
+
+  members(mask) {
+    const result = [];
+    this.bits.forEach((bit, i) => {
+      if (mask & bit) result.push(i);
+    });
+    return result;
+  }
+
+  has(mask, code) {
+    if (this.completed.has(code)) return true;
+    const i = this.index.get(code);
+    return i !== undefined && (mask & this.bits[i]) !== 0n;
+  }
+
+  available(mask) {
+    const result = [];
+    this.courses.forEach((course, i) => {
+      if (mask & this.bits[i]) return;
+      if (prereqsSatisfied(course.prereqs, code => this.has(mask, code))) result.push(i);
+    });
+    return result;
+  }
+
+  // Quarters still needed for each untaken course counting itself (Infinity if unreachable)
+  depths(mask) {
+    const depth = new Array(this.courses.length).fill(undefined);
+    const visiting = new Set();
+    const nodeDepth = node => {
+      if (!node) return 0;
+      if (typeof node === "string") {
+        if (this.completed.has(node)) return 0;
+        const i = this.index.get(node);
+        if (i === undefined) return Infinity;
+        return courseDepth(i);
+      }
+      const values = node.courses.map(nodeDepth).sort((a, b) => a - b);
+      if (node.type === "one") return values[0] ?? 0;
+      if (node.type === "two") return values[Math.min(2, values.length) - 1] ?? 0;
+      return values.length ? values[values.length - 1] : 0;
+    };
+    const courseDepth = i => {
+      if (mask & this.bits[i]) return 0;
+      if (depth[i] !== undefined) return depth[i];
+      if (visiting.has(i)) return Infinity;
+      visiting.add(i);
+      depth[i] = 1 + nodeDepth(this.courses[i].prereqs);
+      visiting.delete(i);
+      return depth[i];
+    };
+    return this.courses.map((_, i) => courseDepth(i));
+  }
+
+  lowerBound(mask, depths = this.depths(mask)) {
+    let chain = 0;
+    let units = 0;
+    depths.forEach((d, i) => {
+      if (mask & this.bits[i]) return;
+      if (d !== Infinity) chain = Math.max(chain, d);
+      units += this.courses[i].units;
+    });
+    return Math.max(chain, Math.ceil(units / this.unitCap));
+  }
+
+  // Critical-path courses first, then bigger courses
+  prioritize(candidates, depths) {
+    return candidates.sort((a, b) => depths[b] - depths[a] || this.courses[b].units - this.courses[a].units || a - b);
+  }
+
+  fits(units, course) {
+    return units + course.units <= this.unitCap || units === 0;
+  }
+
+  greedyQuarters() {
+    const quarters = [];
+    let mask = 0n;
+    while (mask !== this.full) {
+      const depths = this.depths(mask);
+      const candidates = this.prioritize(this.available(mask), depths);
+      if (candidates.length === 0) break;
+      let units = 0;
+      let quarter = 0n;
+      for (const i of candidates) {
+        if (!this.fits(units, this.courses[i])) continue;
+        units += this.courses[i].units;
+        quarter |= this.bits[i];
+      }
+      quarters.push(quarter);
+      mask |= quarter;
+    }
+    return { quarters, mask };
+  }
+
+  // Subsets of the candidates that fill the quarter (no other candidate still fits).
+  // Interchangeable placeholders are only taken in order.
+  *quarterChoices(candidates) {
+    const courses = this.courses;
+    const self = this;
+    function* extend(k, units, mask, skippedGroups, skippedUnits) {
+      if (k === candidates.length) {
+        if (mask !== 0n && skippedUnits.every(u => !self.fits(units, { units: u }))) yield mask;
+        return;
+      }
+      const course = courses[candidates[k]];
+      const blocked = course.group && skippedGroups.has(course.group);
+      if (!blocked && self.fits(units, course)) {
+        yield* extend(k + 1, units + course.units, mask | self.bits[candidates[k]], skippedGroups, skippedUnits);
+      }
+      const skipped = course.group ? new Set([...skippedGroups, course.group]) : skippedGroups;
+      yield* extend(k + 1, units, mask, skipped, blocked ? skippedUnits : [...skippedUnits, course.units]);
+    }
+    yield* extend(0, 0, 0n, new Set(), []);
+  }
+
+  search() {
+    const greedy = this.greedyQuarters();
+    let best = greedy.quarters;
+    const reachable = greedy.mask;
+    const seen = new Map();
+    let expanded = 0;
+    let exhausted = false;
+    let truncated = false;
+
+    const visit = (mask, quarters) => {
+      if (mask === reachable) {
+        if (quarters.length < best.length) best = quarters;
+        return;
+      }
+      if (++expanded > this.nodeLimit) {
+        exhausted = true;
+        return;
+      }
+      const q = quarters.length;
+      const previous = seen.get(mask);
+      if (previous !== undefined && previous <= q) return;
+      seen.set(mask, q);
+
+      const depths = this.depths(mask);
+      if (q + this.lowerBound(mask, depths) >= best.length) return;
+      const available = this.available(mask);
+      if (available.length > BRANCH_WIDTH) truncated = true;
+      const candidates = this.prioritize(available, depths).slice(0, BRANCH_WIDTH);
+      for (const choice of this.quarterChoices(candidates)) {
+        visit(mask | choice, [...quarters, choice]);
+        if (exhausted) return;
+      }
+    };
+
+    // Only courses the greedy pass could place are searched; the rest are unreachable
+    if (reachable === this.full) visit(0n, []);
+    const complete = !exhausted && !truncated;
+    const optimal = reachable === this.full && (complete || best.length === this.lowerBound(0n));
+    return { quarters: best, optimal, expanded };
+  }
+}
@@ -0,0 +1,71 @@
+// Pluggable text-generation client used by the AI endpoints.
+// LLM_PROVIDER=gemini (default) calls Google Generative AI; LLM_PROVIDER=stub answers
+// locally and deterministically so the AI paths can be benchmarked offline.
+
+const GEMINI_MODEL = 'gemini-2.0-flash-lite';
+
+function createGeminiClient() {
+  let modelPromise = null;
+  // Import lazily so the stub path does not need the SDK (or an API key) at all
+  function getModel() {
+    if (!modelPromise) {
+      modelPromise = import('@google/generative-ai').then(({ GoogleGenerativeAI }) => {
+        const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY);
+        return genAI.getGenerativeModel({ model: GEMINI_MODEL });
+      });
+    }
+    return modelPromise;
+  }
+
+  return {
+    name: 'gemini',
+    async generate(prompt) {
+      const model = await getModel();
+      const result = await model.generateContent(prompt);
+      return result.response.text();
+    }
+  };
+}
+
+// Stub model: echoes the encoded candidates back as a ranked filter response.
+// LLM_STUB_LATENCY_MS simulates model latency.
+export function createStubClient(latencyMs = Number(process.env.LLM_STUB_LATENCY_MS) || 0) {
+  return {
+    name: 'stub',
+    calls: 0,
+    async generate(prompt) {
+      this.calls++;
+      if (latencyMs > 0) {
+        await new Promise(resolve => setTimeout(resolve, latencyMs));
+      }
+
+      if (prompt.includes('noEarly')) {
+        return JSON.stringify({ noEarly: false, preferredProfsRatingAbove: 0, avoidDays: [] });
+      }
+
+      const lines = prompt.split('\n').filter(line => /^[A-Z]{2,5} \d+[A-Z]* \| /.test(line));
+      const filtered = lines.map((line, i) => {
+        const [code, title, , , professor] = line.split(' | ');
+        return {
+          course_code: code,
+          relevance_score: Math.round((1 - i / (lines.length + 1)) * 100) / 100,
+          reason: `Matches request: ${title}`,
+          prerequisites_met: true,
+          difficulty: 'intermediate',
+          professor
+        };
+      });
+      return JSON.stringify({
+        filtered_courses: filtered,
+        summary: `Found ${filtered.length} courses that match your request`,
+        recommendations: 'Stub model response'
+      });
+    }
+  };
+}
+
+export function createLLMClient(provider = process.env.LLM_PROVIDER || 'gemini') {
+  if (provider === 'stub') return createStubClient();
+  if (provider === 'gemini') return createGeminiClient();
+  throw new Error(`Unknown LLM_PROVIDER "${provider}"`);
+}
@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+"""
+Unified SQLite catalog store
+
+Ingests sections (course_data), course records and prereq trees (prereqdata),
+programs (prereqdata/departments.json), major and college requirements and RMP
+professors into one indexed database:
+    python catalog_db.py build
+    python catalog_db.py course "CSE 100"
+
+Other scripts query it directly:
+    from catalog_db import connect, get_sections
+    conn = connect()
+    get_sections(conn, 'CSE', '100')
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+import sqlite3
+import time
+
+import schemas
+from terms import discover_term_files
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PUBLIC_DIR = os.path.join(BACKEND_DIR, 'public')
+PREREQ_DIR = os.path.join(PUBLIC_DIR, 'prereqdata')
+COURSE_DATA_DIR = os.path.join(PUBLIC_DIR, 'course_data')
+MAJOR_DIR = os.path.join(PUBLIC_DIR, 'majorreq')
+COLLEGE_DIR = os.path.join(PUBLIC_DIR, 'collegedata')
+PROFESSORS_FILE = os.path.join(BACKEND_DIR, 'rmp_scraper', 'ucsd_all_professors.json')
+DB_FILE = os.path.join(BACKEND_DIR, 'data', 'catalog.db')
+
+NON_COURSE_FILES = {'departments.json', 'statistics.json'}
+
+DEFAULT_TERM = discover_term_files(COURSE_DATA_DIR)[1] or 'FA25'
+
+DAY_CODES = ['M', 'Tu', 'W', 'Th', 'F', 'Sa', 'Su']
+TIME_PATTERN = re.compile(r'(\d{1,2}):(\d{2})([ap])', re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE courses (
+    code TEXT PRIMARY KEY,
+    dept TEXT NOT NULL,
+    number TEXT NOT NULL,
+    title TEXT,
+    units TEXT,
+    description TEXT,
+    prereqs_json TEXT
+);
+CREATE TABLE prereq_edges (
+    course TEXT NOT NULL,
+    prereq TEXT NOT NULL,
+    clause INTEGER NOT NULL,
+    kind TEXT NOT NULL
+);
+CREATE TABLE sections (
+    id INTEGER PRIMARY KEY,
+    term TEXT NOT NULL,
+    dept TEXT NOT NULL,
+    code TEXT NOT NULL,
+    section_type TEXT,
+    days TEXT,
+    times TEXT,
+    start_min INTEGER,
+    end_min INTEGER,
+    building TEXT,
+    room TEXT,
+    professor TEXT,
+    professor_id TEXT,
+    seats_remaining INTEGER,
+    spaces INTEGER,
+    waitlist INTEGER
+);
+CREATE TABLE section_meetings (
+    section_id INTEGER NOT NULL,
+    day TEXT NOT NULL,
+    start_min INTEGER NOT NULL,
+    end_min INTEGER NOT NULL
+);
+CREATE TABLE professors (
+    id TEXT PRIMARY KEY,
+    legacy_id INTEGER,
+    full_name TEXT,
+    department TEXT,
+    avg_rating REAL,
+    num_ratings INTEGER,
+    would_take_again REAL,
+    avg_difficulty REAL
+);
+CREATE TABLE programs (
+    code TEXT PRIMARY KEY,
+    name TEXT,
+    link TEXT
+);
+CREATE TABLE program_courses (
+    program TEXT NOT NULL,
+    course TEXT NOT NULL
+);
+CREATE TABLE majors (
+    code TEXT PRIMARY KEY,
+    name TEXT,
+    catalog_year TEXT,
+    requirements_json TEXT
+);
+CREATE TABLE colleges (
+    name TEXT PRIMARY KEY,
+    catalog_year TEXT,
+    requirements_json TEXT
+);
+"""
+
+# Built after the bulk insert; cheaper than maintaining them row by row
+INDEXES = """
+CREATE INDEX idx_courses_dept ON courses (dept, number);
+CREATE INDEX idx_prereq_edges_course ON prereq_edges (course);
+CREATE INDEX idx_prereq_edges_prereq ON prereq_edges (prereq);
+CREATE INDEX idx_sections_course ON sections (term, dept, code);
+CREATE INDEX idx_sections_professor ON sections (professor_id);
+CREATE INDEX idx_sections_professor_name ON sections (professor);
+CREATE INDEX idx_meetings_day_time ON section_meetings (day, start_min, end_min);
+CREATE INDEX idx_meetings_section ON section_meetings (section_id);
+CREATE INDEX idx_professors_name ON professors (full_name);
+CREATE INDEX idx_program_courses_course ON program_courses (course);
+CREATE INDEX idx_program_courses_program ON program_courses (program);
+"""
+
+
+def parse_days(days):
+    """Split a days string like 'TuTh' into ['Tu', 'Th'] (mirrors parseDays in server.js)"""
+    if not isinstance(days, str):
+        return list(days or [])
+    result = []
+    remaining = days
+    for day in DAY_CODES:
+        if day in remaining:
+            result.append(day)
+            remaining = remaining.replace(day, '', 1)
+    return result
+
+
+def parse_time_range(times):
+    """Convert '3:30p-4:50p' into minutes after midnight, e.g. (930, 1010)"""
+    if not isinstance(times, str) or '-' not in times:
+        return None, None
+    start_text, _, end_text = times.partition('-')
+    minutes = []
+    for text in (start_text, end_text):
+        match = TIME_PATTERN.search(text)
+        if not match:
+            return None, None
+        hour, minute, ampm = int(match.group(1)), int(match.group(2)), match.group(3).lower()
+        if ampm == 'p' and hour != 12:
+            hour += 12
+        if ampm == 'a' and hour == 12:
+            hour = 0
+        minutes.append(hour * 60 + minute)
+    return minutes[0], minutes[1]
+
+
+def parse_seats(value):
+    """
+    Parse the scraper's seat strings
+
+    open_browser() stores 'Waitlist(N)' as '-N', so a negative count means a full
+    section with N students waitlisted.
+
+    Returns:
+        tuple: (seats_remaining, waitlist), either may be None when blank
+    """
+    text = str(value).strip() if value is not None else ''
+    if not text or not re.fullmatch(r'-?\d+', text):
+        return None, None
+    number = int(text)
+    if number < 0:
+        return 0, -number
+    return number, 0
+
+
+def parse_int(value):
+    text = str(value).strip() if value is not None else ''
+    return int(text) if text.isdigit() else None
+
+
+def iter_prereq_edges(tree, clause=0, kind='all'):
+    """
+    Flatten a prereq tree into (prereq, clause, kind) edges
+
+    Top-level 'all' children become numbered clauses; leaves under a 'one'
+    node share their clause with kind 'one'.
+    """
+    if isinstance(tree, str):
+        yield tree, clause, kind
+    elif isinstance(tree, list):
+        for item in tree:
+            yield from iter_prereq_edges(item, clause, kind)
+    elif schemas.is_group(tree):
+        if tree.type == 'all':
+            for i, item in enumerate(tree.courses):
+                yield from iter_prereq_edges(item, clause if kind == 'one' else i, kind)
+        else:
+            for item in tree.courses:
+                yield from iter_prereq_edges(item, clause, 'one')
+
+
+def insert_courses(conn):
+    course_rows = []
+    edge_rows = []
+    for path in sorted(glob.glob(os.path.join(PREREQ_DIR, '*.json'))):
+        if os.path.basename(path) in NON_COURSE_FILES:
+            continue
+        record = schemas.load(path, schemas.CourseRecord)
+        code = record.code
+        if not code:
+            continue
+        prereqs = record.prereqs
+        course_rows.append((
+            code,
+            record.dept or code.split(' ')[0],
+            code.split(' ', 1)[-1],
+            record.title,
+            record.units,
+            record.description,
+            schemas.dumps(prereqs).decode() if prereqs else None,
+        ))
+        if prereqs:
+            for prereq, clause, kind in iter_prereq_edges(prereqs):
+                edge_rows.append((code, prereq, clause, kind))
+
+    conn.executemany("INSERT OR REPLACE INTO courses VALUES (?, ?, ?, ?, ?, ?, ?)", course_rows)
+    conn.executemany("INSERT INTO prereq_edges VALUES (?, ?, ?, ?)", edge_rows)
+    return len(course_rows), len(edge_rows)
+
+
+def insert_sections(conn, course_file, term):
+    section_rows = []
+    meeting_rows = []
+    section_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM sections").fetchone()[0]
+    for dept, dept_courses in schemas.load(course_file, schemas.CourseData).items():
+        for course_num, sections in dept_courses.items():
+            for section in sections:
+                section_id += 1
+                start_min, end_min = parse_time_range(section.times)
+                seats_remaining, waitlist = parse_seats(section.seatsRemaining)
+                rating = section.professor_rating
+                section_rows.append((
+                    section_id,
+                    term,
+                    dept,
+                    course_num,
+                    section.sectionType,
+                    section.days,
+                    section.times,
+                    start_min,
+                    end_min,
+                    section.buildingName,
+                    section.roomNumber,
+                    section.professor,
+                    (rating.professor_id or None) if rating else None,
+                    seats_remaining,
+                    parse_int(section.spaces),
+                    waitlist,
+                ))
+                if start_min is not None:
+                    for day in parse_days(section.days):
+                        meeting_rows.append((section_id, day, start_min, end_min))
+
+    conn.executemany(
+        "INSERT INTO sections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", section_rows)
+    conn.executemany("INSERT INTO section_meetings VALUES (?, ?, ?, ?)", meeting_rows)
+    return len(section_rows)
+
+
+def insert_professors(conn):
+    if not os.path.exists(PROFESSORS_FILE):
+        return 0
+    rows = [
+        (
+            prof.id,
+            prof.legacy_id,
+            prof.full_name,
+            prof.department,
+            prof.avg_rating,
+            prof.num_ratings,
+            prof.would_take_again_percent,
+            prof.avg_difficulty,
+        )
+        for prof in schemas.load(PROFESSORS_FILE, schemas.Professors)
+        if prof.id
+    ]
+    conn.executemany("INSERT OR REPLACE INTO professors VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+
+def insert_programs(conn):
+    departments_file = os.path.join(PREREQ_DIR, 'departments.json')
+    if not os.path.exists(departments_file):
+        return 0
+    programs = schemas.load(departments_file, schemas.Programs)
+    conn.executemany(
+        "INSERT OR REPLACE INTO programs VALUES (?, ?, ?)",
+        [(code, p.name, p.link) for code, p in programs.items()])
+    conn.executemany(
+        "INSERT INTO program_courses VALUES (?, ?)",
+        [(code, course) for code, p in programs.items() for course in p.courses])
+    return len(programs)
+
+
+def insert_requirements(conn):
+    majors = []
+    for path in sorted(glob.glob(os.path.join(MAJOR_DIR, '*.json'))):
+        data = schemas.load(path, schemas.MajorRequirements)
+        code = os.path.splitext(os.path.basename(path))[0].upper()
+        majors.append((code, data.major, data.catalog_year, schemas.dumps(data.requirements).decode()))
+    conn.executemany("INSERT OR REPLACE INTO majors VALUES (?, ?, ?, ?)", majors)
+
+    colleges = []
+    for path in sorted(glob.glob(os.path.join(COLLEGE_DIR, '*.json'))):
+        data = schemas.load(path, schemas.CollegeRequirements)
+        colleges.append((data.college, data.catalog_year, schemas.dumps(data.requirements).decode()))
+    conn.executemany("INSERT OR REPLACE INTO colleges VALUES (?, ?, ?)", colleges)
+    return len(majors), len(colleges)
+
+
+def build_database(db_file=DB_FILE, course_files=None):
+    """
+    Rebuild the catalog database from scratch
+
+    The database is written to a temporary file and renamed into place, so
+    readers never see a half-built catalog.
+
+    Args:
+        db_file (str): Destination path
+        course_files (dict): {term: path to course_data json}; defaults to every term
+            in public/course_data
+
+    Returns:
+        dict: Row counts per table
+    """
+    if course_files is None:
+        course_files = discover_term_files(COURSE_DATA_DIR)[0]
+
+    os.makedirs(os.path.dirname(db_file), exist_ok=True)
+    tmp_file = db_file + '.tmp'
+    if os.path.exists(tmp_file):
+        os.remove(tmp_file)
+
+    conn = sqlite3.connect(tmp_file)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    counts = {}
+    try:
+        with conn:
+            conn.executescript(SCHEMA)
+        with conn:
+            counts['courses'], counts['prereq_edges'] = insert_courses(conn)
+            counts['sections'] = sum(
+                insert_sections(conn, path, term) for term, path in course_files.items())
+            counts['professors'] = insert_professors(conn)
+            counts['programs'] = insert_programs(conn)
+            counts['majors'], counts['colleges'] = insert_requirements(conn)
+        with conn:
+            conn.executescript(INDEXES)
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    os.replace(tmp_file, db_file)
+    return counts
+
+
+def connect(db_file=DB_FILE):
+    """Open the catalog read-only with dict-like rows"""
+    conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def get_course(conn, code):
+    """Course record with its prereq tree decoded, or None"""
+    row = conn.execute("SELECT * FROM courses WHERE code = ?", (code,)).fetchone()
+    if not row:
+        return None
+    course = dict(row)
+    course['prereqs'] = json.loads(course.pop('prereqs_json')) if row['prereqs_json'] else None
+    return course
+
+
+def get_sections(conn, dept, code, term=DEFAULT_TERM):
+    """All sections of one course, joined with the matched RMP professor"""
+    return [dict(row) for row in conn.execute(
+        """
+        SELECT s.*, p.avg_rating, p.avg_difficulty, p.num_ratings, p.would_take_again
+        FROM sections s LEFT JOIN professors p ON p.id = s.professor_id
+        WHERE s.term = ? AND s.dept = ? AND s.code = ?
+        ORDER BY s.id
+        """, (term, dept, code))]
+
+
+def get_dependents(conn, code):
+    """Courses that list `code` anywhere in their prerequisites"""
+    return [row[0] for row in conn.execute(
+        "SELECT DISTINCT course FROM prereq_edges WHERE prereq = ? ORDER BY course", (code,))]
+
+
+def get_professor_sections(conn, professor_id, term=DEFAULT_TERM):
+    return [dict(row) for row in conn.execute(
+        "SELECT * FROM sections WHERE professor_id = ? AND term = ? ORDER BY dept, code",
+        (professor_id, term))]
+
+
+def get_sections_on_day(conn, day, start_min, end_min, term=DEFAULT_TERM):
+    """Sections meeting on `day` entirely within [start_min, end_min]"""
+    return [dict(row) for row in conn.execute(
+        """
+        SELECT s.* FROM section_meetings m JOIN sections s ON s.id = m.section_id
+        WHERE m.day = ? AND m.start_min >= ? AND m.end_min <= ? AND s.term = ?
+        ORDER BY m.start_min
+        """, (day, start_min, end_min, term))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the SQLite catalog')
+    parser.add_argument('--db', default=DB_FILE)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='Rebuild the database from public/ and rmp_scraper/')
+    course_parser = subparsers.add_parser('course', help='Show a course, its sections and dependents')
+    course_parser.add_argument('code')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        counts = build_database(args.db)
+        elapsed = time.perf_counter() - start
+        print(f"✅ Built {args.db} in {elapsed:.2f}s")
+        for table, count in counts.items():
+            print(f"   {table}: {count}")
+        return
+
+    conn = connect(args.db)
+    course = get_course(conn, args.code)
+    if not course:
+        print(f"❌ {args.code} not found")
+        return
+    print(f"{course['code']}: {course['title']} ({course['units']} units)")
+    print(f"   Prereqs: {json.dumps(course['prereqs'])}")
+    print(f"   Required by: {', '.join(get_dependents(conn, args.code)) or 'none'}")
+    dept, number = args.code.split(' ', 1)
+    for section in get_sections(conn, dept, number):
+        rating = f" ★ {section['avg_rating']}" if section['avg_rating'] else ''
+        print(f"   {section['section_type']} {section['days']} {section['times']} {section['professor']}{rating}")
+
+
+if __name__ == "__main__":
+    main()
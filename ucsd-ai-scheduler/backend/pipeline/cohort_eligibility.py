@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Batch prerequisite eligibility for a whole cohort of students
+
+Each course becomes a bit column over the cohort (one bit per student), so a
+prereq tree from public/prereqdata is evaluated for every student at once with
+bitwise AND/OR instead of one /api/suggest call per student:
+    python cohort_eligibility.py --cohort cohort.json "CSE 100" "CSE 101"
+    python cohort_eligibility.py --synthetic 5000 "CSE 100"
+
+cohort.json maps student ids to completed course codes ({"A123": ["CSE 11", ...]}).
+Columns are NumPy packed bit arrays when NumPy is installed, Python ints otherwise.
+"""
+
+import argparse
+import os
+import random
+import time
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+import schemas
+from course_search import load_course_records
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PREREQ_DIR = os.path.join(BACKEND_DIR, 'public', 'prereqdata')
+
+
+class NumpyColumns:
+    """Course columns as np.packbits rows of a students x courses boolean matrix"""
+
+    def __init__(self, cohort, vocabulary):
+        self.size = len(cohort)
+        matrix = np.zeros((len(vocabulary), self.size), dtype=bool)
+        for student, completed in enumerate(cohort):
+            rows = [vocabulary[code] for code in completed if code in vocabulary]
+            matrix[rows, student] = True
+        self.rows = np.packbits(matrix, axis=1)
+        self.empty = np.zeros(self.rows.shape[1], dtype=np.uint8)
+        self.full = np.packbits(np.ones(self.size, dtype=bool))
+
+    def column(self, index):
+        return self.rows[index]
+
+    def to_list(self, bits):
+        return np.unpackbits(bits, count=self.size).astype(bool).tolist()
+
+    def stack(self, columns):
+        """students x courses boolean matrix"""
+        return np.unpackbits(np.stack(columns), axis=1, count=self.size).astype(bool).T
+
+
+class IntColumns:
+    """Course columns as Python ints with bit i set for student i"""
+
+    def __init__(self, cohort, vocabulary):
+        self.size = len(cohort)
+        self.rows = [0] * len(vocabulary)
+        for student, completed in enumerate(cohort):
+            bit = 1 << student
+            for code in completed:
+                if code in vocabulary:
+                    self.rows[vocabulary[code]] |= bit
+        self.empty = 0
+        self.full = (1 << self.size) - 1
+
+    def column(self, index):
+        return self.rows[index]
+
+    def to_list(self, bits):
+        return [bool(bits >> student & 1) for student in range(self.size)]
+
+    def stack(self, columns):
+        """students x courses list of lists"""
+        unpacked = [self.to_list(bits) for bits in columns]
+        return [list(row) for row in zip(*unpacked)]
+
+
+class CohortEligibility:
+    """
+    Evaluate prereq trees for a cohort of students in one pass per course
+
+    Args:
+        cohort (list): Completed course codes per student
+        prereqs (dict): Course code -> prereq tree (None, a code, or a schemas.RequirementGroup)
+        use_numpy (bool): Use NumPy bit arrays when available (default: True)
+    """
+
+    def __init__(self, cohort, prereqs, use_numpy=True):
+        cohort = [list(completed) for completed in cohort]
+        self.prereqs = prereqs
+        self.vocabulary = {}
+        for completed in cohort:
+            for code in completed:
+                self.vocabulary.setdefault(code, len(self.vocabulary))
+        backend = NumpyColumns if use_numpy and NUMPY_AVAILABLE else IntColumns
+        self.columns = backend(cohort, self.vocabulary)
+        self._satisfied = {}
+
+    @classmethod
+    def from_catalog(cls, cohort, prereq_dir=PREREQ_DIR, **kwargs):
+        prereqs = {r.code: r.prereqs for r in load_course_records(prereq_dir)}
+        return cls(cohort, prereqs, **kwargs)
+
+    def completed(self, code):
+        index = self.vocabulary.get(code)
+        return self.columns.empty if index is None else self.columns.column(index)
+
+    def evaluate(self, node):
+        """Bit column of the students who satisfy a prereq tree"""
+        if not node:
+            return self.columns.full
+        if isinstance(node, str):
+            return self.completed(node)
+        children = [self.evaluate(child) for child in node.courses]
+        if not children:
+            return self.columns.full
+        if node.type == 'all':
+            result = self.columns.full
+            for child in children:
+                result = result & child
+            return result
+        if node.type == 'two' and len(children) >= 2:
+            # Students with at least two: set once a second satisfied child is seen
+            one, two = self.columns.empty, self.columns.empty
+            for child in children:
+                two = two | (one & child)
+                one = one | child
+            return two
+        result = self.columns.empty
+        for child in children:
+            result = result | child
+        return result
+
+    def satisfied(self, code):
+        """Bit column of the students who meet the prereqs of a course (memoized)"""
+        if code not in self._satisfied:
+            self._satisfied[code] = self.evaluate(self.prereqs.get(code))
+        return self._satisfied[code]
+
+    def eligible(self, code, include_completed=False):
+        """Bit column of the students who can enroll in a course"""
+        bits = self.satisfied(code)
+        if not include_completed:
+            bits = bits & ~self.completed(code)
+        return bits
+
+    def matrix(self, courses, include_completed=False):
+        """
+        Eligibility of every student for every course
+
+        Args:
+            courses (list): Course codes (columns of the result)
+            include_completed (bool): Count students who already took a course as eligible
+
+        Returns:
+            students x courses boolean matrix (ndarray with NumPy, else list of lists)
+        """
+        return self.columns.stack([self.eligible(code, include_completed) for code in courses])
+
+    def eligible_students(self, code, include_completed=False):
+        """Indices of the students who can enroll in a course"""
+        flags = self.columns.to_list(self.eligible(code, include_completed))
+        return [student for student, flag in enumerate(flags) if flag]
+
+
+def synthetic_cohort(size, prereqs, seed=0):
+    """Students with random completed lists drawn from courses that appear as prereqs"""
+    def leaves(node):
+        if isinstance(node, str):
+            yield node
+        elif node:
+            for child in node.courses:
+                yield from leaves(child)
+
+    rng = random.Random(seed)
+    pool = sorted({code for tree in prereqs.values() for code in leaves(tree)})
+    return [rng.sample(pool, rng.randint(5, 40)) for _ in range(size)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check which students in a cohort can enroll in courses')
+    parser.add_argument('courses', nargs='+', help='Course codes, e.g. "CSE 100"')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--cohort', help='JSON file mapping student ids to completed courses')
+    source.add_argument('--synthetic', type=int, metavar='N', help='Generate N random students instead')
+    parser.add_argument('--include-completed', action='store_true',
+                        help='Count students who already took a course as eligible')
+    parser.add_argument('--no-numpy', action='store_true', help='Use the pure Python backend')
+    parser.add_argument('--output', help='Write eligible student ids per course as JSON')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    prereqs = {r.code: r.prereqs for r in load_course_records()}
+    if args.cohort:
+        cohort = schemas.load(args.cohort, schemas.Cohort)
+    else:
+        cohort = {f"S{i:05d}": completed for i, completed in enumerate(synthetic_cohort(args.synthetic, prereqs))}
+    student_ids = list(cohort)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    unknown = [code for code in args.courses if code not in prereqs]
+    if unknown:
+        print(f"⚠️  Not in the catalog (treated as having no prereqs): {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    evaluator = CohortEligibility(cohort.values(), prereqs, use_numpy=not args.no_numpy)
+    result = {code: [student_ids[i] for i in evaluator.eligible_students(code, args.include_completed)]
+              for code in args.courses}
+    eval_ms = (time.perf_counter() - start) * 1000
+
+    backend = type(evaluator.columns).__name__
+    print(f"👥 {len(student_ids)} students, {len(evaluator.vocabulary)} distinct courses ({backend})")
+    for code, students in result.items():
+        print(f"   {code:<10} {len(students):>6} eligible")
+    print(f"⏱️  Loaded catalog in {load_ms:.0f} ms, evaluated in {eval_ms:.1f} ms")
+
+    if args.output:
+        schemas.dump(result, args.output, indent=2)
+        print(f"💾 Saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
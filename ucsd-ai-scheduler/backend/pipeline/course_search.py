@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+BM25 full-text search over the course catalog in public/prereqdata
+
+Build the index once, then query it locally or through /api/search:
+    python course_search.py build
+    python course_search.py query "machine learn* dept:CSE level:upper"
+"""
+
+import argparse
+import bisect
+import glob
+import gzip
+import json
+import math
+import os
+import re
+import time
+from collections import defaultdict
+
+import schemas
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PREREQ_DIR = os.path.join(BACKEND_DIR, 'public', 'prereqdata')
+INDEX_FILE = os.path.join(BACKEND_DIR, 'public', 'search', 'course_index.json.gz')
+
+# Files in prereqdata that are not course records
+NON_COURSE_FILES = {'departments.json', 'statistics.json'}
+
+INDEX_VERSION = 1
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Term frequency multipliers per field (a simple BM25F)
+FIELD_WEIGHTS = {'code': 5, 'title': 3, 'description': 1}
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'course', 'courses', 'for',
+    'from', 'in', 'into', 'is', 'it', 'its', 'may', 'of', 'on', 'or', 'such',
+    'that', 'the', 'their', 'this', 'to', 'will', 'with', 'students', 'topics',
+    'include', 'including', 'prerequisites', 'consent', 'instructor'
+}
+
+TOKEN_SPLIT = re.compile(r'[^a-z0-9]+')
+UNITS_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+COURSE_NUMBER = re.compile(r'(\d+)')
+FILTER_FIELDS = {'dept', 'units', 'level'}
+
+
+def normalize_token(token):
+    """Fold simple plurals so 'algorithms' matches 'algorithm' (mirrored in courseSearch.js)"""
+    if len(token) > 4 and token.endswith('s') and not token.endswith('ss'):
+        return token[:-1]
+    return token
+
+
+def tokenize(text):
+    """Split text into normalized index terms"""
+    if not text:
+        return []
+    return [normalize_token(t) for t in TOKEN_SPLIT.split(text.lower()) if t and t not in STOPWORDS]
+
+
+def parse_units(units):
+    """Turn catalog unit strings ('4', '1–4', '2 or 4', '4-4-4') into a [min, max] range"""
+    numbers = [float(n) for n in UNITS_NUMBER.findall(units or '')]
+    if not numbers:
+        return [None, None]
+    return [min(numbers), max(numbers)]
+
+
+def course_level(code):
+    """lower (<100), upper (100-199) or grad (200+) from the course number"""
+    match = COURSE_NUMBER.search(code.split(' ', 1)[-1])
+    if not match:
+        return None
+    number = int(match.group(1))
+    if number < 100:
+        return 'lower'
+    return 'upper' if number < 200 else 'grad'
+
+
+def load_course_records(prereq_dir=PREREQ_DIR):
+    """Load every course record from prereqdata as schemas.CourseRecord, sorted by code"""
+    records = []
+    for path in glob.glob(os.path.join(prereq_dir, '*.json')):
+        if os.path.basename(path) in NON_COURSE_FILES:
+            continue
+        record = schemas.load(path, schemas.CourseRecord)
+        if record.code:
+            records.append(record)
+    records.sort(key=lambda r: r.code)
+    return records
+
+
+def build_index(records):
+    """
+    Build a BM25 index with precomputed per-posting scores
+
+    Because idf and document lengths are fixed once the index is built, each
+    posting stores its final BM25 contribution; a query only sums postings.
+
+    Args:
+        records (list): schemas.CourseRecord entries
+
+    Returns:
+        dict: Serializable index
+    """
+    doc_term_freqs = []
+    doc_lengths = []
+    for record in records:
+        freqs = defaultdict(int)
+        length = 0
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(getattr(record, field)):
+                freqs[term] += weight
+                length += weight
+        doc_term_freqs.append(freqs)
+        doc_lengths.append(length)
+
+    num_docs = len(records)
+    avg_length = sum(doc_lengths) / num_docs if num_docs else 0
+
+    postings = defaultdict(list)
+    for doc_id, freqs in enumerate(doc_term_freqs):
+        for term, tf in freqs.items():
+            postings[term].append((doc_id, tf))
+
+    terms = {}
+    for term, plist in postings.items():
+        idf = math.log(1 + (num_docs - len(plist) + 0.5) / (len(plist) + 0.5))
+        doc_deltas = []
+        scores = []
+        previous = 0
+        for doc_id, tf in plist:
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_lengths[doc_id] / avg_length)
+            doc_deltas.append(doc_id - previous)
+            scores.append(round(idf * tf * (BM25_K1 + 1) / (tf + norm), 3))
+            previous = doc_id
+        terms[term] = [doc_deltas, scores]
+
+    docs = []
+    for record in records:
+        units_min, units_max = parse_units(record.units)
+        docs.append([
+            record.code,
+            record.title,
+            record.dept,
+            record.units,
+            units_min,
+            units_max,
+            course_level(record.code),
+        ])
+
+    return {
+        'version': INDEX_VERSION,
+        'built_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'stopwords': sorted(STOPWORDS),
+        'docs': docs,
+        'terms': terms,
+    }
+
+
+def save_index(index, path=INDEX_FILE):
+    """Write the index as gzipped compact JSON (readable from Python and Node)"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    data = json.dumps(index, separators=(',', ':')).encode('utf-8')
+    with gzip.open(path, 'wb', compresslevel=9) as f:
+        f.write(data)
+    return os.path.getsize(path)
+
+
+def parse_query(query):
+    """Split a query into free-text terms, prefix terms and field filters"""
+    terms = []
+    prefixes = []
+    filters = {}
+    for raw in (query or '').split():
+        field, sep, value = raw.partition(':')
+        if sep and field.lower() in FILTER_FIELDS and value:
+            filters[field.lower()] = value
+            continue
+        if raw.endswith('*') and len(raw) > 1:
+            prefix = TOKEN_SPLIT.sub('', raw[:-1].lower())
+            if prefix:
+                prefixes.append(prefix)
+            continue
+        terms.extend(tokenize(raw))
+    return terms, prefixes, filters
+
+
+class CourseSearchIndex:
+    """In-memory view of a built index"""
+
+    def __init__(self, index):
+        self.docs = index['docs']
+        self.postings = {}
+        for term, (doc_deltas, scores) in index['terms'].items():
+            doc_ids = []
+            current = 0
+            for delta in doc_deltas:
+                current += delta
+                doc_ids.append(current)
+            self.postings[term] = (doc_ids, scores)
+        self.sorted_terms = sorted(self.postings)
+
+    @classmethod
+    def load(cls, path=INDEX_FILE):
+        with gzip.open(path, 'rb') as f:
+            return cls(json.loads(f.read()))
+
+    def expand_prefix(self, prefix, max_terms=50):
+        """Index terms starting with prefix, via binary search over the sorted vocabulary"""
+        start = bisect.bisect_left(self.sorted_terms, prefix)
+        expanded = []
+        for term in self.sorted_terms[start:start + max_terms]:
+            if not term.startswith(prefix):
+                break
+            expanded.append(term)
+        return expanded
+
+    def matches_filters(self, doc, filters):
+        code, _title, dept, _units, units_min, units_max, level = doc
+        if 'dept' in filters and dept.upper() != filters['dept'].upper():
+            return False
+        if 'level' in filters and level != filters['level'].lower():
+            return False
+        if 'units' in filters:
+            try:
+                wanted = float(filters['units'])
+            except ValueError:
+                return False
+            if units_min is None or not units_min <= wanted <= units_max:
+                return False
+        return True
+
+    def search(self, query, limit=10, **filters):
+        """
+        Rank courses for a query
+
+        Args:
+            query (str): Free text; 'word*' for prefixes, 'dept:CSE', 'units:4',
+                'level:lower|upper|grad' as filters
+            limit (int): Maximum results
+            **filters: Same filters as keyword arguments (dept=, units=, level=)
+
+        Returns:
+            list: Result dicts ordered by descending score
+        """
+        terms, prefixes, query_filters = parse_query(query)
+        query_filters.update({k: str(v) for k, v in filters.items() if v is not None})
+
+        scores = defaultdict(float)
+        for term in terms:
+            posting = self.postings.get(term)
+            if posting:
+                for doc_id, score in zip(*posting):
+                    scores[doc_id] += score
+        for prefix in prefixes:
+            # A document matching several expansions of one prefix only counts its best one
+            best = {}
+            for term in self.expand_prefix(prefix):
+                for doc_id, score in zip(*self.postings[term]):
+                    if score > best.get(doc_id, 0):
+                        best[doc_id] = score
+            for doc_id, score in best.items():
+                scores[doc_id] += score
+
+        if not terms and not prefixes:
+            # Filter-only query: list matching courses in catalog order
+            candidates = ((doc_id, 0.0) for doc_id in range(len(self.docs)))
+        else:
+            candidates = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+        results = []
+        for doc_id, score in candidates:
+            doc = self.docs[doc_id]
+            if query_filters and not self.matches_filters(doc, query_filters):
+                continue
+            results.append({
+                'code': doc[0],
+                'title': doc[1],
+                'dept': doc[2],
+                'units': doc[3],
+                'score': round(score, 3),
+            })
+            if len(results) >= limit:
+                break
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build or query the course search index')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('build', help='Index every course in public/prereqdata')
+    query_parser = subparsers.add_parser('query', help='Search the built index')
+    query_parser.add_argument('text')
+    query_parser.add_argument('--limit', type=int, default=10)
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        records = load_course_records()
+        index = build_index(records)
+        size = save_index(index)
+        elapsed = time.perf_counter() - start
+        print(f"✅ Indexed {len(records)} courses, {len(index['terms'])} terms in {elapsed:.2f}s")
+        print(f"💾 Saved {size / 1024:.0f} KB to {INDEX_FILE}")
+        return
+
+    index = CourseSearchIndex.load()
+    start = time.perf_counter()
+    results = index.search(args.text, limit=args.limit)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    for result in results:
+        print(f"   {result['score']:7.3f}  {result['code']:<10} {result['title']} ({result['units']} units)")
+    print(f"🔍 {len(results)} results in {elapsed_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
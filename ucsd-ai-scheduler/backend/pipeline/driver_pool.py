@@ -0,0 +1,186 @@
+"""
+Shared Chrome driver factory and pool for the Selenium scrapers
+
+`ChromeDriverManager().install()` does a version check (and maybe a download)
+every call, and each new Chrome is a cold start. Here the resolved chromedriver
+path is cached on disk, and DriverPool keeps warm headless sessions that terms
+and retries reuse:
+    pool = DriverPool(size=2, metrics=metrics)
+    with pool.session() as driver:
+        driver.get(url)
+    pool.close()
+
+Selenium and webdriver_manager are only imported when a driver is started, so
+modules that just need the scrapers' data classes import instantly.
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from run_metrics import instrument_driver
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+DRIVER_CACHE_FILE = os.path.join(BACKEND_DIR, 'data', 'chromedriver_path.json')
+# Re-run webdriver_manager after this long in case Chrome was updated
+DRIVER_CACHE_TTL = 7 * 24 * 3600
+
+DEFAULT_CHROME_ARGS = ['--headless', '--no-sandbox', '--disable-dev-shm-usage']
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def resolve_driver_path(refresh=False):
+    """
+    Path of the chromedriver binary
+
+    Uses $CHROMEDRIVER_PATH if set, then the cached path from a previous run, and
+    only falls back to webdriver_manager when neither is usable.
+
+    Args:
+        refresh (bool): Ignore the cache and ask webdriver_manager again
+
+    Returns:
+        str: Executable path
+    """
+    global _driver_path
+    if os.environ.get('CHROMEDRIVER_PATH'):
+        return os.environ['CHROMEDRIVER_PATH']
+
+    with _driver_path_lock:
+        if _driver_path and not refresh:
+            return _driver_path
+
+        if not refresh and os.path.exists(DRIVER_CACHE_FILE):
+            with open(DRIVER_CACHE_FILE, 'r') as f:
+                cached = json.load(f)
+            fresh = time.time() - cached.get('resolvedAt', 0) < DRIVER_CACHE_TTL
+            if fresh and os.path.exists(cached.get('path', '')):
+                _driver_path = cached['path']
+                return _driver_path
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        _driver_path = ChromeDriverManager().install()
+        os.makedirs(os.path.dirname(DRIVER_CACHE_FILE), exist_ok=True)
+        tmp_file = DRIVER_CACHE_FILE + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump({'path': _driver_path, 'resolvedAt': time.time()}, f)
+        os.replace(tmp_file, DRIVER_CACHE_FILE)
+        return _driver_path
+
+
+def start_driver(chrome_args=DEFAULT_CHROME_ARGS, metrics=None):
+    """
+    Start a Chrome session with the cached chromedriver
+
+    Args:
+        chrome_args (list): Chrome command-line switches
+        metrics (RunMetrics): Times the start as "driver_start" and counts driver calls
+
+    Returns:
+        WebDriver (instrumented when metrics is given)
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
+    options = Options()
+    for arg in chrome_args:
+        options.add_argument(arg)
+    if metrics is None:
+        return webdriver.Chrome(options=options, service=Service(resolve_driver_path()))
+    with metrics.stage("driver_start"):
+        driver = webdriver.Chrome(options=options, service=Service(resolve_driver_path()))
+    metrics.incr("drivers_started")
+    return instrument_driver(driver, metrics)
+
+
+class DriverPool:
+    """
+    Warm Chrome sessions shared by worker threads
+
+    Sessions are started on first demand up to `size` and handed back after use
+    with cookies cleared. A session that raised is quit and replaced on the next
+    checkout, so a retry never reuses a browser in an unknown state.
+
+    Args:
+        size (int): Maximum concurrent sessions
+        chrome_args (list): Chrome command-line switches
+        metrics (RunMetrics): Optional run metrics for driver starts and reuse
+    """
+
+    def __init__(self, size=1, chrome_args=DEFAULT_CHROME_ARGS, metrics=None):
+        self.size = size
+        self.chrome_args = list(chrome_args)
+        self.metrics = metrics
+        self._idle = []
+        self._started = 0
+        self._ready = threading.Condition()
+        self._closed = False
+
+    def acquire(self, timeout=None):
+        with self._ready:
+            if not self._ready.wait_for(lambda: self._idle or self._started < self.size, timeout):
+                raise TimeoutError(f"no Chrome session free after {timeout}s")
+            if self._idle:
+                if self.metrics:
+                    self.metrics.incr("drivers_reused")
+                return self._idle.pop()
+            self._started += 1
+        try:
+            return start_driver(self.chrome_args, self.metrics)
+        except Exception:
+            with self._ready:
+                self._started -= 1
+                self._ready.notify()
+            raise
+
+    def release(self, driver, broken=False):
+        if not broken and not self._closed:
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+            except Exception:
+                broken = True
+            if not broken:
+                with self._ready:
+                    self._idle.append(driver)
+                    self._ready.notify()
+                return
+        self._discard(driver)
+
+    def _discard(self, driver):
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._ready:
+            self._started -= 1
+            self._ready.notify()
+
+    @contextmanager
+    def session(self, timeout=None):
+        """Check out a driver; it returns to the pool, or is replaced if the block raised"""
+        driver = self.acquire(timeout)
+        try:
+            yield driver
+        except BaseException:
+            self.release(driver, broken=True)
+            raise
+        self.release(driver)
+
+    def close(self):
+        with self._ready:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+Compile catalog prerequisite sentences into structured prereq trees
+
+Reads the "Prerequisites: ..." sentence of every public/prereqdata/<course>.json
+description and produces the same `prereqs` / `coreqs` values the files carry:
+a course code string, or {"type": "all"|"one", "courses": [...]} trees.
+    python prereq_compiler.py check               # compare with the checked-in trees
+    python prereq_compiler.py build --write       # fill in missing trees
+    python prereq_compiler.py build --write --force   # also replace trees that differ
+    python prereq_compiler.py parse "MATH 20C or 31BH, and MATH 18."
+
+Descriptions are cached by content hash in data/prereq_cache.json, so a rebuild
+only re-parses courses whose description changed; large batches are spread over
+a process pool.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+PREREQ_DIR = os.path.join(BACKEND_DIR, 'public', 'prereqdata')
+CACHE_FILE = os.path.join(BACKEND_DIR, 'data', 'prereq_cache.json')
+# Bump whenever parsing changes so cached results are recompiled
+COMPILER_VERSION = 1
+# Below this many changed descriptions a process pool costs more than it saves
+POOL_THRESHOLD = 2000
+
+PREREQ_SENTENCE = re.compile(r'Prerequisites?:\s*(.*)', re.S)
+COREQ_SENTENCE = re.compile(r'Corequisites?:\s*(.*)', re.S)
+# Sentence end: a period followed by whitespace and an uppercase letter, "(" or the end
+SENTENCE_END = re.compile(r'\.(?=\s+[A-Z(]|\s*$)')
+DEPT = r'[A-Z]{2,5}'
+NUMBER = r'\d{1,3}[A-Z]{0,3}(?:[-–][A-Z]{1,3})*'
+COURSE = re.compile(rf'\b({DEPT})\s+({NUMBER})\b')
+BARE_NUMBER = re.compile(rf'^({NUMBER})$')
+TRAILING_DEPT = re.compile(rf'\b({DEPT})\s*$')
+# Separators, with an Oxford comma kept attached to its conjunction
+SEPARATOR = re.compile(r'(,\s*(?:and|or)\b|,|\band\b|\bor\b|/|&)')
+# Precedence, loosest first: "and", then "or", then "/"
+PRECEDENCE = ('and', 'or', '/')
+PLACEHOLDER = re.compile(r'§(\d+)')
+PARENTHESES = re.compile(r'\(([^()]*)\)')
+# "two from COMM 100A, 100B, 100C" -> {"type": "two", ...}
+CHOOSE = re.compile(rf'\b(?:at least )?(one|two) (?:of|from) ((?:{DEPT}\s+)?{NUMBER}(?:\s*,\s*(?:and\s+|or\s+)?(?:{DEPT}\s+)?{NUMBER})*)')
+# "ECE 101 and 102 with grades of C– or better"
+QUALIFIER = re.compile(r'\s+with (?:a )?(?:minimum )?grades? of\b.*$|\s+(?:previously|concurrently)\b.*$', re.I)
+SUFFIX_LETTER = re.compile(r'^[A-Z]{1,2}$')
+FILLER = re.compile(r'^(?:either|both|the|plus|(?:successful\s+)?completion of)\s+', re.I)
+ONE_OF = re.compile(r'\b(?:(?:any|choose)\s+)?one of the following(?: courses)?\b', re.I)
+# Clauses that name courses without requiring them first: corequisites,
+# recommendations and credit exclusions
+NOT_REQUIRED = re.compile(r'\bconcurrent(?:ly)? enroll|\bcorequisite\b|\brecommended\b|\breceive credit\b', re.I)
+# Looser than COURSE, to flag references the parser skipped ("Phil 209A", "Physics 1A")
+LIKELY_COURSE = re.compile(r'\b[A-Z][A-Za-z]{1,9}\s\d{1,3}[A-Z]{0,3}\b')
+
+
+def first_sentence(text):
+    match = SENTENCE_END.search(text)
+    return text[:match.start()] if match else text.rstrip('. ')
+
+
+def expand_number(number):
+    """'185A-B-C' -> ['185A', '185B', '185C']; '2A-C' -> ['2A', '2B', '2C']"""
+    parts = re.split(r'[-–]', number)
+    if len(parts) == 1:
+        return parts
+    base = re.match(r'\d+', parts[0]).group(0)
+    first = parts[0][len(base):]
+    if len(parts) == 2 and len(first) == 1 and len(parts[1]) == 1 and parts[1] > first:
+        return [base + chr(c) for c in range(ord(first), ord(parts[1]) + 1)]
+    return [parts[0]] + [base + suffix for suffix in parts[1:]]
+
+
+def simplify(node_type, children):
+    """Flatten same-type nesting, drop duplicates and collapse single children"""
+    courses = []
+    for child in children:
+        if child is None:
+            continue
+        if isinstance(child, dict) and child['type'] == node_type and node_type != 'two':
+            items = child['courses']
+        else:
+            items = [child]
+        for item in items:
+            if item not in courses:
+                courses.append(item)
+    if not courses:
+        return None
+    if len(courses) == 1 and node_type != 'two':
+        return courses[0]
+    return {'type': node_type, 'courses': courses}
+
+
+def leaves(node):
+    if isinstance(node, dict):
+        return [leaf for child in node['courses'] for leaf in leaves(child)]
+    return [node] if node else []
+
+
+class ClauseParser:
+    """
+    Parses the clauses of one sentence. Remembers the last department so
+    "CHEM 6CL or 100A" resolves to CHEM 100A, and keeps the phrases it skipped.
+    """
+
+    def __init__(self):
+        self.dept = None
+        self.number = None
+        self.groups = []
+        self.dropped = []
+
+    def group(self, node):
+        self.groups.append(node)
+        return f" §{len(self.groups) - 1} "
+
+    def atom(self, text):
+        """One item between separators: course codes, a bare number, a group or prose"""
+        text = QUALIFIER.sub('', FILLER.sub('', text.strip(' ,;:')))
+        placeholder = PLACEHOLDER.search(text)
+        if placeholder:
+            return self.groups[int(placeholder.group(1))]
+        codes = []
+        for dept, number in COURSE.findall(text):
+            self.dept, self.number = dept, re.match(r'\d+', number).group(0)
+            codes.extend(f"{dept} {n}" for n in expand_number(number))
+        if codes:
+            return simplify('all', codes)
+        bare = BARE_NUMBER.match(text)
+        if bare and self.dept:
+            self.number = re.match(r'\d+', bare.group(1)).group(0)
+            return simplify('all', [f"{self.dept} {n}" for n in expand_number(bare.group(1))])
+        if SUFFIX_LETTER.match(text) and self.number:
+            # "MAE 217A and B"
+            return f"{self.dept} {self.number}{text}"
+        if text:
+            self.dropped.append(text)
+            if re.search(r'\d', text):
+                # "Physics 1A or 2A": the 2A is not in the previous department
+                self.dept = self.number = None
+        return None
+
+    def resolve_commas(self, separators):
+        """
+        Give each plain comma the conjunction of its list: "A, B, or C" (Oxford
+        comma) and a whole clause "A, B or C" are lists of that type; commas
+        between compound items ("A, B or C, D") are "and"
+        """
+        resolved = []
+        for index, separator in enumerate(separators):
+            if separator == ',':
+                after = [i for i in range(index + 1, len(separators)) if separators[i] != ',']
+                following = separators[after[0]] if after else None
+                if following in (',and', ',or'):
+                    separator = following[1:]
+                elif (following and all(s == ',' for s in separators[:index])
+                      and not any(s.startswith(',') for s in separators[after[0] + 1:])):
+                    separator = following
+                else:
+                    separator = 'and'
+            resolved.append(separator.lstrip(','))
+        return resolved
+
+    def combine(self, nodes, separators, level=0):
+        if level == len(PRECEDENCE):
+            return nodes[0]
+        operator = PRECEDENCE[level]
+        parts, start = [], 0
+        for index, separator in enumerate(separators + [operator]):
+            if separator == operator:
+                parts.append(self.combine(nodes[start:index + 1], separators[start:index], level + 1))
+                start = index + 1
+        return simplify('all' if operator == 'and' else 'one', parts)
+
+    def clause(self, text):
+        choice = ONE_OF.search(text)
+        if choice:
+            # "CSS 1 and choose one of the following courses: A, B, C"
+            listed = text[choice.end():]
+            listed = listed[listed.index(':') + 1:] if ':' in listed else listed
+            return simplify('all', [self.clause(text[:choice.start()]),
+                                    simplify('one', leaves(self.clause(listed)))])
+        tokens = SEPARATOR.split(text)
+        nodes, separators = [], []
+        pending = None
+        for index, token in enumerate(tokens):
+            if index % 2:
+                pending = re.sub(r'\s+', '', token).replace('&', 'and')
+                continue
+            node = None if NOT_REQUIRED.search(token) else self.atom(token)
+            if node is not None:
+                if nodes:
+                    separators.append(pending or ',')
+                nodes.append(node)
+            # A skipped item takes the separator that attached it along
+            pending = None
+        if not nodes:
+            return None
+        return self.combine(nodes, self.resolve_commas(separators))
+
+    def expand_groups(self, text):
+        """Replace "(...)" and "two from A, B, C" with placeholders for their parsed trees"""
+        while True:
+            match = PARENTHESES.search(text)
+            if not match:
+                break
+            inner = match.group(1)
+            prefix = TRAILING_DEPT.search(text[:match.start()])
+            if prefix:
+                # "EDS (20S or 30 or 31)"
+                self.dept = prefix.group(1)
+                text = text[:prefix.start()] + text[prefix.end():]
+                match = PARENTHESES.search(text)
+            if 'recommend' in inner or not re.search(r'\d', inner):
+                replacement = ' '
+            elif re.match(r'\s*or\b', inner):
+                # "AESE 278A (or CSE 278A or ECE 205A)": alternatives to the previous course
+                replacement = ' / ' + self.group(self.clause(re.sub(r'^\s*or\b', '', inner)))
+            else:
+                replacement = self.group(self.clause(inner))
+            text = text[:match.start()] + replacement + text[match.end():]
+        return CHOOSE.sub(lambda m: self.group(simplify('one' if m.group(1) == 'one' else 'two',
+                                                        leaves(self.clause(m.group(2))))), text)
+
+
+def parse_requirement(sentence):
+    """
+    Tree for one requirement sentence (the text after "Prerequisites:")
+
+    Returns:
+        tuple: (tree or None, list of skipped phrases)
+    """
+    parser = ClauseParser()
+    text = parser.expand_groups(first_sentence(sentence))
+    return simplify('all', [parser.clause(clause) for clause in text.split(';')]), parser.dropped
+
+
+def compile_description(description):
+    """
+    Compile one course description
+
+    Returns:
+        dict: {'prereqs': tree or None, 'coreqs': tree or None, 'problem': str or None}
+    """
+    result = {'prereqs': None, 'coreqs': None, 'problem': None}
+    match = PREREQ_SENTENCE.search(description)
+    if match:
+        sentence = first_sentence(match.group(1))
+        result['prereqs'], dropped = parse_requirement(sentence)
+        leftover = [phrase for phrase in dropped if LIKELY_COURSE.search(phrase) and not NOT_REQUIRED.search(phrase)]
+        if leftover:
+            result['problem'] = f"unrecognized course reference in {leftover[0]!r}: {sentence}"
+        elif result['prereqs'] is None and LIKELY_COURSE.search(sentence) and not NOT_REQUIRED.search(sentence):
+            result['problem'] = f"no courses parsed from: {sentence}"
+    coreq = COREQ_SENTENCE.search(description)
+    if coreq:
+        result['coreqs'], _ = parse_requirement(coreq.group(1))
+    return result
+
+
+def description_hash(description):
+    return hashlib.sha1(f"{COMPILER_VERSION}:{description}".encode('utf-8')).hexdigest()
+
+
+def compile_batch(descriptions):
+    return [compile_description(description) for description in descriptions]
+
+
+def load_cache(cache_file=CACHE_FILE):
+    if not os.path.exists(cache_file):
+        return {}
+    with open(cache_file, 'r') as f:
+        return json.load(f)
+
+
+def save_cache(cache, cache_file=CACHE_FILE):
+    os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+    tmp_file = cache_file + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(cache, f, separators=(',', ':'))
+    os.replace(tmp_file, cache_file)
+
+
+def course_files(prereq_dir=PREREQ_DIR):
+    return sorted(name for name in os.listdir(prereq_dir)
+                  if name.endswith('.json') and name not in ('departments.json', 'statistics.json'))
+
+
+def compile_catalog(prereq_dir=PREREQ_DIR, cache_file=CACHE_FILE, workers=None, use_cache=True):
+    """
+    Compile every course file, re-parsing only descriptions whose hash changed
+
+    Returns:
+        tuple: ({file name: (course record, compiled result)}, stats dict)
+    """
+    cache = load_cache(cache_file) if use_cache else {}
+    records = {}
+    results = {}
+    pending = []
+    for name in course_files(prereq_dir):
+        with open(os.path.join(prereq_dir, name), 'r') as f:
+            record = json.load(f)
+        records[name] = record
+        digest = description_hash(record.get('description', ''))
+        cached = cache.get(name)
+        if cached and cached['hash'] == digest:
+            results[name] = cached['result']
+        else:
+            pending.append((name, digest))
+
+    if len(pending) >= POOL_THRESHOLD and workers != 1:
+        workers = workers or os.cpu_count() or 1
+        chunk = max(1, len(pending) // (workers * 4))
+        batches = [pending[i:i + chunk] for i in range(0, len(pending), chunk)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            compiled = pool.map(compile_batch, [[records[name].get('description', '') for name, _ in batch]
+                                                for batch in batches])
+            for batch, batch_results in zip(batches, compiled):
+                for (name, _), result in zip(batch, batch_results):
+                    results[name] = result
+    else:
+        for name, _ in pending:
+            results[name] = compile_description(records[name].get('description', ''))
+
+    for name, digest in pending:
+        cache[name] = {'hash': digest, 'result': results[name]}
+    for name in list(cache):
+        if name not in records:
+            del cache[name]
+    if use_cache:
+        save_cache(cache, cache_file)
+
+    stats = {'courses': len(records), 'parsed': len(pending), 'cached': len(records) - len(pending)}
+    return {name: (records[name], results[name]) for name in records}, stats
+
+
+def compare_with_existing(compiled):
+    """Agreement between compiled trees and the prereqs already in the files"""
+    counts = {'match': 0, 'differ': 0, 'added': 0, 'removed': 0}
+    differences = []
+    for name, (record, result) in compiled.items():
+        existing, new = record.get('prereqs'), result['prereqs']
+        if existing == new:
+            if existing is not None:
+                counts['match'] += 1
+        elif existing is None:
+            counts['added'] += 1
+        elif new is None:
+            counts['removed'] += 1
+            differences.append((name, existing, new))
+        else:
+            counts['differ'] += 1
+            differences.append((name, existing, new))
+    return counts, differences
+
+
+def write_compiled(compiled, prereq_dir=PREREQ_DIR, force=False):
+    """
+    Write prereqs/coreqs back into files whose values changed
+
+    Only fields the file doesn't have yet are filled in: a tree that differs from
+    the checked-in (often hand-curated) value is kept and returned instead, unless
+    force is set. A sentence the compiler could not turn into a tree always keeps
+    the existing value. Files are written in their checked-in format.
+
+    Returns:
+        tuple: (files written, [(file name, field, existing, compiled)] kept)
+    """
+    written = 0
+    kept = []
+    for name, (record, result) in compiled.items():
+        updated = dict(record)
+        for field in ('prereqs', 'coreqs'):
+            existing, new = record.get(field), result[field]
+            if new is None or new == existing:
+                continue
+            if existing is not None and not force:
+                kept.append((name, field, existing, new))
+                continue
+            updated[field] = new
+        if updated == record:
+            continue
+        path = os.path.join(prereq_dir, name)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(updated, f, indent=2)
+        os.replace(path + '.tmp', path)
+        written += 1
+    return written, kept
+
+
+def print_problems(compiled, limit):
+    problems = [(name, result['problem']) for name, (_, result) in compiled.items() if result['problem']]
+    print(f"⚠️  {len(problems)} prerequisite sentences could not be fully parsed")
+    for name, problem in problems[:limit]:
+        print(f"   {name}: {problem}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile prerequisite sentences into prereq trees')
+    parser.add_argument('--dir', default=PREREQ_DIR)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--no-cache', action='store_true')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help='Compile the catalog')
+    build_parser.add_argument('--write', action='store_true', help='Update the course files')
+    build_parser.add_argument('--force', action='store_true',
+                              help='With --write, also replace checked-in trees that differ from the compiled ones')
+    build_parser.add_argument('--report', default=None, help='Write unparsed sentences to this JSON file')
+    build_parser.add_argument('--show', type=int, default=20, help='Problems to print')
+    check_parser = subparsers.add_parser('check', help='Compare with the checked-in trees')
+    check_parser.add_argument('--show', type=int, default=20, help='Differences to print')
+    parse_parser = subparsers.add_parser('parse', help='Compile one sentence')
+    parse_parser.add_argument('sentence')
+    args = parser.parse_args()
+
+    if args.command == 'parse':
+        tree, dropped = parse_requirement(args.sentence)
+        print(json.dumps(tree, indent=2))
+        if dropped:
+            print(f"ignored: {dropped}")
+        return 0
+
+    start = time.perf_counter()
+    compiled, stats = compile_catalog(args.dir, workers=args.workers, use_cache=not args.no_cache)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {stats['courses']} courses in {elapsed:.2f}s ({stats['parsed']} parsed, {stats['cached']} cached)")
+
+    if args.command == 'check':
+        counts, differences = compare_with_existing(compiled)
+        total = counts['match'] + counts['differ'] + counts['removed']
+        print(f"📊 {counts['match']}/{total} existing trees reproduced, {counts['differ']} differ, "
+              f"{counts['removed']} not parsed, {counts['added']} new "
+              f"(--write keeps differing trees unless --force)")
+        for name, existing, new in differences[:args.show]:
+            print(f"   {name}\n      file:     {json.dumps(existing)}\n      compiled: {json.dumps(new)}")
+        return 0
+
+    problems = print_problems(compiled, args.show)
+    if args.report:
+        with open(args.report, 'w') as f:
+            json.dump([{'file': name, 'problem': problem} for name, problem in problems], f, indent=2)
+    if args.write:
+        written, kept = write_compiled(compiled, args.dir, force=args.force)
+        print(f"💾 Updated {written} course files")
+        if kept:
+            print(f"🔒 Kept {len(kept)} checked-in trees that differ from the compiled ones (--force replaces them)")
+        for name, field, existing, new in kept[:args.show]:
+            print(f"   {name} {field}\n      file:     {json.dumps(existing)}\n      compiled: {json.dumps(new)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
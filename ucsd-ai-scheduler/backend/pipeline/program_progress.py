@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Progress toward every program in public/prereqdata/departments.json
+
+An inverted course -> programs index lets one pass over a student's completed
+courses count matches for all ~90 programs at once, instead of scanning every
+program's course list:
+    python program_progress.py "CSE 11" "CSE 12" "MATH 20A" --limit 10
+    python program_progress.py --completed-file completed.json
+
+Mirrored by programProgress.js for /api/program-progress; keep the ranking in sync.
+"""
+
+import argparse
+import os
+import time
+
+import schemas
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+DEPARTMENTS_FILE = os.path.join(BACKEND_DIR, 'public', 'prereqdata', 'departments.json')
+
+
+def load_programs(path=DEPARTMENTS_FILE):
+    return schemas.load(path, schemas.Programs)
+
+
+class ProgramIndex:
+    """
+    Inverted index from course code to the programs that list it
+
+    Args:
+        programs (dict): Program code -> schemas.Program
+    """
+
+    def __init__(self, programs):
+        self.programs = []
+        self.by_course = {}
+        for key, program in sorted(programs.items()):
+            courses = list(dict.fromkeys(program.courses))
+            slot = len(self.programs)
+            self.programs.append({
+                'code': program.code or key,
+                'name': program.name or key,
+                'link': program.link,
+                'total': len(courses),
+            })
+            for code in courses:
+                self.by_course.setdefault(code, []).append(slot)
+
+    @classmethod
+    def load(cls, path=DEPARTMENTS_FILE):
+        return cls(load_programs(path))
+
+    def evaluate(self, completed, limit=None, include_untouched=False):
+        """
+        Rank programs by how few of their courses remain
+
+        Args:
+            completed (iterable): Completed course codes
+            limit (int): Maximum number of programs to return
+            include_untouched (bool): Also return programs with no completed courses
+
+        Returns:
+            list: {code, name, link, completed, total, remaining, progress, matched}
+                  sorted by remaining courses, then most completed, then code
+        """
+        matched = {}
+        for code in dict.fromkeys(completed):
+            for slot in self.by_course.get(code, ()):
+                matched.setdefault(slot, []).append(code)
+
+        slots = range(len(self.programs)) if include_untouched else matched
+        results = []
+        for slot in slots:
+            program = self.programs[slot]
+            courses = matched.get(slot, [])
+            results.append(dict(
+                program,
+                completed=len(courses),
+                remaining=program['total'] - len(courses),
+                progress=round(len(courses) / program['total'], 4) if program['total'] else 0.0,
+                matched=courses,
+            ))
+        results.sort(key=lambda r: (r['remaining'], -r['completed'], r['code']))
+        return results[:limit] if limit else results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rank programs by courses remaining for a student')
+    parser.add_argument('completed', nargs='*', help='Completed course codes, e.g. "CSE 11"')
+    parser.add_argument('--completed-file', help='JSON list of completed course codes')
+    parser.add_argument('--limit', type=int, default=10)
+    parser.add_argument('--all', action='store_true', help='Include programs with no completed courses')
+    args = parser.parse_args()
+
+    completed = list(args.completed)
+    if args.completed_file:
+        completed.extend(schemas.load(args.completed_file, schemas.CourseList))
+    if not completed:
+        parser.error('no completed courses given')
+
+    index = ProgramIndex.load()
+    start = time.perf_counter()
+    results = index.evaluate(completed, limit=args.limit, include_untouched=args.all)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    for result in results:
+        print(f"   {result['code']:<6} {result['completed']:>3}/{result['total']:<4} "
+              f"{result['remaining']:>4} left  {result['name']}")
+    print(f"🎯 {len(results)} programs ranked from {len(completed)} courses in {elapsed_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Record-and-replay HTTP server for offline scraper runs
+
+Record once against the live site (the server proxies and saves every response),
+then replay from disk with optional latency and error injection:
+    python replay_server.py --site soc --port 8801 --record
+    SOC_BASE_URL=http://127.0.0.1:8801 python ../Classes_Scraper/classesScraper.py FA25
+
+    python replay_server.py --site soc --port 8801 --latency-ms 150 --jitter-ms 50 --error-rate 0.02
+    python replay_server.py --site rmp --port 8802
+    RMP_BASE_URL=http://127.0.0.1:8802 python ../rmp_scraper/cse_math_scraper.py
+
+GET /__replay__/stats returns request counters as JSON.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+FIXTURES_DIR = os.path.join(BACKEND_DIR, 'fixtures', 'replay')
+
+# Upstream of each recorded site; the scrapers take the replay address through
+# SOC_BASE_URL / RMP_BASE_URL
+SITES = {
+    'soc': 'https://act.ucsd.edu',
+    'rmp': 'https://www.ratemyprofessors.com',
+}
+
+# Absolute upstream URLs in recorded bodies are stored as this token and replaced
+# with the replay server's own address when served
+BASE_TOKEN = b'{{REPLAY_BASE}}'
+TEXT_TYPES = ('text/', 'application/json', 'application/javascript', 'application/xhtml')
+KEPT_HEADERS = {'content-type', 'set-cookie', 'location', 'cache-control'}
+STATS_PATH = '/__replay__/stats'
+
+# Form fields that select server-side session state, per site. The SOC pages
+# (?page=N) depend on the term the session searched, so the term is part of
+# every fixture key recorded in that session.
+SESSION_PARAMS = {
+    'soc': 'selectedTerm',
+}
+# Session cookie the replay server sets itself, in both modes, so concurrent
+# browsers are told apart even when replay hands them the same upstream cookie
+SESSION_COOKIE = 'replay_session'
+
+
+def request_key(method, path, query, body=b'', session_state=None):
+    """Fixture key: method, path, sorted query, session state and a hash of the request body"""
+    key = f"{method} {path}"
+    if query:
+        key += '?' + urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+    if session_state:
+        key += f" [{session_state}]"
+    if body:
+        key += ' #' + hashlib.sha1(body).hexdigest()[:12]
+    return key
+
+
+def form_value(name, query, body, content_type=''):
+    """Last value of a field in the query string or a urlencoded POST body, or None"""
+    fields = parse_qsl(query, keep_blank_values=True)
+    if body and content_type.startswith('application/x-www-form-urlencoded'):
+        fields += parse_qsl(body.decode('utf-8', 'replace'), keep_blank_values=True)
+    values = [value for field, value in fields if field == name]
+    return values[-1] if values else None
+
+
+def without_body(key):
+    return key.split(' #', 1)[0]
+
+
+class FixtureStore:
+    """Recorded responses for one site: index.json plus one body file per response"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        self.index_file = os.path.join(directory, 'index.json')
+        self.entries = {}
+        self.by_request_line = {}
+        self._lock = threading.Lock()
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r') as f:
+                self.entries = json.load(f)
+        for key in self.entries:
+            self.by_request_line.setdefault(without_body(key), key)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        """
+        Recorded response for a request
+
+        Falls back to any recording of the same method, path and query when the
+        exact request body was never seen (e.g. a form posted with a fresh token).
+
+        Returns:
+            tuple: (status, headers, body bytes) or None
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            fallback = self.by_request_line.get(without_body(key))
+            entry = self.entries.get(fallback) if fallback else None
+        if entry is None:
+            return None
+        with open(os.path.join(self.directory, entry['body']), 'rb') as f:
+            body = f.read()
+        return entry['status'], entry['headers'], body
+
+    def put(self, key, status, headers, body):
+        body_name = hashlib.sha1(key.encode('utf-8')).hexdigest() + '.bin'
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(os.path.join(self.directory, body_name), 'wb') as f:
+                f.write(body)
+            self.entries[key] = {'status': status, 'headers': headers, 'body': body_name}
+            self.by_request_line.setdefault(without_body(key), key)
+            tmp_file = self.index_file + '.tmp'
+            with open(tmp_file, 'w') as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            os.replace(tmp_file, self.index_file)
+
+
+class NoRedirect(urllib.request.HTTPRedirectHandler):
+    """Record redirects as responses instead of following them"""
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        return None
+
+
+class ReplayConfig:
+    def __init__(self, site, store, record=False, latency_ms=0, jitter_ms=0,
+                 error_rate=0.0, error_status=503, reset_rate=0.0, seed=0):
+        self.site = site
+        self.upstream = SITES[site]
+        self.store = store
+        self.record = record
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.reset_rate = reset_rate
+        self.random = random.Random(seed)
+        self.opener = urllib.request.build_opener(NoRedirect)
+        self.stats = {'requests': 0, 'served': 0, 'misses': 0, 'recorded': 0,
+                      'injected_errors': 0, 'injected_resets': 0}
+        self.session_param = SESSION_PARAMS.get(site)
+        self.session_state = {}  # replay session id -> last SESSION_PARAMS value
+        self.session_ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def session_for(self, session_id, query, body, content_type):
+        """
+        (session id, session state) for a request, allocating an id for a new client
+
+        A request that sets the session parameter updates the state of its session.
+        """
+        value = form_value(self.session_param, query, body, content_type) if self.session_param else None
+        with self._lock:
+            if session_id not in self.session_state:
+                session_id = str(next(self.session_ids))
+                self.session_state[session_id] = None
+            if value:
+                self.session_state[session_id] = value
+            return session_id, self.session_state[session_id]
+
+    def roll(self):
+        """(delay seconds, inject error, inject reset) for one request, from the seeded RNG"""
+        with self._lock:
+            jitter = self.random.uniform(-self.jitter_ms, self.jitter_ms) if self.jitter_ms else 0
+            delay = max(0.0, self.latency_ms + jitter) / 1000
+            reset = self.random.random() < self.reset_rate
+            error = not reset and self.random.random() < self.error_rate
+        return delay, error, reset
+
+
+class ReplayHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    config = None  # ReplayConfig, set by make_server()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        self.handle_request()
+
+    def do_POST(self):
+        self.handle_request()
+
+    def do_HEAD(self):
+        self.handle_request()
+
+    def handle_request(self):
+        config = self.config
+        self.set_session = None
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        url = urlsplit(self.path)
+
+        if url.path == STATS_PATH:
+            payload = dict(config.stats, fixtures=len(config.store), site=config.site,
+                           mode='record' if config.record else 'replay')
+            self.send_body(200, [['Content-Type', 'application/json']],
+                           json.dumps(payload).encode('utf-8'))
+            return
+
+        config.count('requests')
+        cookie = SimpleCookie(self.headers.get('Cookie') or '')
+        client_session = cookie[SESSION_COOKIE].value if SESSION_COOKIE in cookie else None
+        session_id, session_state = config.session_for(client_session, url.query, body,
+                                                       self.headers.get('Content-Type') or '')
+        self.set_session = session_id if session_id != client_session else None
+        key = request_key(self.command, url.path, url.query, body, session_state)
+        if config.record:
+            response = self.record(key, body)
+            if response is None:
+                return
+        else:
+            delay, error, reset = config.roll()
+            if delay:
+                time.sleep(delay)
+            if reset:
+                config.count('injected_resets')
+                self.close_connection = True
+                self.connection.close()
+                return
+            if error:
+                config.count('injected_errors')
+                self.send_body(config.error_status, [['Content-Type', 'text/plain']], b'injected error\n')
+                return
+            response = config.store.get(key)
+
+        if response is None:
+            config.count('misses')
+            self.send_body(404, [['Content-Type', 'text/plain']], f"no recording for {key}\n".encode('utf-8'))
+            return
+        config.count('served')
+        status, headers, recorded_body = response
+        local_base = f"http://{self.headers.get('Host') or '%s:%d' % self.server.server_address[:2]}"
+        headers = [[name, value.replace(BASE_TOKEN.decode(), local_base)] for name, value in headers]
+        self.send_body(status, headers, recorded_body.replace(BASE_TOKEN, local_base.encode('utf-8')))
+
+    def record(self, key, body):
+        """Forward the request upstream, save the response and return it"""
+        config = self.config
+        headers = {name: value for name, value in self.headers.items()
+                   if name.lower() in ('cookie', 'content-type', 'accept', 'user-agent', 'referer')}
+        if 'Cookie' in headers:
+            cookie = SimpleCookie(headers['Cookie'])
+            cookie.pop(SESSION_COOKIE, None)
+            headers['Cookie'] = '; '.join(f"{name}={morsel.coded_value}" for name, morsel in cookie.items())
+            if not headers['Cookie']:
+                del headers['Cookie']
+        headers['Accept-Encoding'] = 'identity'
+        request = urllib.request.Request(config.upstream + self.path, data=body or None,
+                                         headers=headers, method=self.command)
+        try:
+            upstream = config.opener.open(request, timeout=60)
+        except urllib.error.HTTPError as e:
+            upstream = e
+        except urllib.error.URLError as e:
+            self.send_body(502, [['Content-Type', 'text/plain']], f"upstream error: {e}\n".encode('utf-8'))
+            return None
+        with upstream:
+            status = upstream.status if hasattr(upstream, 'status') else upstream.code
+            response_body = upstream.read()
+            response_headers = []
+            for name, value in upstream.headers.items():
+                if name.lower() not in KEPT_HEADERS:
+                    continue
+                if name.lower() == 'set-cookie':
+                    # Cookies must stick to the replay host
+                    value = '; '.join(part.strip() for part in value.split(';')
+                                      if not part.strip().lower().startswith(('domain=', 'secure')))
+                response_headers.append([name, value.replace(config.upstream, BASE_TOKEN.decode())])
+
+        content_type = upstream.headers.get('Content-Type', '')
+        if content_type.startswith(TEXT_TYPES):
+            response_body = response_body.replace(config.upstream.encode('utf-8'), BASE_TOKEN)
+        config.store.put(key, status, response_headers, response_body)
+        config.count('recorded')
+        return status, response_headers, response_body
+
+    def send_body(self, status, headers, body):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        if self.set_session:
+            self.send_header('Set-Cookie', f"{SESSION_COOKIE}={self.set_session}; Path=/")
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+
+def make_server(config, host='127.0.0.1', port=8801):
+    handler = type('BoundReplayHandler', (ReplayHandler,), {'config': config})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record and replay scraper HTTP traffic')
+    parser.add_argument('--site', choices=sorted(SITES), required=True)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8801)
+    parser.add_argument('--fixtures', default=FIXTURES_DIR, help='Fixture root (one subdirectory per site)')
+    parser.add_argument('--record', action='store_true', help='Proxy to the live site and save responses')
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of requests answered with --error-status')
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--reset-rate', type=float, default=0, help='Fraction of connections dropped without a response')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for latency jitter and injected failures')
+    args = parser.parse_args()
+
+    store = FixtureStore(os.path.join(args.fixtures, args.site))
+    config = ReplayConfig(args.site, store, args.record, args.latency_ms, args.jitter_ms,
+                          args.error_rate, args.error_status, args.reset_rate, args.seed)
+    server = make_server(config, args.host, args.port)
+    mode = f"recording {config.upstream}" if args.record else f"replaying {len(store)} responses"
+    print(f"🎬 {args.site}: {mode} on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(f"📊 {json.dumps(config.stats)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Lightweight timers and counters for scraper and integration runs
+
+Usage in a script:
+    metrics = RunMetrics("classes_scraper")
+    with metrics.stage("page_load"):
+        driver.get(url)
+    metrics.incr("rows", len(rows))
+    metrics.finish()   # writes metrics/<run>.json and metrics/<run>.prom
+
+Set PIPELINE_PROFILE=1 to also dump a cProfile per stage and a tracemalloc
+summary of the run; PIPELINE_METRICS_DIR changes where reports go.
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+METRICS_DIR = os.environ.get('PIPELINE_METRICS_DIR', os.path.join(BACKEND_DIR, 'metrics'))
+PROFILE_ENABLED = os.environ.get('PIPELINE_PROFILE', '') not in ('', '0', 'false')
+
+# Derived rates: name -> (numerator counter, denominator counter or stage seconds)
+RATES = {
+    'pages_per_sec': ('pages', 'stage:scrape'),
+    'rows_per_sec': ('rows', 'stage:scrape'),
+    'sections_per_sec': ('sections', 'stage:integrate'),
+    'webdriver_calls_per_page': ('webdriver_calls', 'pages'),
+    'professors_per_sec': ('professors', 'stage:scrape'),
+}
+
+
+class RunMetrics:
+    """Thread-safe stage timers and counters for one run"""
+
+    def __init__(self, run_name, output_dir=None, profile=None):
+        self.run_name = run_name
+        self.output_dir = output_dir or METRICS_DIR
+        self.profile = PROFILE_ENABLED if profile is None else profile
+        self.started_at = time.time()
+        self.counters = {}
+        self.stages = {}
+        self._lock = threading.Lock()
+        self._profilers = {}
+        self._profiling = False
+        if self.profile and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def incr(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def add_time(self, stage, seconds):
+        with self._lock:
+            entry = self.stages.setdefault(stage, {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            entry['count'] += 1
+            entry['seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+
+    @contextmanager
+    def stage(self, name):
+        """Time a block; in profile mode also cProfile it (per stage, aggregated)"""
+        profiler = None
+        if self.profile and not self._profiling and threading.current_thread() is threading.main_thread():
+            # Only one profiler can be active: profile main-thread, outermost stages
+            profiler = self._profilers.setdefault(name, cProfile.Profile())
+            self._profiling = True
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+            if profiler is not None:
+                profiler.disable()
+                self._profiling = False
+
+    def record_file_written(self, path):
+        """Count bytes of a file the run just wrote"""
+        try:
+            self.incr('bytes_written', os.path.getsize(path))
+            self.incr('files_written')
+        except OSError:
+            pass
+
+    def cache_hit(self, hit):
+        self.incr('cache_hits' if hit else 'cache_misses')
+
+    def _value(self, name):
+        if name.startswith('stage:'):
+            return self.stages.get(name[len('stage:'):], {}).get('seconds', 0)
+        return self.counters.get(name, 0)
+
+    def report(self):
+        """Snapshot of counters, stage timings and derived rates"""
+        with self._lock:
+            counters = dict(self.counters)
+            stages = {name: dict(entry) for name, entry in self.stages.items()}
+        for entry in stages.values():
+            entry['seconds'] = round(entry['seconds'], 4)
+            entry['max_seconds'] = round(entry['max_seconds'], 4)
+            entry['avg_seconds'] = round(entry['seconds'] / entry['count'], 4) if entry['count'] else 0
+
+        rates = {}
+        for name, (numerator, denominator) in RATES.items():
+            top, bottom = self._value(numerator), self._value(denominator)
+            if top and bottom:
+                rates[name] = round(top / bottom, 3)
+        hits, misses = counters.get('cache_hits', 0), counters.get('cache_misses', 0)
+        if hits + misses:
+            rates['cache_hit_rate'] = round(hits / (hits + misses), 4)
+
+        return {
+            'run': self.run_name,
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+            'duration_seconds': round(time.time() - self.started_at, 3),
+            'counters': counters,
+            'stages': stages,
+            'rates': rates,
+        }
+
+    def prometheus_text(self, report=None):
+        """Report in the Prometheus textfile-collector format"""
+        report = report or self.report()
+        run = report['run']
+        lines = [
+            '# HELP pipeline_stage_seconds_total Time spent in each stage',
+            '# TYPE pipeline_stage_seconds_total counter',
+        ]
+        for stage, entry in sorted(report['stages'].items()):
+            lines.append(f'pipeline_stage_seconds_total{{run="{run}",stage="{stage}"}} {entry["seconds"]}')
+        lines += ['# HELP pipeline_stage_calls_total Times each stage ran', '# TYPE pipeline_stage_calls_total counter']
+        for stage, entry in sorted(report['stages'].items()):
+            lines.append(f'pipeline_stage_calls_total{{run="{run}",stage="{stage}"}} {entry["count"]}')
+        lines += ['# HELP pipeline_events_total Counted events', '# TYPE pipeline_events_total counter']
+        for name, value in sorted(report['counters'].items()):
+            lines.append(f'pipeline_events_total{{run="{run}",name="{name}"}} {value}')
+        lines += ['# HELP pipeline_rate Derived per-run rates', '# TYPE pipeline_rate gauge']
+        for name, value in sorted(report['rates'].items()):
+            lines.append(f'pipeline_rate{{run="{run}",name="{name}"}} {value}')
+        lines.append(f'pipeline_run_duration_seconds{{run="{run}"}} {report["duration_seconds"]}')
+        return '\n'.join(lines) + '\n'
+
+    def _write_atomic(self, path, text):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def dump_profiles(self):
+        """Write one .prof per stage and a tracemalloc top-allocations summary"""
+        paths = []
+        for stage, profiler in self._profilers.items():
+            path = os.path.join(self.output_dir, f"{self.run_name}.{stage}.prof")
+            profiler.dump_stats(path)
+            paths.append(path)
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            path = os.path.join(self.output_dir, f"{self.run_name}.tracemalloc.txt")
+            lines = [f"peak traced memory: {peak / 1024:.1f} KB", ""]
+            lines += [str(stat) for stat in snapshot.statistics('lineno')[:25]]
+            self._write_atomic(path, '\n'.join(lines) + '\n')
+            paths.append(path)
+        return paths
+
+    def finish(self):
+        """Write the JSON run report and Prometheus textfile; returns the report"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        report = self.report()
+        self._write_atomic(os.path.join(self.output_dir, f"{self.run_name}.json"), json.dumps(report, indent=2))
+        self._write_atomic(os.path.join(self.output_dir, f"{self.run_name}.prom"), self.prometheus_text(report))
+        if self.profile:
+            self.dump_profiles()
+        print(f"📈 Metrics written to {os.path.join(self.output_dir, self.run_name)}.json/.prom")
+        return report
+
+
+# WebDriver/WebElement attributes that are properties but still cost a round trip
+REMOTE_PROPERTIES = {'text', 'title', 'page_source', 'current_url', 'tag_name'}
+
+
+class CountingProxy:
+    """
+    Wraps a Selenium driver (or element) and counts every WebDriver round trip
+
+    Elements returned from find_element(s) are wrapped too, so `.text` and
+    nested lookups are counted as well.
+    """
+
+    def __init__(self, target, metrics):
+        object.__setattr__(self, '_target', target)
+        object.__setattr__(self, '_metrics', metrics)
+
+    def _wrap(self, value):
+        if isinstance(value, list):
+            return [self._wrap(v) for v in value]
+        if hasattr(value, 'find_element') and not isinstance(value, CountingProxy):
+            return CountingProxy(value, self._metrics)
+        return value
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if name in REMOTE_PROPERTIES:
+            self._metrics.incr('webdriver_calls')
+            return attr
+        if callable(attr) and not name.startswith('_'):
+            def counted(*args, **kwargs):
+                self._metrics.incr('webdriver_calls')
+                unwrapped = [a._target if isinstance(a, CountingProxy) else a for a in args]
+                return self._wrap(attr(*unwrapped, **kwargs))
+            return counted
+        return attr
+
+    def __setattr__(self, name, value):
+        setattr(self._target, name, value)
+
+
+def instrument_driver(driver, metrics):
+    """Driver proxy that counts WebDriver calls into metrics['webdriver_calls']"""
+    return CountingProxy(driver, metrics)
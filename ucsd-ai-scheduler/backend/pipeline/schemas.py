@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Typed schemas for the JSON the pipeline reads and writes
+
+Sections (course_data), RMP professors, prereqdata course records, programs
+(departments.json) and major/college requirement trees are decoded in one
+validating step into slotted records, so loaders no longer need per-section
+isinstance/.get() checks:
+    from schemas import CourseData, Professors, load, dump
+    courses = load('../public/course_data/fa25.json', CourseData)
+    dump(courses, 'out.json', indent=2)
+
+With msgspec installed the records are msgspec Structs and decoding/encoding
+runs in msgspec's C decoder. Without it they are slotted dataclasses, parsed by
+orjson (or json) and checked by a converter compiled once per type. Both paths
+raise ValidationError with the location of the first bad value. Encoding writes
+every field, null values included, except the few that some files leave out
+(a section's professor_rating and its per-source fields, a group's count, a
+block's units): those default to UNSET and are only written when set, so rated
+course data and requirement trees keep the keys they were read with.
+"""
+
+import dataclasses
+import json
+import os
+import sys
+import typing
+from typing import Dict, List, Optional, Union
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+if MSGSPEC_AVAILABLE:
+    ValidationError = msgspec.ValidationError
+    UNSET = msgspec.UNSET
+    UnsetType = msgspec.UnsetType
+else:
+    class ValidationError(ValueError):
+        """A JSON value does not match its schema"""
+
+    class UnsetType:
+        """Default of a field a file may leave out; falsy, and never encoded"""
+        __slots__ = ()
+
+        def __bool__(self):
+            return False
+
+        def __repr__(self):
+            return 'UNSET'
+
+    UNSET = UnsetType()
+
+
+def record(cls):
+    """
+    Turn an annotated class into a slotted record type
+
+    Returns a msgspec Struct if msgspec is installed, otherwise a slotted
+    dataclass. Every field is encoded, defaults included, unless it is UNSET.
+    Empty list and dict defaults are copied per instance either way.
+    """
+    if MSGSPEC_AVAILABLE:
+        fields = [(name, annotation, cls.__dict__[name]) if name in cls.__dict__ else (name, annotation)
+                  for name, annotation in cls.__annotations__.items()]
+        return msgspec.defstruct(cls.__name__, fields, module=cls.__module__, namespace={'__doc__': cls.__doc__})
+    for name in cls.__annotations__:
+        default = cls.__dict__.get(name)
+        if isinstance(default, (list, dict)):
+            setattr(cls, name, dataclasses.field(default_factory=type(default)))
+    return dataclasses.dataclass(slots=True)(cls)
+
+
+Number = Union[int, float]
+
+
+@record
+class ProfessorRating:
+    """Individual ratings set professor_id, department averages num_professors"""
+    rating: Optional[Number] = None
+    difficulty: Optional[Number] = None
+    num_ratings: Optional[int] = None
+    would_take_again: Optional[Number] = None
+    department: Union[str, None, UnsetType] = UNSET
+    professor_id: Union[str, None, UnsetType] = UNSET
+    num_professors: Union[int, None, UnsetType] = UNSET
+
+
+@record
+class Section:
+    sectionType: str
+    days: str
+    times: str
+    buildingName: str
+    roomNumber: str
+    professor: str
+    seatsRemaining: str
+    spaces: str
+    professor_rating: Union[ProfessorRating, None, UnsetType] = UNSET
+
+
+@record
+class Professor:
+    id: str
+    full_name: str
+    department: str
+    first_name: str = ''
+    last_name: str = ''
+    legacy_id: Optional[int] = None
+    avg_rating: Optional[Number] = None
+    avg_difficulty: Optional[Number] = None
+    num_ratings: int = 0
+    would_take_again_percent: Optional[Number] = None
+    is_saved: bool = False
+
+
+@record
+class RequirementGroup:
+    """{"type": "all"|"one"|"two", "courses": [...], "count": n} node of a prereq or requirement tree"""
+    type: str
+    courses: List[Union[str, List[str], 'RequirementGroup']] = []
+    count: Union[int, None, UnsetType] = UNSET
+
+
+# A tree is a course code, a list of codes, or a group of subtrees
+RequirementTree = Union[str, List[str], RequirementGroup]
+
+
+@record
+class CourseRecord:
+    code: str
+    title: str = ''
+    units: str = ''
+    dept: str = ''
+    description: str = ''
+    anchor: Optional[str] = None
+    prereqs: Optional[RequirementTree] = None
+    coreqs: Optional[RequirementTree] = None
+    successors: List[str] = []
+
+
+@record
+class Program:
+    code: str = ''
+    name: Optional[str] = None
+    link: Optional[str] = None
+    courses: List[str] = []
+
+
+@record
+class RequirementBlock:
+    courses: List[RequirementTree] = []
+    units: Union[int, None, UnsetType] = UNSET
+
+
+@record
+class MajorRequirements:
+    major: str
+    code: str = ''
+    catalog_year: Optional[str] = None
+    requirements: Dict[str, RequirementBlock] = {}
+
+
+@record
+class CollegeRequirements:
+    college: str
+    catalog_year: Optional[str] = None
+    requirements: Optional[RequirementBlock] = None
+
+
+# {dept: {course number: [sections]}}
+CourseData = Dict[str, Dict[str, List[Section]]]
+Professors = List[Professor]
+# {program code: program}, as in prereqdata/departments.json
+Programs = Dict[str, Program]
+# Completed course codes, and {student id: completed codes} for cohort files
+CourseList = List[str]
+Cohort = Dict[str, List[str]]
+
+RECORD_TYPES = (ProfessorRating, Section, Professor, RequirementGroup, CourseRecord, Program,
+                RequirementBlock, MajorRequirements, CollegeRequirements)
+
+
+def is_group(node):
+    return isinstance(node, RequirementGroup)
+
+
+def replace(obj, **changes):
+    """Copy of a record with some fields changed"""
+    if MSGSPEC_AVAILABLE:
+        return msgspec.structs.replace(obj, **changes)
+    return dataclasses.replace(obj, **changes)
+
+
+# ---------------------------------------------------------------------------
+# Fallback conversion (no msgspec): builtins <-> dataclasses
+# ---------------------------------------------------------------------------
+
+_converters = {}
+
+
+def _type_name(tp):
+    return getattr(tp, '__name__', None) or str(tp).replace('typing.', '')
+
+
+class _Fail(Exception):
+    """Conversion failure; path segments are prepended as it unwinds"""
+
+    def __init__(self, message, path=''):
+        super().__init__(message)
+        self.message = message
+        self.path = path
+
+
+def _converter(tp):
+    """Compile (once per type) a function that validates and converts a decoded JSON value"""
+    if tp in _converters:
+        return _converters[tp]
+    # Placeholder so recursive types resolve to the finished converter
+    _converters[tp] = lambda value: _converters[tp](value)
+    _converters[tp] = convert = _build_converter(tp)
+    return convert
+
+
+def _build_converter(tp):
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+
+    if tp is typing.Any:
+        return lambda value: value
+
+    if tp in (str, bool):
+        def convert_exact(value):
+            if type(value) is not tp:
+                raise _Fail(f"Expected `{tp.__name__}`, got `{type(value).__name__}`")
+            return value
+        return convert_exact
+
+    if tp in (int, float):
+        accepted = (int,) if tp is int else (int, float)
+
+        def convert_number(value):
+            if isinstance(value, bool) or not isinstance(value, accepted):
+                raise _Fail(f"Expected `{tp.__name__}`, got `{type(value).__name__}`")
+            return float(value) if tp is float else value
+        return convert_number
+
+    if origin is Union:
+        args = [arg for arg in args if arg is not UnsetType]
+        options = [(arg, _converter(arg)) for arg in args]
+        expected = ' | '.join('null' if arg is type(None) else _type_name(arg) for arg in args)
+
+        def convert_union(value):
+            for arg, convert in options:
+                if arg is type(None):
+                    if value is None:
+                        return None
+                    continue
+                try:
+                    return convert(value)
+                except _Fail:
+                    continue
+            raise _Fail(f"Expected `{expected}`, got `{type(value).__name__}`")
+        return convert_union
+
+    if tp is type(None):
+        def convert_none(value):
+            if value is not None:
+                raise _Fail(f"Expected `null`, got `{type(value).__name__}`")
+            return None
+        return convert_none
+
+    if origin in (list, List):
+        item = _converter(args[0])
+
+        def convert_list(value):
+            if type(value) is not list:
+                raise _Fail(f"Expected `array`, got `{type(value).__name__}`")
+            result = []
+            for i, element in enumerate(value):
+                try:
+                    result.append(item(element))
+                except _Fail as e:
+                    raise _Fail(e.message, f"[{i}]{e.path}") from None
+            return result
+        return convert_list
+
+    if origin in (dict, Dict):
+        key, item = _converter(args[0]), _converter(args[1])
+
+        def convert_dict(value):
+            if type(value) is not dict:
+                raise _Fail(f"Expected `object`, got `{type(value).__name__}`")
+            result = {}
+            for k, element in value.items():
+                try:
+                    result[key(k)] = item(element)
+                except _Fail as e:
+                    raise _Fail(e.message, f"[{k!r}]{e.path}") from None
+            return result
+        return convert_dict
+
+    if dataclasses.is_dataclass(tp):
+        hints = typing.get_type_hints(tp)
+        # Plain str fields are checked inline; most section fields are strings
+        fields = [(f.name, hints[f.name] is str, _converter(hints[f.name]),
+                   f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING)
+                  for f in dataclasses.fields(tp)]
+
+        def convert_record(value):
+            if type(value) is not dict:
+                raise _Fail(f"Expected `object`, got `{type(value).__name__}`")
+            kwargs = {}
+            for name, is_str, convert, required in fields:
+                if name not in value:
+                    if required:
+                        raise _Fail(f"Object missing required field `{name}`")
+                    continue
+                field_value = value[name]
+                if is_str and type(field_value) is str:
+                    kwargs[name] = field_value
+                    continue
+                try:
+                    kwargs[name] = convert(field_value)
+                except _Fail as e:
+                    raise _Fail(e.message, f".{name}{e.path}") from None
+            return tp(**kwargs)
+        return convert_record
+
+    raise TypeError(f"Unsupported schema type: {tp!r}")
+
+
+_record_fields = {}
+
+
+def _field_names(cls):
+    """Field names of a record type, computed once"""
+    if cls not in _record_fields:
+        _record_fields[cls] = [f.name for f in dataclasses.fields(cls)]
+    return _record_fields[cls]
+
+
+def to_builtins(obj):
+    """Records -> plain dicts/lists with every field that isn't UNSET"""
+    if MSGSPEC_AVAILABLE:
+        return msgspec.to_builtins(obj)
+    if obj is None or type(obj) in (str, int, float, bool):
+        return obj
+    if type(obj) in RECORD_TYPES:
+        result = {}
+        for name in _field_names(type(obj)):
+            value = getattr(obj, name)
+            if value is not UNSET:
+                result[name] = to_builtins(value)
+        return result
+    if isinstance(obj, dict):
+        return {k: to_builtins(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_builtins(v) for v in obj]
+    return obj
+
+
+# ---------------------------------------------------------------------------
+# Decode / encode
+# ---------------------------------------------------------------------------
+
+_decoders = {}
+
+
+def _parse(data):
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def convert(value, type):
+    """Validate already-decoded builtins (dicts and lists) into records (see loads)"""
+    if MSGSPEC_AVAILABLE:
+        return msgspec.convert(value, type)
+    try:
+        return _converter(type)(value)
+    except _Fail as e:
+        raise ValidationError(f"{e.message} - at `${e.path}`") from None
+
+
+def loads(data, type=typing.Any):
+    """
+    Decode and validate JSON text
+
+    Args:
+        data (bytes|str): JSON document
+        type: Schema, e.g. CourseData or CourseRecord (default: untyped builtins)
+
+    Returns:
+        The decoded records
+
+    Raises:
+        ValidationError: The document does not match the schema
+    """
+    if MSGSPEC_AVAILABLE:
+        if type not in _decoders:
+            _decoders[type] = msgspec.json.Decoder(type)
+        return _decoders[type].decode(data)
+    try:
+        value = _parse(data)
+    except ValueError as e:
+        raise ValidationError(f"Invalid JSON: {e}") from None
+    return convert(value, type)
+
+
+def dumps(obj, indent=None):
+    """
+    Encode records (or builtins) as UTF-8 JSON bytes
+
+    Args:
+        obj: Value to encode
+        indent (int): Pretty-print with this indent (default: compact)
+    """
+    if MSGSPEC_AVAILABLE:
+        data = msgspec.json.encode(obj)
+        return msgspec.json.format(data, indent=indent) if indent else data
+    value = to_builtins(obj)
+    if ORJSON_AVAILABLE and indent in (None, 2):
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0)
+    separators = None if indent else (',', ':')
+    return json.dumps(value, indent=indent, separators=separators, ensure_ascii=False).encode('utf-8')
+
+
+def load(path, type=typing.Any):
+    """Read and decode a JSON file (see loads)"""
+    with open(path, 'rb') as f:
+        return loads(f.read(), type)
+
+
+def dump(obj, path, indent=None):
+    """Encode to a JSON file, written to a temporary file and renamed into place"""
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(dumps(obj, indent))
+    os.replace(tmp_file, path)
+
+
+def roundtrip_difference(path, type):
+    """
+    Decode a file and encode it again
+
+    Returns:
+        str: First place the re-encoded JSON differs from the file, or None
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    return _difference(_parse(data), _parse(dumps(loads(data, type))))
+
+
+def _difference(before, after, path='$'):
+    if isinstance(before, dict) and isinstance(after, dict):
+        for key in [*before, *(k for k in after if k not in before)]:
+            if key not in after:
+                return f"{path}[{key!r}] dropped"
+            if key not in before:
+                return f"{path}[{key!r}] added"
+            found = _difference(before[key], after[key], f"{path}[{key!r}]")
+            if found:
+                return found
+        return None
+    if isinstance(before, list) and isinstance(after, list) and len(before) == len(after):
+        for i, (x, y) in enumerate(zip(before, after)):
+            found = _difference(x, y, f"{path}[{i}]")
+            if found:
+                return found
+        return None
+    if type(before) is not type(after) or before != after:
+        return f"{path}: {before!r} -> {after!r}"
+    return None
+
+
+def main():
+    """
+    Validate JSON files against a schema:
+        python schemas.py CourseData ../public/course_data/*.json
+        python schemas.py --roundtrip CourseData ../public/course_data/*.json   # also re-encode and compare
+    """
+    args = sys.argv[1:]
+    roundtrip = args[:1] == ['--roundtrip']
+    args = args[1:] if roundtrip else args
+    schemas = {name: obj for name, obj in globals().items()
+               if name in ('CourseData', 'Professors', 'Programs', 'CourseList', 'Cohort') or obj in RECORD_TYPES}
+    if len(args) < 2 or args[0] not in schemas:
+        print(f"usage: python schemas.py [--roundtrip] <{'|'.join(sorted(schemas))}> FILE...")
+        sys.exit(2)
+    backend = 'msgspec' if MSGSPEC_AVAILABLE else ('orjson' if ORJSON_AVAILABLE else 'json') + ' + dataclasses'
+    failed = 0
+    for path in args[1:]:
+        try:
+            if roundtrip:
+                difference = roundtrip_difference(path, schemas[args[0]])
+                if difference:
+                    raise ValueError(f"re-encoding changes {difference}")
+            else:
+                load(path, schemas[args[0]])
+            print(f"✅ {path}")
+        except (OSError, ValueError) as e:
+            failed += 1
+            print(f"❌ {path}: {e}")
+    print(f"📋 {len(args) - 1 - failed}/{len(args) - 1} {'round-trip unchanged' if roundtrip else 'valid'} ({backend})")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Seat-availability history across enrollment polls
+
+Each poll of the Schedule of Classes is appended as one snapshot instead of a
+new full copy of the course data. Per section we keep seats remaining,
+waitlist and capacity as delta-encoded integer series, stored as run-length
+(delta, count) pairs so the common "nothing changed" poll costs almost nothing.
+    python seat_history.py --term FA25 record ../public/course_data/fa25.json
+    python seat_history.py --term FA25 filled --hours 1
+    python seat_history.py --term FA25 fill-rate "CSE 100"
+"""
+
+import argparse
+import json
+import os
+import time
+import zlib
+
+import schemas
+from catalog_db import parse_int, parse_seats
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+HISTORY_DIR = os.path.join(BACKEND_DIR, 'data', 'seat_history')
+
+FILE_MAGIC = b'SEATHIST1'
+FIELDS = ('seats', 'waitlist', 'spaces')
+
+
+def section_key(dept, course_num, section, occurrence=0):
+    """
+    Stable identity for a section across polls
+
+    The Schedule of Classes has no section ids in our data, so identity is the
+    course plus type, meeting time and instructor. `occurrence` separates
+    otherwise identical rows.
+    """
+    parts = [dept, course_num, section.sectionType, section.days, section.times, section.professor]
+    key = '|'.join(p.strip() for p in parts)
+    return f"{key}#{occurrence}" if occurrence else key
+
+
+def zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def unzigzag(value):
+    return (value >> 1) ^ -(value & 1)
+
+
+def write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data, pos):
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+class DeltaSeries:
+    """Integer series stored as run-length encoded deltas: [[delta, count], ...]"""
+
+    __slots__ = ('runs', 'last', 'length')
+
+    def __init__(self):
+        self.runs = []
+        self.last = 0
+        self.length = 0
+
+    def append(self, value):
+        delta = value - self.last
+        if self.runs and self.runs[-1][0] == delta:
+            self.runs[-1][1] += 1
+        else:
+            self.runs.append([delta, 1])
+        self.last = value
+        self.length += 1
+
+    def values(self):
+        current = 0
+        result = []
+        for delta, count in self.runs:
+            for _ in range(count):
+                current += delta
+                result.append(current)
+        return result
+
+    def value_at(self, index):
+        """Value at position `index` without expanding the whole series"""
+        if index < 0 or index >= self.length:
+            raise IndexError(index)
+        current = 0
+        seen = 0
+        for delta, count in self.runs:
+            if seen + count > index:
+                return current + delta * (index - seen + 1)
+            current += delta * count
+            seen += count
+        raise IndexError(index)
+
+    def encode(self, out):
+        write_varint(out, len(self.runs))
+        for delta, count in self.runs:
+            write_varint(out, zigzag(delta))
+            write_varint(out, count)
+
+    @classmethod
+    def decode(cls, data, pos):
+        series = cls()
+        num_runs, pos = read_varint(data, pos)
+        for _ in range(num_runs):
+            delta, pos = read_varint(data, pos)
+            count, pos = read_varint(data, pos)
+            delta = unzigzag(delta)
+            series.runs.append([delta, count])
+            series.last += delta * count
+            series.length += count
+        return series, pos
+
+
+class SectionHistory:
+    __slots__ = ('first_poll', 'series')
+
+    def __init__(self, first_poll):
+        self.first_poll = first_poll
+        self.series = {field: DeltaSeries() for field in FIELDS}
+
+
+class SeatHistory:
+    """All polls for one term"""
+
+    def __init__(self, term):
+        self.term = term
+        self.timestamps = DeltaSeries()
+        self.sections = {}
+
+    @property
+    def num_polls(self):
+        return self.timestamps.length
+
+    def record_snapshot(self, course_data, timestamp=None):
+        """
+        Append one poll
+
+        A blank or unparseable seat count is not a full section: the section
+        keeps its last values for this poll, as if it were missing from it.
+
+        Args:
+            course_data (schemas.CourseData): {dept: {course: [sections]}} as written by the scraper
+            timestamp (int): Unix seconds of the poll (default: now)
+
+        Returns:
+            int: Number of sections recorded
+        """
+        timestamp = int(timestamp if timestamp is not None else time.time())
+        poll = self.num_polls
+        self.timestamps.append(timestamp)
+
+        seen = set()
+        for dept, dept_courses in course_data.items():
+            for course_num, sections in dept_courses.items():
+                occurrences = {}
+                for section in sections:
+                    seats, waitlist = parse_seats(section.seatsRemaining)
+                    spaces = parse_int(section.spaces)
+                    if seats is None and spaces is None:
+                        # Lectures whose seats are tracked on their discussion sections
+                        continue
+                    base = section_key(dept, course_num, section)
+                    occurrence = occurrences.get(base, 0)
+                    occurrences[base] = occurrence + 1
+                    if seats is None:
+                        continue
+                    key = section_key(dept, course_num, section, occurrence)
+
+                    history = self.sections.get(key)
+                    if history is None:
+                        history = self.sections[key] = SectionHistory(poll)
+                    values = {'seats': seats, 'waitlist': waitlist, 'spaces': spaces}
+                    for field in FIELDS:
+                        series = history.series[field]
+                        series.append(values[field] if values[field] is not None else series.last)
+                    seen.add(key)
+
+        # Sections missing from this poll carry their last value forward
+        for key, history in self.sections.items():
+            if key not in seen:
+                for series in history.series.values():
+                    series.append(series.last)
+        return len(seen)
+
+    def poll_index_at(self, timestamp):
+        """Index of the last poll taken at or before `timestamp`, or -1"""
+        index = -1
+        current = 0
+        seen = 0
+        for delta, count in self.timestamps.runs:
+            for _ in range(count):
+                current += delta
+                if current > timestamp:
+                    return index
+                index = seen
+                seen += 1
+        return index
+
+    def fill_rate(self, key):
+        """
+        Fill rate over time for one section
+
+        Returns:
+            list: (timestamp, fill fraction, seats remaining, waitlist) per poll
+        """
+        history = self.sections[key]
+        timestamps = self.timestamps.values()[history.first_poll:]
+        seats = history.series['seats'].values()
+        waitlist = history.series['waitlist'].values()
+        spaces = history.series['spaces'].values()
+        points = []
+        for ts, s, w, cap in zip(timestamps, seats, waitlist, spaces):
+            fill = (cap - s) / cap if cap else None
+            points.append((ts, round(fill, 4) if fill is not None else None, s, w))
+        return points
+
+    def find_sections(self, course_code):
+        """Keys of all sections of a course like 'CSE 100'"""
+        dept, _, number = course_code.partition(' ')
+        prefix = f"{dept}|{number}|"
+        return [key for key in self.sections if key.startswith(prefix)]
+
+    def filled_since(self, window_seconds=3600, now=None):
+        """
+        Sections that had open seats `window_seconds` ago and are full now
+
+        Returns:
+            list: (key, seats then, waitlist now) sorted by waitlist
+        """
+        if not self.num_polls:
+            return []
+        latest = self.num_polls - 1
+        now = now if now is not None else self.timestamps.last
+        then = self.poll_index_at(now - window_seconds)
+        if then < 0:
+            then = 0
+        filled = []
+        for key, history in self.sections.items():
+            then_index = then - history.first_poll
+            if then_index < 0:
+                continue
+            seats = history.series['seats']
+            seats_then = seats.value_at(then_index)
+            if seats_then > 0 and seats.last == 0:
+                filled.append((key, seats_then, history.series['waitlist'].last))
+        filled.sort(key=lambda item: -item[2])
+        return filled
+
+    def to_bytes(self):
+        header = {
+            'term': self.term,
+            'keys': list(self.sections),
+            'first_poll': [h.first_poll for h in self.sections.values()],
+        }
+        body = bytearray()
+        self.timestamps.encode(body)
+        for history in self.sections.values():
+            for field in FIELDS:
+                history.series[field].encode(body)
+        header_bytes = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        payload = bytearray()
+        write_varint(payload, len(header_bytes))
+        payload += header_bytes
+        payload += body
+        return FILE_MAGIC + zlib.compress(bytes(payload), 9)
+
+    @classmethod
+    def from_bytes(cls, raw):
+        if not raw.startswith(FILE_MAGIC):
+            raise ValueError("Not a seat history file")
+        data = zlib.decompress(raw[len(FILE_MAGIC):])
+        header_len, pos = read_varint(data, 0)
+        header = json.loads(data[pos:pos + header_len])
+        pos += header_len
+
+        history = cls(header['term'])
+        history.timestamps, pos = DeltaSeries.decode(data, pos)
+        for key, first_poll in zip(header['keys'], header['first_poll']):
+            section = SectionHistory(first_poll)
+            for field in FIELDS:
+                section.series[field], pos = DeltaSeries.decode(data, pos)
+            history.sections[key] = section
+        return history
+
+    def save(self, path=None):
+        path = path or history_file(self.term)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(self.to_bytes())
+        os.replace(tmp_path, path)
+        return os.path.getsize(path)
+
+    @classmethod
+    def load(cls, term, path=None):
+        """Load a term's history, or start an empty one"""
+        path = path or history_file(term)
+        if not os.path.exists(path):
+            return cls(term)
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+
+def history_file(term):
+    return os.path.join(HISTORY_DIR, f"{term.lower()}.seats")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record and query seat availability history')
+    parser.add_argument('--term', default='FA25')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    record_parser = subparsers.add_parser('record', help='Append a poll from a course data file')
+    record_parser.add_argument('course_file')
+    record_parser.add_argument('--timestamp', type=int, default=None)
+    filled_parser = subparsers.add_parser('filled', help='Sections that filled recently')
+    filled_parser.add_argument('--hours', type=float, default=1)
+    rate_parser = subparsers.add_parser('fill-rate', help='Fill rate over time for a course')
+    rate_parser.add_argument('course')
+    args = parser.parse_args()
+
+    history = SeatHistory.load(args.term)
+
+    if args.command == 'record':
+        count = history.record_snapshot(schemas.load(args.course_file, schemas.CourseData), args.timestamp)
+        size = history.save()
+        print(f"✅ Recorded {count} sections (poll {history.num_polls}), history is {size / 1024:.1f} KB")
+    elif args.command == 'filled':
+        filled = history.filled_since(int(args.hours * 3600))
+        print(f"📊 {len(filled)} sections filled in the last {args.hours:g}h")
+        for key, seats_then, waitlist in filled:
+            print(f"   {key}: {seats_then} seats -> full, waitlist {waitlist}")
+    else:
+        for key in history.find_sections(args.course):
+            print(key)
+            for ts, fill, seats, waitlist in history.fill_rate(key):
+                stamp = time.strftime('%Y-%m-%d %H:%M', time.localtime(ts))
+                fill_text = f"{fill:.0%}" if fill is not None else '-'
+                print(f"   {stamp}  {fill_text:>5}  seats {seats}  waitlist {waitlist}")
+
+
+if __name__ == "__main__":
+    main()
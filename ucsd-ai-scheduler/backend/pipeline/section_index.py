@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Per-day interval index over a term's sections
+
+Answers "which sections fit between 10am and 2pm on MWF with seats left" with a
+binary search over each day's sorted start times instead of scanning and
+re-parsing every section:
+    python section_index.py --days MWF --start 10:00 --end 14:00 --open
+    python section_index.py --courses "CSE 100" "CSE 101" --days TuTh --min-rating 4
+
+Mirrored by sectionIndex.js for /api/sections; keep the query semantics in sync.
+"""
+
+import argparse
+import bisect
+import re
+import time
+
+from catalog_db import DAY_CODES, parse_days, parse_seats, parse_time_range
+from terms import TermCatalog
+
+DAY_BITS = {day: 1 << i for i, day in enumerate(DAY_CODES)}
+ALL_DAYS = (1 << len(DAY_CODES)) - 1
+MINUTES_PER_DAY = 24 * 60
+
+
+def parse_clock(text):
+    """'14:00' or '2:00p' -> minutes after midnight"""
+    if text is None:
+        return None
+    if text[-1:].lower() in ('a', 'p'):
+        start, _ = parse_time_range(f"{text}-{text}")
+        return start
+    hour, _, minute = text.partition(':')
+    return int(hour) * 60 + int(minute or 0)
+
+
+def format_clock(minutes):
+    return None if minutes is None else f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def parse_day_codes(text):
+    """
+    'MWF' or 'Tu,Th' -> ['M', 'W', 'F'] / ['Tu', 'Th'] in DAY_CODES order
+
+    Raises:
+        ValueError: A token is not a day code (e.g. 'Xy'), so a typo can't widen
+                    the filter to every day
+    """
+    compact = re.sub(r'[\s,]', '', text)
+    tokens = re.findall(r'[A-Z][a-z]?', compact)
+    if not compact or ''.join(tokens) != compact or not set(tokens) <= set(DAY_CODES):
+        raise ValueError(f"days must be day codes like MWF or TuTh ({' '.join(DAY_CODES)}), got {text!r}")
+    return [day for day in DAY_CODES if day in tokens]
+
+
+def day_mask(days):
+    mask = 0
+    for day in days:
+        mask |= DAY_BITS.get(day, 0)
+    return mask
+
+
+class SectionIndex:
+    """
+    Sections of one term, indexed by meeting day and start time
+
+    Each day keeps parallel (start minute, section id) arrays sorted by start. A
+    window query bisects to the sections starting inside the window, then checks
+    end time, the section's full set of days, seats and rating.
+
+    Args:
+        data (dict): Term course data (schemas.CourseData)
+    """
+
+    def __init__(self, data):
+        self.sections = []
+        self.by_course = {}
+        day_entries = {day: [] for day in DAY_CODES}
+        for dept, courses in data.items():
+            for number, sections in courses.items():
+                for section in sections:
+                    slot = len(self.sections)
+                    self.sections.append(self._normalize(dept, number, section))
+                    entry = self.sections[-1]
+                    self.by_course.setdefault(entry['course'], []).append(slot)
+                    if entry['start'] is None:
+                        continue
+                    for day in entry['days']:
+                        if day in day_entries:
+                            day_entries[day].append((entry['start'], slot))
+
+        self.starts = {}
+        self.ids = {}
+        for day, entries in day_entries.items():
+            entries.sort()
+            self.starts[day] = [start for start, _ in entries]
+            self.ids[day] = [slot for _, slot in entries]
+
+    @classmethod
+    def for_term(cls, term=None, catalog=None):
+        return cls((catalog or TermCatalog()).load(term))
+
+    @staticmethod
+    def _normalize(dept, number, section):
+        days = parse_days(section.days)
+        start, end = parse_time_range(section.times)
+        seats, waitlist = parse_seats(section.seatsRemaining)
+        rating = section.professor_rating
+        return {
+            'course': f"{dept} {number}",
+            'dept': dept,
+            'code': number,
+            'sectionType': section.sectionType,
+            'days': days,
+            'mask': day_mask(days),
+            'start': start,
+            'end': end,
+            'professor': section.professor,
+            'seatsRemaining': seats,
+            'waitlist': waitlist,
+            'spaces': section.spaces,
+            'rating': rating.rating if rating else None,
+        }
+
+    def query(self, days=None, start=None, end=None, courses=None, open_only=False,
+              min_rating=None, section_types=None):
+        """
+        Sections that fit a time window and set of days
+
+        Args:
+            days (str|list): Allowed meeting days ('MWF' or ['M', 'W']); every meeting
+                             day of a section must be allowed. None allows every day
+            start (int): Earliest start, minutes after midnight
+            end (int): Latest end, minutes after midnight
+            courses (list): Course codes to restrict to, e.g. ["CSE 100"]
+            open_only (bool): Only sections with seats remaining
+            min_rating (float): Minimum professor rating (unrated sections are dropped)
+            section_types (list): Section types such as ["LE", "DI"]
+
+        Returns:
+            list: Matching sections ordered by course and start time
+
+        Raises:
+            ValueError: days is a string with a token that is not a day code
+        """
+        allowed_days = parse_day_codes(days) if isinstance(days, str) else days
+        allowed = day_mask(allowed_days) if allowed_days is not None else ALL_DAYS
+        timed = days is not None or start is not None or end is not None
+        window_start = start if start is not None else 0
+        window_end = end if end is not None else MINUTES_PER_DAY
+
+        if courses:
+            candidates = {slot for code in courses for slot in self.by_course.get(code.upper(), ())}
+        elif timed:
+            candidates = set()
+            for day in allowed_days if allowed_days is not None else DAY_CODES:
+                starts = self.starts.get(day, [])
+                lo = bisect.bisect_left(starts, window_start)
+                hi = bisect.bisect_right(starts, window_end)
+                candidates.update(self.ids[day][lo:hi])
+        else:
+            candidates = range(len(self.sections))
+
+        types = {t.upper() for t in section_types} if section_types else None
+        results = []
+        for slot in candidates:
+            section = self.sections[slot]
+            if timed:
+                if section['start'] is None or not section['mask'] or section['mask'] & ~allowed:
+                    continue
+                if section['start'] < window_start or section['end'] > window_end:
+                    continue
+            if open_only and not section['seatsRemaining']:
+                continue
+            if min_rating is not None and (section['rating'] is None or section['rating'] < min_rating):
+                continue
+            if types and (section['sectionType'] or '').upper() not in types:
+                continue
+            results.append(section)
+        results.sort(key=lambda s: (s['course'], s['start'] if s['start'] is not None else MINUTES_PER_DAY))
+        return [self.public(s) for s in results]
+
+    @staticmethod
+    def public(section):
+        result = {k: v for k, v in section.items() if k not in ('mask', 'start', 'end')}
+        result['times'] = {'start': format_clock(section['start']), 'end': format_clock(section['end'])}
+        return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find sections that fit a time window')
+    parser.add_argument('--term', default=None, help='Term code (default: current)')
+    parser.add_argument('--days', default=None, help='Allowed meeting days, e.g. MWF or TuTh')
+    parser.add_argument('--start', default=None, help='Earliest start, e.g. 10:00')
+    parser.add_argument('--end', default=None, help='Latest end, e.g. 14:00')
+    parser.add_argument('--courses', nargs='*', default=None, help='Restrict to these course codes')
+    parser.add_argument('--open', action='store_true', help='Only sections with seats remaining')
+    parser.add_argument('--min-rating', type=float, default=None)
+    parser.add_argument('--types', nargs='*', default=None, help='Section types, e.g. LE DI')
+    parser.add_argument('--limit', type=int, default=20)
+    args = parser.parse_args()
+    if args.days is not None:
+        try:
+            parse_day_codes(args.days)
+        except ValueError as e:
+            parser.error(str(e))
+
+    start = time.perf_counter()
+    index = SectionIndex.for_term(args.term)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    results = index.query(args.days, parse_clock(args.start), parse_clock(args.end), args.courses,
+                          args.open, args.min_rating, args.types)
+    query_ms = (time.perf_counter() - start) * 1000
+
+    for section in results[:args.limit]:
+        times = section['times']
+        rating = f" ★ {section['rating']}" if section['rating'] else ''
+        print(f"   {section['course']:<10} {section['sectionType']} {''.join(section['days']):<6} "
+              f"{times['start']}-{times['end']}  seats {section['seatsRemaining']}  {section['professor']}{rating}")
+    print(f"🔍 {len(results)} sections of {len(index.sections)} "
+          f"(index built in {build_ms:.0f} ms, query {query_ms:.2f} ms)")
+
+
+if __name__ == "__main__":
+    main()
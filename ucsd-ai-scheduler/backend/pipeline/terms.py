@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Term-partitioned course data: one file per term plus a manifest
+
+classesScraper.py writes data/<term>.json and data/manifest.json; the same
+layout is served from public/course_data. A term is only read from disk the
+first time it is requested.
+    python terms.py            # list terms
+    python terms.py WI26       # load one term and summarize it
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+
+import schemas
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+COURSE_DATA_DIR = os.path.join(BACKEND_DIR, 'public', 'course_data')
+MANIFEST_NAME = 'manifest.json'
+
+# Rated variants win over the raw scrape (same order as loadCourses() in server.js)
+VARIANT_SUFFIXES = [
+    '_with_individual_professor_ratings',
+    '_with_cse_math_ratings',
+    '_with_ratings',
+    '',
+]
+TERM_FILE = re.compile(r'^([a-z]{2}\d{2})(_with_[a-z_]+)?\.json$')
+# Quarter order within a calendar year
+QUARTER_ORDER = ['WI', 'SP', 'S1', 'S2', 'S3', 'SU', 'FA']
+
+
+def term_sort_key(term):
+    """Chronological key for term codes like 'FA25'"""
+    quarter, year = term[:2].upper(), term[2:]
+    order = QUARTER_ORDER.index(quarter) if quarter in QUARTER_ORDER else len(QUARTER_ORDER)
+    return (int(year) if year.isdigit() else 0, order)
+
+
+def best_variant(course_data_dir, base_name):
+    """Most enriched file available for a term, e.g. fa25 -> fa25_with_individual_professor_ratings.json"""
+    stem = os.path.splitext(base_name)[0]
+    for suffix in VARIANT_SUFFIXES:
+        candidate = f"{stem}{suffix}.json"
+        if os.path.exists(os.path.join(course_data_dir, candidate)):
+            return candidate
+    return None
+
+
+def discover_term_files(course_data_dir=COURSE_DATA_DIR):
+    """
+    Map term codes to their best data file
+
+    Uses the manifest when there is one, otherwise recognizes <term>[_with_*].json
+    files in the directory.
+
+    Returns:
+        tuple: ({term: absolute path}, current term or None)
+    """
+    manifest_path = os.path.join(course_data_dir, MANIFEST_NAME)
+    files = {}
+    current = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+        current = manifest.get('current')
+        for term, entry in manifest.get('terms', {}).items():
+            name = best_variant(course_data_dir, entry.get('file', f"{term.lower()}.json"))
+            if name:
+                files[term.upper()] = os.path.join(course_data_dir, name)
+    else:
+        for name in sorted(os.listdir(course_data_dir)) if os.path.isdir(course_data_dir) else []:
+            match = TERM_FILE.match(name)
+            if match and match.group(1).upper() not in files:
+                term = match.group(1).upper()
+                files[term] = os.path.join(course_data_dir, best_variant(course_data_dir, match.group(1)))
+    if current is None and files:
+        # Without a manifest the newest term is the default
+        current = max(files, key=term_sort_key)
+    return files, current
+
+
+class TermCatalog:
+    """Lazily loaded {term: course data} for every term in a course_data directory"""
+
+    def __init__(self, course_data_dir=COURSE_DATA_DIR):
+        self.course_data_dir = course_data_dir
+        self.files, self.current = discover_term_files(course_data_dir)
+        self._loaded = {}
+        self._lock = threading.Lock()
+
+    def terms(self):
+        return sorted(self.files, key=term_sort_key)
+
+    def is_loaded(self, term):
+        return term.upper() in self._loaded
+
+    def load(self, term=None):
+        """Course data for a term (schemas.CourseData), read on first use"""
+        term = (term or self.current or '').upper()
+        if term not in self.files:
+            raise KeyError(f"Unknown term {term!r}; available: {', '.join(self.terms()) or 'none'}")
+        with self._lock:
+            if term not in self._loaded:
+                self._loaded[term] = schemas.load(self.files[term], schemas.CourseData)
+            return self._loaded[term]
+
+    def unload(self, term):
+        with self._lock:
+            self._loaded.pop(term.upper(), None)
+
+
+def main():
+    catalog = TermCatalog()
+    if len(sys.argv) < 2:
+        for term in catalog.terms():
+            marker = ' (current)' if term == catalog.current else ''
+            print(f"   {term}: {os.path.basename(catalog.files[term])}{marker}")
+        return
+    data = catalog.load(sys.argv[1])
+    sections = sum(len(s) for courses in data.values() for s in courses.values())
+    print(f"✅ {sys.argv[1].upper()}: {len(data)} departments, {sections} sections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import * as fs from "fs";
+
+// Progress toward every program in public/prereqdata/departments.json through an
+// inverted course -> programs index. Mirrors pipeline/program_progress.py.
+
+export class ProgramProgressIndex {
+  constructor(programs) {
+    this.programs = [];
+    this.byCourse = new Map();
+    for (const key of Object.keys(programs).sort()) {
+      const program = programs[key];
+      const courses = [...new Set(program.courses || [])];
+      const slot = this.programs.length;
+      this.programs.push({
+        code: program.code || key,
+        name: program.name || key,
+        link: program.link || null,
+        total: courses.length,
+      });
+      for (const code of courses) {
+        if (!this.byCourse.has(code)) this.byCourse.set(code, []);
+        this.byCourse.get(code).push(slot);
+      }
+    }
+  }
+
+  static load(file) {
+    return new ProgramProgressIndex(JSON.parse(fs.readFileSync(file, "utf8")));
+  }
+
+  // Programs ranked by remaining courses, then most completed, then code
+  evaluate(completed, { limit = null, includeUntouched = false } = {}) {
+    const matched = new Map();
+    for (const code of new Set(completed)) {
+      for (const slot of this.byCourse.get(code) || []) {
+        if (!matched.has(slot)) matched.set(slot, []);
+        matched.get(slot).push(code);
+      }
+    }
+
+    const slots = includeUntouched ? this.programs.map((_, i) => i) : [...matched.keys()];
+    const results = slots.map(slot => {
+      const program = this.programs[slot];
+      const courses = matched.get(slot) || [];
+      return {
+        ...program,
+        completed: courses.length,
+        remaining: program.total - courses.length,
+        progress: program.total ? Math.round((courses.length / program.total) * 10000) / 10000 : 0,
+        matched: courses,
+      };
+    });
+    results.sort((a, b) =>
+      a.remaining - b.remaining || b.completed - a.completed || (a.code < b.code ? -1 : a.code > b.code ? 1 : 0));
+    return limit ? results.slice(0, limit) : results;
+  }
+}
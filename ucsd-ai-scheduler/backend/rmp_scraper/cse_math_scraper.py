@@ -3,37 +3,42 @@
 Targeted UCSD RateMyProfessor scraper for CSE and MATH departments only
 """
 
+import os
+import sys
 import time
 import json
 import re
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pipeline"))
+from run_metrics import RunMetrics
+from driver_pool import start_driver
+
+metrics = RunMetrics("cse_math_scraper")
+
+# RMP_BASE_URL points the scraper at a recorded copy of the site (pipeline/replay_server.py)
+RMP_BASE_URL = os.environ.get("RMP_BASE_URL", "https://www.ratemyprofessors.com")
 
 class CSEMathScraper:
-    def __init__(self):
+    def __init__(self, base_url=None):
         self.driver = None
+        self.base_url = (base_url or RMP_BASE_URL).rstrip("/")
         self.ucsd_school_id = "1079"
         self.target_departments = ["Computer Science", "Mathematics", "Computer Science & Engineering", "CSE"]
         self.all_professors = []
         self.setup_driver()
     
     def setup_driver(self):
-        """Setup Chrome driver with options"""
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+        """Setup Chrome driver with options (chromedriver path is cached by driver_pool)"""
+        chrome_args = [
+            "--headless",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--window-size=1920,1080",
+            "--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+        ]
         
         try:
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()),
-                options=options
-            )
+            self.driver = start_driver(chrome_args, metrics)
             print("✅ Chrome driver initialized successfully")
         except Exception as e:
             print(f"❌ Failed to initialize Chrome driver: {e}")
@@ -89,6 +94,8 @@ class CSEMathScraper:
     
     def load_more_professors(self):
         """Load more professors by clicking Show More button"""
+        from selenium.webdriver.common.by import By
+
         try:
             # Try different selectors for the Show More button
             selectors = [
@@ -111,7 +118,8 @@ class CSEMathScraper:
                 if show_more_button.is_enabled():
                     print(f"   ➡️  Clicking Show More button...")
                     self.driver.execute_script("arguments[0].click();", show_more_button)
-                    time.sleep(3)
+                    with metrics.stage("wait"):
+                        time.sleep(3)
                     return True
                 else:
                     print(f"   ⏹️  Show More button is disabled")
@@ -133,11 +141,13 @@ class CSEMathScraper:
         
         try:
             # Navigate to UCSD page
-            url = f"https://www.ratemyprofessors.com/search/professors/{self.ucsd_school_id}?q=*"
+            url = f"{self.base_url}/search/professors/{self.ucsd_school_id}?q=*"
             print(f"📄 Loading: {url}")
             
-            self.driver.get(url)
-            time.sleep(5)
+            with metrics.stage("page_load"):
+                self.driver.get(url)
+            with metrics.stage("wait"):
+                time.sleep(5)
             
             # Verify we're on the right page
             try:
@@ -156,7 +166,9 @@ class CSEMathScraper:
                 print(f"📄 Processing page {page + 1}...")
                 
                 # Extract professors from current page
-                page_professors = self.extract_professors_from_page()
+                with metrics.stage("extract"):
+                    page_professors = self.extract_professors_from_page()
+                metrics.incr("pages")
                 
                 if not page_professors:
                     print(f"❌ No target department professors found on page {page + 1}")
@@ -168,6 +180,7 @@ class CSEMathScraper:
                         if not any(p['id'] == prof['id'] for p in self.all_professors):
                             self.all_professors.append(prof)
                             new_professors += 1
+                    metrics.incr("professors", new_professors)
                     
                     print(f"   📊 Page {page + 1}: {len(page_professors)} target professors, {new_professors} new, Total: {len(self.all_professors)}")
                     
@@ -196,8 +209,10 @@ class CSEMathScraper:
     def save_progress(self, filename):
         """Save current progress to file"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.all_professors, f, indent=2)
+            with metrics.stage("write_json"):
+                with open(filename, 'w') as f:
+                    json.dump(self.all_professors, f, indent=2)
+            metrics.record_file_written(filename)
             print(f"💾 Progress saved to {filename}")
         except Exception as e:
             print(f"❌ Error saving progress: {e}")
@@ -205,8 +220,10 @@ class CSEMathScraper:
     def save_final_data(self, filename="cse_math_professors.json"):
         """Save final data to file"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.all_professors, f, indent=2)
+            with metrics.stage("write_json"):
+                with open(filename, 'w') as f:
+                    json.dump(self.all_professors, f, indent=2)
+            metrics.record_file_written(filename)
             print(f"💾 Final data saved to {filename}")
         except Exception as e:
             print(f"❌ Error saving final data: {e}")
@@ -258,7 +275,8 @@ def main():
     
     try:
         # Scrape CSE and MATH professors
-        professors = scraper.scrape_target_departments(max_pages=100)  # Increased pages for better coverage
+        with metrics.stage("scrape"):
+            professors = scraper.scrape_target_departments(max_pages=100)  # Increased pages for better coverage
         
         if professors:
             print(f"✅ Successfully scraped {len(professors)} CSE/MATH professors")
@@ -282,6 +300,7 @@ def main():
             
     finally:
         scraper.close()
+        metrics.finish()
 
 if __name__ == "__main__":
     main()
@@ -3,15 +3,20 @@
 Integrate CSE/MATH professor ratings into course data
 """
 
-import json
 import os
+import sys
 from collections import defaultdict
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pipeline"))
+import schemas
+from run_metrics import RunMetrics
+
+metrics = RunMetrics("integrate_cse_math_ratings")
+
 def load_cse_math_professors():
     """Load CSE/MATH professor data"""
     try:
-        with open('cse_math_professors.json', 'r') as f:
-            professors = json.load(f)
+        professors = schemas.load('cse_math_professors.json', schemas.Professors)
         print(f"✅ Loaded {len(professors)} CSE/MATH professors")
         return professors
     except Exception as e:
@@ -21,8 +26,7 @@ def load_cse_math_professors():
 def load_course_data():
     """Load course data"""
     try:
-        with open('../Classes_Scraper/data/fa25.json', 'r') as f:
-            courses = json.load(f)
+        courses = schemas.load('../Classes_Scraper/data/fa25.json', schemas.CourseData)
         print(f"✅ Loaded course data with {len(courses)} departments")
         return courses
     except Exception as e:
@@ -47,15 +51,15 @@ def calculate_department_stats(professors):
     })
     
     for prof in professors:
-        dept = prof['department']
-        if prof['avg_rating']:
-            dept_stats[dept]['ratings'].append(prof['avg_rating'])
-        if prof['avg_difficulty']:
-            dept_stats[dept]['difficulties'].append(prof['avg_difficulty'])
-        if prof['would_take_again_percent']:
-            dept_stats[dept]['would_take_again'].append(prof['would_take_again_percent'])
-        if prof['num_ratings']:
-            dept_stats[dept]['total_ratings'] += prof['num_ratings']
+        dept = prof.department
+        if prof.avg_rating:
+            dept_stats[dept]['ratings'].append(prof.avg_rating)
+        if prof.avg_difficulty:
+            dept_stats[dept]['difficulties'].append(prof.avg_difficulty)
+        if prof.would_take_again_percent:
+            dept_stats[dept]['would_take_again'].append(prof.would_take_again_percent)
+        if prof.num_ratings:
+            dept_stats[dept]['total_ratings'] += prof.num_ratings
     
     # Calculate averages
     for dept in dept_stats:
@@ -77,18 +81,10 @@ def integrate_ratings(courses, dept_stats, dept_mapping):
         enhanced_courses[dept] = {}
         
         for course_num, sections in dept_courses.items():
-            if not isinstance(sections, list):
-                continue
-                
             enhanced_sections_list = []
             
             for section in sections:
-                if not isinstance(section, dict):
-                    enhanced_sections_list.append(section)
-                    continue
-                
                 total_sections += 1
-                enhanced_section = dict(section)
                 
                 # Find matching department stats
                 matching_stats = None
@@ -98,17 +94,17 @@ def integrate_ratings(courses, dept_stats, dept_mapping):
                         break
                 
                 if matching_stats:
-                    enhanced_section['professor_rating'] = {
-                        'rating': round(matching_stats['avg_rating'], 1),
-                        'difficulty': round(matching_stats['avg_difficulty'], 1),
-                        'num_ratings': matching_stats['total_ratings'],
-                        'would_take_again': round(matching_stats['avg_would_take_again'], 1),
-                        'department': rmp_dept,
-                        'num_professors': matching_stats['num_professors']
-                    }
+                    section = schemas.replace(section, professor_rating=schemas.ProfessorRating(
+                        rating=round(matching_stats['avg_rating'], 1),
+                        difficulty=round(matching_stats['avg_difficulty'], 1),
+                        num_ratings=matching_stats['total_ratings'],
+                        would_take_again=round(matching_stats['avg_would_take_again'], 1),
+                        department=rmp_dept,
+                        num_professors=matching_stats['num_professors']
+                    ))
                     enhanced_sections += 1
                 
-                enhanced_sections_list.append(enhanced_section)
+                enhanced_sections_list.append(section)
             
             enhanced_courses[dept][course_num] = enhanced_sections_list
     
@@ -120,11 +116,13 @@ def main():
     print("🚀 Starting CSE/MATH professor rating integration...")
     
     # Load data
-    professors = load_cse_math_professors()
+    with metrics.stage("load"):
+        professors = load_cse_math_professors()
     if not professors:
         return
     
-    courses = load_course_data()
+    with metrics.stage("load"):
+        courses = load_course_data()
     if not courses:
         return
     
@@ -137,13 +135,21 @@ def main():
         print(f"   {dept}: {stats['num_professors']} professors, Avg Rating: {stats['avg_rating']:.1f}, Avg Difficulty: {stats['avg_difficulty']:.1f}")
     
     # Integrate ratings
-    enhanced_courses = integrate_ratings(courses, dept_stats, dept_mapping)
+    with metrics.stage("integrate"):
+        enhanced_courses = integrate_ratings(courses, dept_stats, dept_mapping)
+    metrics.incr("sections", sum(len(sections) for dept_courses in enhanced_courses.values()
+                                 for sections in dept_courses.values()))
+    metrics.incr("sections_rated", sum(1 for dept_courses in enhanced_courses.values()
+                                       for sections in dept_courses.values()
+                                       for section in sections
+                                       if section.professor_rating))
     
     # Save enhanced data
     output_file = '../Classes_Scraper/data/fa25_with_cse_math_ratings.json'
     try:
-        with open(output_file, 'w') as f:
-            json.dump(enhanced_courses, f, indent=2)
+        with metrics.stage("write_json"):
+            schemas.dump(enhanced_courses, output_file, indent=2)
+        metrics.record_file_written(output_file)
         print(f"💾 Enhanced course data saved to {output_file}")
     except Exception as e:
         print(f"❌ Error saving enhanced data: {e}")
@@ -154,16 +160,18 @@ def main():
     for dept, dept_courses in enhanced_courses.items():
         if dept in ['CSE', 'MATH']:
             for course_num, sections in dept_courses.items():
-                if isinstance(sections, list) and sections:
+                if sections:
                     section = sections[0]
-                    if isinstance(section, dict) and 'professor_rating' in section:
-                        rating = section['professor_rating']
-                        print(f"   {dept} {course_num}: Rating {rating['rating']}, Difficulty {rating['difficulty']}, {rating['num_professors']} professors")
+                    if section.professor_rating:
+                        rating = section.professor_rating
+                        print(f"   {dept} {course_num}: Rating {rating.rating}, Difficulty {rating.difficulty}, {rating.num_professors} professors")
                         sample_count += 1
                         if sample_count >= 5:
                             break
         if sample_count >= 5:
             break
 
+    metrics.finish()
+
 if __name__ == "__main__":
     main()
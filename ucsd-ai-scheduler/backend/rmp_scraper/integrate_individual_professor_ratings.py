@@ -3,15 +3,20 @@
 Integrate individual professor ratings into course data by matching professor names
 """
 
-import json
 import os
+import sys
 from collections import defaultdict
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "pipeline"))
+import schemas
+from run_metrics import RunMetrics
+
+metrics = RunMetrics("integrate_individual_ratings")
+
 def load_cse_math_professors():
     """Load CSE/MATH professor data"""
     try:
-        with open('cse_math_professors.json', 'r') as f:
-            professors = json.load(f)
+        professors = schemas.load('cse_math_professors.json', schemas.Professors)
         print(f"✅ Loaded {len(professors)} CSE/MATH professors")
         return professors
     except Exception as e:
@@ -21,8 +26,7 @@ def load_cse_math_professors():
 def load_course_data():
     """Load course data"""
     try:
-        with open('../Classes_Scraper/data/fa25.json', 'r') as f:
-            courses = json.load(f)
+        courses = schemas.load('../Classes_Scraper/data/fa25.json', schemas.CourseData)
         print(f"✅ Loaded course data with {len(courses)} departments")
         return courses
     except Exception as e:
@@ -79,7 +83,7 @@ def create_professor_lookup(professors):
     lookup = {}
     
     for prof in professors:
-        full_name = prof.get('full_name', '')
+        full_name = prof.full_name
         if full_name:
             # Get all name variations
             name_variations = convert_name_format(full_name)
@@ -126,36 +130,28 @@ def integrate_individual_ratings(courses, professor_lookup):
         enhanced_courses[dept] = {}
         
         for course_num, sections in dept_courses.items():
-            if not isinstance(sections, list):
-                continue
-                
             enhanced_sections_list = []
             
             for section in sections:
-                if not isinstance(section, dict):
-                    enhanced_sections_list.append(section)
-                    continue
-                
                 total_sections += 1
-                enhanced_section = dict(section)
                 
                 # Try to find individual professor rating
-                professor_name = section.get('professor', '')
+                professor_name = section.professor
                 professor_rating = find_professor_rating(professor_name, professor_lookup)
                 
                 if professor_rating:
-                    enhanced_section['professor_rating'] = {
-                        'rating': professor_rating['avg_rating'],
-                        'difficulty': professor_rating['avg_difficulty'],
-                        'num_ratings': professor_rating['num_ratings'],
-                        'would_take_again': professor_rating['would_take_again_percent'],
-                        'department': professor_rating['department'],
-                        'professor_id': professor_rating['id']
-                    }
+                    section = schemas.replace(section, professor_rating=schemas.ProfessorRating(
+                        rating=professor_rating.avg_rating,
+                        difficulty=professor_rating.avg_difficulty,
+                        num_ratings=professor_rating.num_ratings,
+                        would_take_again=professor_rating.would_take_again_percent,
+                        department=professor_rating.department,
+                        professor_id=professor_rating.id
+                    ))
                     enhanced_sections += 1
                     matched_professors.add(professor_name)
                 
-                enhanced_sections_list.append(enhanced_section)
+                enhanced_sections_list.append(section)
             
             enhanced_courses[dept][course_num] = enhanced_sections_list
     
@@ -168,11 +164,13 @@ def main():
     print("🚀 Starting individual professor rating integration...")
     
     # Load data
-    professors = load_cse_math_professors()
+    with metrics.stage("load"):
+        professors = load_cse_math_professors()
     if not professors:
         return
     
-    courses = load_course_data()
+    with metrics.stage("load"):
+        courses = load_course_data()
     if not courses:
         return
     
@@ -180,13 +178,21 @@ def main():
     professor_lookup = create_professor_lookup(professors)
     
     # Integrate individual ratings
-    enhanced_courses = integrate_individual_ratings(courses, professor_lookup)
+    with metrics.stage("integrate"):
+        enhanced_courses = integrate_individual_ratings(courses, professor_lookup)
+    metrics.incr("sections", sum(len(sections) for dept_courses in enhanced_courses.values()
+                                 for sections in dept_courses.values()))
+    metrics.incr("sections_rated", sum(1 for dept_courses in enhanced_courses.values()
+                                       for sections in dept_courses.values()
+                                       for section in sections
+                                       if section.professor_rating))
     
     # Save enhanced data
     output_file = '../Classes_Scraper/data/fa25_with_individual_professor_ratings.json'
     try:
-        with open(output_file, 'w') as f:
-            json.dump(enhanced_courses, f, indent=2)
+        with metrics.stage("write_json"):
+            schemas.dump(enhanced_courses, output_file, indent=2)
+        metrics.record_file_written(output_file)
         print(f"💾 Enhanced course data saved to {output_file}")
     except Exception as e:
         print(f"❌ Error saving enhanced data: {e}")
@@ -197,16 +203,17 @@ def main():
     for dept, dept_courses in enhanced_courses.items():
         if dept in ['CSE', 'MATH']:
             for course_num, sections in dept_courses.items():
-                if isinstance(sections, list) and sections:
-                    for section in sections:
-                        if isinstance(section, dict) and 'professor_rating' in section:
-                            rating = section['professor_rating']
-                            print(f"   {dept} {course_num} - {section.get('professor', 'Unknown')}: Rating {rating['rating']}, Difficulty {rating['difficulty']}, {rating['num_ratings']} ratings")
-                            sample_count += 1
-                            if sample_count >= 5:
-                                break
+                for section in sections:
+                    if section.professor_rating:
+                        rating = section.professor_rating
+                        print(f"   {dept} {course_num} - {section.professor or 'Unknown'}: Rating {rating.rating}, Difficulty {rating.difficulty}, {rating.num_ratings} ratings")
+                        sample_count += 1
+                        if sample_count >= 5:
+                            break
         if sample_count >= 5:
             break
 
+    metrics.finish()
+
 if __name__ == "__main__":
     main()
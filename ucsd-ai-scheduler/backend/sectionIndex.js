@@ -0,0 +1,114 @@
+// Per-day interval index over a term's sections for /api/sections. Each day keeps
+// start times sorted so a window query is a binary search plus the sections that
+// start inside it. Mirrors pipeline/section_index.py; keep the query semantics in sync.
+
+export const DAY_CODES = ["M", "Tu", "W", "Th", "F", "Sa", "Su"];
+const ALL_DAYS = (1 << DAY_CODES.length) - 1;
+const MINUTES_PER_DAY = 24 * 60;
+
+// "14:00" -> 840
+export function toMinutes(clock) {
+  if (!clock) return null;
+  const [hour, minute = "0"] = clock.split(":");
+  return Number(hour) * 60 + Number(minute);
+}
+
+// "MWF" or "Tu,Th" -> ["M", "W", "F"] / ["Tu", "Th"] in DAY_CODES order; null if any
+// token is not a day code (e.g. "Xy"), so a typo can't widen the filter to every day
+export function parseDayCodes(text) {
+  const compact = text.replace(/[\s,]/g, "");
+  const tokens = compact.match(/[A-Z][a-z]?/g) || [];
+  if (!compact || tokens.join("") !== compact || !tokens.every(day => DAY_CODES.includes(day))) return null;
+  return DAY_CODES.filter(day => tokens.includes(day));
+}
+
+function dayMask(days) {
+  return days.reduce((mask, day) => mask | (DAY_CODES.includes(day) ? 1 << DAY_CODES.indexOf(day) : 0), 0);
+}
+
+// First index whose value is greater than (or, with inclusive, at least) target
+function bisect(values, target, inclusive) {
+  let lo = 0;
+  let hi = values.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (inclusive ? values[mid] < target : values[mid] <= target) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+export class SectionIndex {
+  // sections: the normalized entries from loadCourses() (days array, times {start, end})
+  constructor(sections) {
+    this.sections = sections;
+    this.entries = sections.map(section => ({
+      course: `${section.dept} ${section.code}`,
+      mask: dayMask(section.days || []),
+      start: toMinutes(section.times?.start),
+      end: toMinutes(section.times?.end),
+    }));
+    this.byCourse = new Map();
+    const perDay = Object.fromEntries(DAY_CODES.map(day => [day, []]));
+    this.entries.forEach((entry, i) => {
+      if (!this.byCourse.has(entry.course)) this.byCourse.set(entry.course, []);
+      this.byCourse.get(entry.course).push(i);
+      if (entry.start === null) return;
+      for (const day of this.sections[i].days) perDay[day]?.push(i);
+    });
+    this.starts = {};
+    this.ids = {};
+    for (const [day, ids] of Object.entries(perDay)) {
+      ids.sort((a, b) => this.entries[a].start - this.entries[b].start);
+      this.ids[day] = Int32Array.from(ids);
+      this.starts[day] = Int32Array.from(ids, i => this.entries[i].start);
+    }
+  }
+
+  // days: allowed meeting days (every meeting day of a section must be allowed;
+  // null allows all of them); start/end: window in minutes after midnight
+  query({ days = null, start = null, end = null, courses = null, openOnly = false, minRating = null, sectionTypes = null } = {}) {
+    const allowed = days !== null ? dayMask(days) : ALL_DAYS;
+    const timed = days !== null || start !== null || end !== null;
+    const windowStart = start ?? 0;
+    const windowEnd = end ?? MINUTES_PER_DAY;
+
+    let candidates;
+    if (courses && courses.length) {
+      candidates = new Set(courses.flatMap(code => this.byCourse.get(code.toUpperCase()) || []));
+    } else if (timed) {
+      candidates = new Set();
+      for (const day of days ?? DAY_CODES) {
+        const starts = this.starts[day];
+        if (!starts) continue;
+        const hi = bisect(starts, windowEnd, false);
+        for (let k = bisect(starts, windowStart, true); k < hi; k++) candidates.add(this.ids[day][k]);
+      }
+    } else {
+      candidates = this.sections.keys();
+    }
+
+    const types = sectionTypes && sectionTypes.length ? new Set(sectionTypes.map(t => t.toUpperCase())) : null;
+    const results = [];
+    for (const i of candidates) {
+      const entry = this.entries[i];
+      const section = this.sections[i];
+      if (timed) {
+        if (entry.start === null || !entry.mask || entry.mask & ~allowed) continue;
+        if (entry.start < windowStart || entry.end > windowEnd) continue;
+      }
+      if (openOnly && !(section.seatsRemaining > 0)) continue;
+      const rating = section.professor_rating?.rating ?? null;
+      if (minRating !== null && (rating === null || rating < minRating)) continue;
+      if (types && !types.has((section.sectionType || "").toUpperCase())) continue;
+      results.push(i);
+    }
+    results.sort((a, b) => {
+      const x = this.entries[a];
+      const y = this.entries[b];
+      if (x.course !== y.course) return x.course < y.course ? -1 : 1;
+      return (x.start ?? MINUTES_PER_DAY) - (y.start ?? MINUTES_PER_DAY);
+    });
+    return results.map(i => this.sections[i]);
+  }
+}
@@ -1,150 +1,168 @@
 import express from 'express';
 import dotenv from 'dotenv';
 import cors from 'cors';
-import { GoogleGenerativeAI } from '@google/generative-ai';
-import * as fs from "fs"; 
-import path from "path";
+import { timingSafeEqual } from 'crypto';
+import { createLLMClient } from './llmClient.js';
+import {
+  describeCourse,
+  prefilterCourses,
+  encodeCandidates,
+  cacheKey,
+  extractJson,
+  ResponseCache,
+  candidateLimit
+} from './aiFilter.js';
+import { CourseSearchIndex } from './courseSearch.js';
+import { DegreePlanner, DEFAULT_UNIT_CAP } from './degreePlanner.js';
+import { ProgramProgressIndex } from './programProgress.js';
+import {
+  loadCatalog,
+  readSnapshot,
+  loadCourses,
+  termSortKey,
+  CatalogReloader,
+  ClusterCatalogClient
+} from './catalog.js';
+import { DAY_CODES, SectionIndex, parseDayCodes, toMinutes } from './sectionIndex.js';
 
-const PORT = process.env.PORT || 3001;
 dotenv.config();
+const PORT = process.env.PORT || 3001;
 const app = express();
 app.use(cors());
 app.use(express.json({ limit: '10mb' }));
 
-// Utility to split days string like "TuTh" => ["Tu", "Th"]
-function parseDays(daysStr) {
-  // Always parse in order: M Tu W Th F (handle abbreviations properly)
-  const days = ["M", "Tu", "W", "Th", "F"];
-  const result = [];
-
-  // Walk through days in order and check if daysStr contains them
-  for (const day of days) {
-    if (daysStr.includes(day)) {
-      result.push(day);
-      // Remove found day so it’s not double counted (important for 'Th' and 'T')
-      daysStr = daysStr.replace(day, '');
+// Catalog data and the indexes derived from it. Handlers read these bindings
+// without awaiting in between, so useCatalog() swapping them all in one
+// synchronous call is atomic for every request.
+let catalog;
+let terms, coursesByTerm, allCourses;
+let allMajorReqs, majorReqs, allPrereqs, colleges;
+let programIndex, searchIndex;
+
+function useCatalog(next) {
+  // Derived indexes are rebuilt only when their source data changed
+  const nextProgramIndex = programIndex && next.programs === catalog.programs
+    ? programIndex
+    : new ProgramProgressIndex(next.programs);
+  const nextSearchIndex = searchIndex !== undefined && next.searchIndex === catalog.searchIndex
+    ? searchIndex
+    : next.searchIndex ? new CourseSearchIndex(next.searchIndex) : null;
+  // Create a version for dropdown (excluding honors variants)
+  const nextMajorReqs = {};
+  Object.keys(next.allMajorReqs).forEach(code => {
+    if (!code.endsWith("H")) {
+      nextMajorReqs[code] = next.allMajorReqs[code];
     }
-  }
-  return result;
-}
-
-// Utility to parse times like "3:30p-4:50p" into { start: "15:30", end: "16:50" }
-function parseTimes(timesStr) {
-  // Simple regex to split start/end and convert to 24h format
-  // Assumes times are always like "h:mmp-h:mmp" or "hh:mmp-h:mmp"
-  const parts = timesStr.split('-');
-  if (parts.length !== 2) return { start: null, end: null };
-
-  function convert12to24(time12h) {
-    const match = time12h.match(/(\d{1,2}):(\d{2})(a|p)/i);
-    if (!match) return null;
-    let [_, hour, min, ampm] = match;
-    hour = parseInt(hour);
-    min = parseInt(min);
-    if (ampm.toLowerCase() === 'p' && hour !== 12) hour += 12;
-    if (ampm.toLowerCase() === 'a' && hour === 12) hour = 0;
-    return `${hour.toString().padStart(2, '0')}:${min.toString().padStart(2, '0')}`;
-  }
+  });
 
-  return {
-    start: convert12to24(parts[0]),
-    end: convert12to24(parts[1]),
-  };
+  catalog = next;
+  ({ terms, coursesByTerm, allMajorReqs, allPrereqs, colleges } = next);
+  majorReqs = nextMajorReqs;
+  programIndex = nextProgramIndex;
+  searchIndex = nextSearchIndex;
+  allCourses = getTermCourses();
 }
 
-
-// Utility to load all on-demand course data at startup
-const COURSE_FILE = "public/course_data/fa25.json";
-const COURSE_FILE_WITH_RATINGS = "public/course_data/fa25_with_ratings.json";
-const COURSE_FILE_WITH_CSE_MATH_RATINGS = "public/course_data/fa25_with_cse_math_ratings.json";
-const COURSE_FILE_WITH_INDIVIDUAL_RATINGS = "public/course_data/fa25_with_individual_professor_ratings.json";
-function loadCourses() {
-  // Try to load enhanced data with ratings first, fallback to original data
-  let courseFile = COURSE_FILE;
-  if (fs.existsSync(COURSE_FILE_WITH_INDIVIDUAL_RATINGS)) {
-    courseFile = COURSE_FILE_WITH_INDIVIDUAL_RATINGS;
-  } else if (fs.existsSync(COURSE_FILE_WITH_CSE_MATH_RATINGS)) {
-    courseFile = COURSE_FILE_WITH_CSE_MATH_RATINGS;
-  } else if (fs.existsSync(COURSE_FILE_WITH_RATINGS)) {
-    courseFile = COURSE_FILE_WITH_RATINGS;
-  } else {
+// Sections for a term (default: current), parsed the first time the term is requested
+function getTermCourses(term) {
+  const key = (term || terms.current || "").toUpperCase();
+  if (!terms.files[key]) return null;
+  if (!coursesByTerm.has(key)) {
+    coursesByTerm.set(key, loadCourses(terms.files[key], catalog.sources));
   }
-  
-  const rawData = fs.readFileSync(courseFile, "utf-8");
-  const data = JSON.parse(rawData);
-
-  const transformed = [];
-  for (const dept in data) {
-    for (const courseNum in data[dept]) {
-      for (const section of data[dept][courseNum]) {
-        transformed.push({
-          dept,
-          code: courseNum,
-          sectionType: section.sectionType,
-          days: Array.isArray(section.days) ? section.days : parseDays(section.days),
-          times: typeof section.times === "object" ? section.times : parseTimes(section.times),
-          buildingName: section.buildingName,
-          roomNumber: section.roomNumber,
-          professor: section.professor,
-          seatsRemaining: section.seatsRemaining?.toString().trim() === "" ? null : Number(section.seatsRemaining),
-          spaces: section.spaces?.toString().trim() === "" ? null : Number(section.spaces),
-          // Add professor rating data if available
-          professor_rating: section.professor_rating || null,
-        });
-      }
-    }
-  }
-  return transformed;
+  return coursesByTerm.get(key);
 }
-const allCourses = loadCourses(); 
+
+// Workers started by cluster.js get the catalog from the primary's snapshot
+useCatalog(process.env.CATALOG_SNAPSHOT ? readSnapshot(process.env.CATALOG_SNAPSHOT) : loadCatalog());
 
 // Root endpoint
 app.get("/", (req, res) => {
   res.json({ 
     message: "UCSD AI Scheduler Backend API",
     endpoints: [
-      "/api/courses",
+      "/api/courses?term=",
+      "/api/sections?days=&start=&end=",
+      "/api/terms",
       "/api/majors", 
       "/api/prereqs/:course",
-      "/api/colleges"
+      "/api/search?q=",
+      "/api/colleges",
+      "/api/plan",
+      "/api/program-progress",
+      "/api/catalog"
     ]
   });
 });
 
-// Endpoint for all on-demand course data
-app.get("/api/courses", (req, res) => {
-  res.json(allCourses);
-});
+// Response bodies for /api/courses, keyed by the term's section array
+const coursesJson = new WeakMap();
 
-// Alias for major-reqs endpoint
-app.get("/api/majors", (req, res) => {
-  res.json(allMajorReqs);
+// Endpoint for all on-demand course data (?term=WI26 for a non-default term)
+app.get("/api/courses", (req, res) => {
+  const courses = req.query.term ? getTermCourses(req.query.term) : allCourses;
+  if (!courses) {
+    return res.status(404).json({ error: `Term ${req.query.term} not found` });
+  }
+  // Serializing every section is the slowest part of this route; do it once per term
+  if (!coursesJson.has(courses)) {
+    coursesJson.set(courses, JSON.stringify(courses));
+  }
+  res.type("json").send(coursesJson.get(courses));
 });
 
-// Utility to load all majors at startup into memory
-const majorReqsDir = path.join(process.cwd(), "public/majorreq");
-function loadAllMajorReqs() {
-  const majors = {};
-  const files = fs.readdirSync(majorReqsDir);
-  files.forEach(file => {
-    if (file.endsWith(".json")) {
-      const code = path.basename(file, ".json").toUpperCase(); // e.g. cs25.json -> CS25
-      const data = JSON.parse(fs.readFileSync(path.join(majorReqsDir, file), "utf-8"));
-      majors[code] = data;
+// Interval index per term's section array, built on first query
+const sectionIndexes = new WeakMap();
+const CLOCK_PATTERN = /^\d{1,2}(:\d{2})?$/;
+
+// Endpoint for sections fitting a time window, e.g.
+// /api/sections?days=MWF&start=10:00&end=14:00&open=true&minRating=3.5&courses=CSE 100,CSE 101
+app.get("/api/sections", (req, res) => {
+  const { term, days, start, end, courses, open, minRating, types } = req.query;
+  const sections = term ? getTermCourses(term) : allCourses;
+  if (!sections) {
+    return res.status(404).json({ error: `Term ${term} not found` });
+  }
+  for (const [name, value] of [["start", start], ["end", end]]) {
+    if (value !== undefined && !CLOCK_PATTERN.test(value)) {
+      return res.status(400).json({ error: `${name} must look like 14:00` });
     }
-  });
-  return majors;
-}
-const allMajorReqs = loadAllMajorReqs();
+  }
+  const dayList = days !== undefined ? parseDayCodes(String(days)) : null;
+  if (days !== undefined && !dayList) {
+    return res.status(400).json({ error: `days must be day codes like MWF or TuTh (${DAY_CODES.join(" ")})` });
+  }
 
-// Create a version for dropdown (excluding honors variants)
-const majorReqs = {};
-Object.keys(allMajorReqs).forEach(code => {
-  if (!code.endsWith("H")) {
-    majorReqs[code] = allMajorReqs[code];
+  if (!sectionIndexes.has(sections)) {
+    sectionIndexes.set(sections, new SectionIndex(sections));
   }
+  const split = value => (value ? value.split(",").map(v => v.trim()).filter(Boolean) : null);
+  const results = sectionIndexes.get(sections).query({
+    days: dayList,
+    start: start ? toMinutes(start) : null,
+    end: end ? toMinutes(end) : null,
+    courses: split(courses),
+    openOnly: open === "true",
+    minRating: minRating ? Number(minRating) : null,
+    sectionTypes: split(types),
+  });
+  const limit = Math.min(Number(req.query.limit) || 500, 5000);
+  res.json({ total: results.length, sections: results.slice(0, limit) });
 });
 
+// Endpoint for the terms that have course data
+app.get("/api/terms", (req, res) => {
+  res.json({
+    current: terms.current,
+    terms: Object.keys(terms.files).sort((a, b) => termSortKey(a) - termSortKey(b)),
+    loaded: [...coursesByTerm.keys()]
+  });
+});
+
+// Alias for major-reqs endpoint
+app.get("/api/majors", (req, res) => {
+  res.json(allMajorReqs);
+});
 
 // Endpoint for all major requirements
 app.get("/api/major-reqs", (req, res) => {
@@ -161,25 +179,6 @@ app.get("/api/major-reqs/:major", (req, res) => {
   }
 });
 
-
-// Utility to load all prereqs at startup into memory
-const PREQ_DIR = path.join(process.cwd(), "public/prereqdata");
-function loadAllPrereqsSync() {
-  const files = fs.readdirSync(PREQ_DIR);
-  const allPrereqs = {};
-
-  files.forEach(file => {
-    if (file.endsWith(".json")) {
-      const raw = fs.readFileSync(path.join(PREQ_DIR, file), "utf-8");
-      const data = JSON.parse(raw);
-      allPrereqs[data.code] = data;
-    }
-  });
-
-  return allPrereqs;
-}
-const allPrereqs = loadAllPrereqsSync();
-
 // Endpoint for all course prereqs
 app.get("/api/prereqs", (req, res) => {
   res.json(allPrereqs);
@@ -198,23 +197,26 @@ app.get("/api/prereqs/:course", (req, res) => {
   }
 });
 
-// Load all college requirements at startup
-const collegesDir = path.join(process.cwd(), "public", "collegedata");
-function loadColleges() {
-  const colleges = {};
-  const files = fs.readdirSync(collegesDir);
-
-  files.forEach(file => {
-    if (file.endsWith(".json")) {
-      const data = JSON.parse(fs.readFileSync(path.join(collegesDir, file), "utf8"));
-      // Use `data.code` or `data.college` as the key, whichever you prefer
-      colleges[data.college] = data;
-    }
-  });
+// Endpoint ranking every program by courses remaining for a completed list
+app.post("/api/program-progress", (req, res) => {
+  const { completed, includeUntouched = false } = req.body;
+  if (!Array.isArray(completed)) {
+    return res.status(400).json({ error: "completed must be a list of course codes" });
+  }
+  const limit = Math.min(Number(req.body.limit) || 20, 500);
+  res.json({ programs: programIndex.evaluate(completed, { limit, includeUntouched }) });
+});
 
-  return colleges;
-}
-const colleges = loadColleges();
+// Endpoint for full-text course search over the index built by pipeline/course_search.py,
+// e.g. /api/search?q=machine+learn*&dept=CSE&level=upper
+app.get("/api/search", (req, res) => {
+  if (!searchIndex) {
+    return res.status(503).json({ error: "Search index not built; run pipeline/course_search.py build" });
+  }
+  const { q = "", dept, units, level } = req.query;
+  const limit = Math.min(Number(req.query.limit) || 10, 100);
+  res.json({ results: searchIndex.search(q, { limit, dept, units, level }) });
+});
 
 // Endpoint for all college requirements
 app.get("/api/colleges", (req, res) => {
@@ -239,7 +241,12 @@ app.get("/api/colleges/:college", (req, res) => {
 
 //Endpoint for suggest
 app.post("/api/suggest", (req, res) => {
-  const { major, college, completed, honorsSequence } = req.body;
+  const { major, college, completed, honorsSequence, term } = req.body;
+  const termCourses = term ? getTermCourses(term) : allCourses;
+
+  if (!termCourses) {
+    return res.status(400).json({ error: `Invalid term ${term}` });
+  }
 
   if (!college || !colleges[college]) {
     return res.status(400).json({ error: "Invalid or missing college" })
@@ -460,7 +467,7 @@ app.post("/api/suggest", (req, res) => {
     }
   }
 
-  const sections = allCourses.filter(sec => {
+  const sections = termCourses.filter(sec => {
     const code = `${sec.dept} ${sec.code}`;
   
     // Check if this section matches any unmet course
@@ -567,10 +574,45 @@ app.post("/api/suggest", (req, res) => {
   res.json({ urgent: filteredUrgent, future: processedFuture, sections });
 });
 
+// Endpoint for a full quarter-by-quarter plan through graduation
+app.post("/api/plan", (req, res) => {
+  const { major, college, completed = [], honorsSequence, unitCap = DEFAULT_UNIT_CAP, startTerm } = req.body;
+
+  if (!college || !colleges[college]) {
+    return res.status(400).json({ error: "Invalid or missing college" })
+  }
+
+  if (!major || !majorReqs[major]) {
+    return res.status(400).json({ error: "Invalid or missing major" });
+  }
+
+  const selectedMajor = (major === "CS26" && honorsSequence) ? "CS26H" : major;
+  if (!allMajorReqs[selectedMajor]) {
+    return res.status(400).json({ error: "Invalid major configuration" });
+  }
+
+  if (!Number.isFinite(unitCap) || unitCap < 4) {
+    return res.status(400).json({ error: "unitCap must be a number of at least 4" });
+  }
+
+  const reqs = [
+    ...allMajorReqs[selectedMajor].requirements.lower_division.courses,
+    ...colleges[college].requirements.courses,
+    ...allMajorReqs[selectedMajor].requirements.upper_division.courses
+  ];
+
+  // Same honors handling as /api/suggest
+  const excluded = honorsSequence ? [] : ["MATH 31AH", "MATH 31BH", "MATH 31CH"];
+  const planner = new DegreePlanner(allPrereqs, { unitCap });
+  res.json(planner.plan(reqs, { completed, excluded, startTerm: startTerm || null }));
+});
+
 
 // AI part
 
-const genAI = new GoogleGenerativeAI(process.env.GEMINI_API_KEY);
+// Swappable for a local stub (LLM_PROVIDER=stub) when benchmarking offline
+const llm = createLLMClient();
+const aiFilterCache = new ResponseCache();
 
 app.post('/api/preferences', async (req, res) => {
   const { preferencesText } = req.body;
@@ -587,15 +629,8 @@ Respond ONLY with the JSON.
 `;
 
   try {
-    const model = genAI.getGenerativeModel({ model: 'gemini-2.0-flash-lite' });
-    const result = await model.generateContent(prompt);
-    const text = result.response.text();
-
-    const jsonStart = text.indexOf('{');
-    const jsonEnd = text.lastIndexOf('}') + 1;
-    const jsonText = text.slice(jsonStart, jsonEnd);
-
-    const parsed = JSON.parse(jsonText);
+    const text = await llm.generate(prompt);
+    const parsed = extractJson(text);
     res.json(parsed);
   } catch (error) {
     res.status(500).json({ error: 'Failed to parse preferences with Gemini.' });
@@ -605,42 +640,17 @@ Respond ONLY with the JSON.
 app.post('/api/ai-filter-courses', async (req, res) => {
   const { userQuery, courses, completedCourses, major } = req.body;
 
-  // Prepare course data for the AI
-  const courseData = courses.map(course => {
-    // Handle both section data (dept + code) and requirement data (course/courses)
-    let courseCode = 'Unknown';
-    if (course.dept && course.code) {
-      courseCode = `${course.dept} ${course.code}`;
-    } else if (course.course) {
-      courseCode = course.course;
-    } else if (course.courses && course.courses[0]) {
-      courseCode = course.courses[0];
-    }
-    
-    const courseInfo = {
-      code: courseCode,
-      title: course.title || 'Unknown',
-      units: course.units || 'Unknown',
-      description: course.description || 'No description available',
-      type: course.type || 'string',
-      courses: course.courses || [courseCode],
-      professor: course.professor || 'TBA',
-      sectionType: course.sectionType || 'Unknown'
-    };
-    
-    // Add professor rating information if available
-    if (course.professor_rating) {
-      courseInfo.professor_rating = {
-        rating: course.professor_rating.rating,
-        difficulty: course.professor_rating.difficulty,
-        num_ratings: course.professor_rating.num_ratings,
-        would_take_again: course.professor_rating.would_take_again,
-        department: course.professor_rating.department
-      };
-    }
-    
-    return courseInfo;
-  });
+  // Prepare course data for the AI, then keep only the best local matches
+  const courseData = courses.map(course => describeCourse(course, allPrereqs));
+  const candidates = prefilterCourses(courseData, userQuery, candidateLimit());
+
+  const key = cacheKey({ userQuery, major, completedCourses, candidates });
+  const cached = aiFilterCache.get(key);
+  // Lets load tests (benchmarks/load_api.py) report cached and model-backed answers apart
+  res.set('X-Cache', cached ? 'hit' : 'miss');
+  if (cached) {
+    return res.json(cached);
+  }
 
   const prompt = `
 You are an academic advisor helping a ${major} major student select courses.
@@ -648,7 +658,9 @@ You are an academic advisor helping a ${major} major student select courses.
 STUDENT CONTEXT:
 - Major: ${major}
 - Completed courses: ${completedCourses.join(', ') || 'None yet'}
-- Available courses: ${JSON.stringify(courseData, null, 2)}
+- Available courses (pre-ranked by relevance, one per line as
+  code | title | units | type | professor | rating/difficulty/num_ratings/would_take_again | description):
+${encodeCandidates(candidates)}
 
 USER REQUEST: "${userQuery}"
 
@@ -661,7 +673,7 @@ TASK: Filter and rank the available courses based on the user's request. Conside
 6. Professor ratings and quality (if available) - ratings are 1-5 scale, higher is better
 7. Professor difficulty ratings and "would take again" percentages
 
-IMPORTANT: When users ask for "good professor ratings" or "highly rated professors", prioritize courses with professor_rating.rating >= 4.0. When they ask for "easy courses", consider both course difficulty and professor difficulty ratings.
+IMPORTANT: When users ask for "good professor ratings" or "highly rated professors", prioritize courses whose rating (the first number of the rating/difficulty/num_ratings/would_take_again column) is >= 4.0; "-" means no rating. When they ask for "easy courses", consider both course difficulty and the professor difficulty (the second number of that column).
 
 RESPONSE FORMAT (JSON only):
 {
@@ -688,21 +700,64 @@ RESPONSE FORMAT (JSON only):
 Respond ONLY with valid JSON.`;
 
   try {
-    const model = genAI.getGenerativeModel({ model: 'gemini-2.0-flash-lite' });
-    const result = await model.generateContent(prompt);
-    const text = result.response.text();
-
-    // Extract JSON from response
-    const jsonStart = text.indexOf('{');
-    const jsonEnd = text.lastIndexOf('}') + 1;
-    const jsonText = text.slice(jsonStart, jsonEnd);
-
-    const parsed = JSON.parse(jsonText);
+    const text = await llm.generate(prompt);
+    const parsed = extractJson(text);
+    aiFilterCache.set(key, parsed);
     res.json(parsed);
   } catch (error) {
     res.status(500).json({ error: 'Failed to filter courses with AI.' });
   }
 });
 
+// Hot reload: a change under public/ (a new scrape, seat refresh or rebuilt index)
+// triggers reloadCatalog(), which re-parses only the changed files off the request
+// path, then the result is swapped in with useCatalog(). CATALOG_WATCH=0 disables
+// watching; SIGHUP, or POST /api/catalog/reload with the CATALOG_RELOAD_TOKEN
+// bearer token, reloads on demand. Workers started by cluster.js hand reloads to
+// the primary, which updates every worker.
+function applyCatalog(next) {
+  useCatalog(next);
+  // AI responses may describe sections or prereqs that just changed
+  aiFilterCache.clear();
+}
+
+const reloader = process.env.CATALOG_SNAPSHOT && process.send
+  ? new ClusterCatalogClient(process.env.CATALOG_SNAPSHOT, applyCatalog)
+  : new CatalogReloader(catalog, (result, next) => next && applyCatalog(next));
+if (reloader instanceof CatalogReloader && process.env.CATALOG_WATCH !== "0") reloader.watch();
+process.on("SIGHUP", () => reloader.reload("SIGHUP"));
+
+// Endpoint for catalog status and the last reload
+app.get("/api/catalog", (req, res) => {
+  res.json({
+    loadedAt: catalog.loadedAt,
+    currentTerm: terms.current,
+    loadedTerms: [...coursesByTerm.keys()],
+    files: catalog.sources.size,
+    reloading: Boolean(reloader.reloading),
+    lastReload: reloader.last
+  });
+});
+
+// A reload re-stats every catalog file (in every worker under cluster.js), so the
+// endpoint is off unless CATALOG_RELOAD_TOKEN is set and the caller sends it
+function reloadAuthorized(req) {
+  const given = Buffer.from(req.headers.authorization || "");
+  const expected = Buffer.from(`Bearer ${process.env.CATALOG_RELOAD_TOKEN}`);
+  return given.length === expected.length && timingSafeEqual(given, expected);
+}
+
+// Endpoint to reload changed catalog files now
+app.post("/api/catalog/reload", async (req, res) => {
+  if (!process.env.CATALOG_RELOAD_TOKEN) {
+    return res.status(404).json({ error: "Set CATALOG_RELOAD_TOKEN to enable catalog reloads over HTTP" });
+  }
+  if (!reloadAuthorized(req)) {
+    return res.status(401).json({ error: "Catalog reload needs Authorization: Bearer <CATALOG_RELOAD_TOKEN>" });
+  }
+  const result = await reloader.reload("api");
+  res.status(result?.error ? 500 : 200).json(result);
+});
+
 app.listen(PORT, () => {
 });